@@ -1,5 +1,7 @@
+import asyncio
 import secrets
 from datetime import datetime
+from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from fastapi.security import APIKeyHeader
@@ -15,14 +17,22 @@ from app.models.compliance import (
     AppSetting,
     ChecklistItem,
     ComplianceScore,
+    ComplianceScoreDaily,
     Organization,
+    OrgSummary,
     PolicyAudit,
+    PolicyAuditItem,
     RegulatoryAlert,
+    ScraperJob,
     ScraperRun,
+    UsageDaily,
     UsageEvent,
 )
 from app.services.checklist import reset_checklist
+from app.services.scraper import reset_org_sources
 from app.services.settings import get_embedding_threshold, get_industry_setting, set_setting
+from app.services.report_pdf import sweep_report_cache
+from app.services.storage import ORPHAN_GRACE_SECONDS, collect_orphaned_policy_files
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -56,6 +66,10 @@ class ChecklistResetResponse(BaseModel):
     items: int
 
 
+class StorageGcResponse(BaseModel):
+    files_removed: int
+
+
 class OrgResetResponse(BaseModel):
     audits: int
     alerts: int
@@ -111,6 +125,23 @@ async def create_org(
     )
 
 
+@router.post(
+    "/storage/gc",
+    response_model=StorageGcResponse,
+    dependencies=[Depends(require_admin_token)],
+)
+async def collect_storage_garbage(
+    session: AsyncSession = Depends(get_session),
+) -> StorageGcResponse:
+    removed = await collect_orphaned_policy_files(
+        session, Path(settings.policy_audit_storage_path)
+    )
+    removed += await asyncio.to_thread(
+        sweep_report_cache, Path(settings.report_cache_path), ORPHAN_GRACE_SECONDS
+    )
+    return StorageGcResponse(files_removed=removed)
+
+
 @router.post("/orgs/rotate-key", response_model=OrgApiKey)
 async def rotate_org_key(
     session: AsyncSession = Depends(get_session),
@@ -175,14 +206,23 @@ async def reset_org_data(
     session: AsyncSession = Depends(get_session),
     org: Organization = Depends(get_current_org),
 ) -> OrgResetResponse:
+    await session.execute(delete(PolicyAuditItem).where(PolicyAuditItem.org_id == org.id))
     audits = await session.execute(delete(PolicyAudit).where(PolicyAudit.org_id == org.id))
     alerts = await session.execute(delete(RegulatoryAlert).where(RegulatoryAlert.org_id == org.id))
     scores = await session.execute(delete(ComplianceScore).where(ComplianceScore.org_id == org.id))
+    await session.execute(
+        delete(ComplianceScoreDaily).where(ComplianceScoreDaily.org_id == org.id)
+    )
     usage_events = await session.execute(delete(UsageEvent).where(UsageEvent.org_id == org.id))
+    await session.execute(delete(UsageDaily).where(UsageDaily.org_id == org.id))
+    await session.execute(delete(ScraperJob).where(ScraperJob.org_id == org.id))
+    # Before the org's settings go: they name the feeds it subscribes to.
+    await reset_org_sources(session, org.id)
     scraper_runs = await session.execute(delete(ScraperRun).where(ScraperRun.org_id == org.id))
     audit_logs = await session.execute(delete(AuditLog).where(AuditLog.org_id == org.id))
     settings = await session.execute(delete(AppSetting).where(AppSetting.org_id == org.id))
     checklists = await session.execute(delete(ChecklistItem).where(ChecklistItem.org_id == org.id))
+    await session.execute(delete(OrgSummary).where(OrgSummary.org_id == org.id))
     await session.commit()
 
     seeded = await reset_checklist(session, org.id)
@@ -1,28 +1,36 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import get_current_org
-from app.db import get_session
+from app.db import get_read_session
 from app.models.audit import AuditLog
 from app.models.compliance import Organization
-from app.schemas.audit import AuditLogRead
+from app.schemas.audit import AuditLogPage, AuditLogRead
+from app.services.pagination import MAX_PAGE_SIZE, keyset_page
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
 
-@router.get("/recent", response_model=list[AuditLogRead])
+@router.get("/recent", response_model=AuditLogPage)
 async def recent_audit_logs(
-    session: AsyncSession = Depends(get_session),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_read_session),
     org: Organization = Depends(get_current_org),
-) -> list[AuditLogRead]:
-    result = await session.execute(
-        select(AuditLog)
-        .where(AuditLog.org_id == org.id)
-        .order_by(AuditLog.created_at.desc())
-        .limit(50)
-    )
-    return [
+) -> AuditLogPage:
+    try:
+        rows, next_cursor = await keyset_page(
+            session,
+            select(AuditLog).where(AuditLog.org_id == org.id),
+            AuditLog.created_at,
+            AuditLog.id,
+            cursor,
+            limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    items = [
         AuditLogRead(
             id=item.id,
             action=item.action,
@@ -33,5 +41,6 @@ async def recent_audit_logs(
             metadata=item.meta,
             created_at=item.created_at,
         )
-        for item in result.scalars().all()
+        for item in rows
     ]
+    return AuditLogPage(items=items, next_cursor=next_cursor)
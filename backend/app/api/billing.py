@@ -1,26 +1,26 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy import func, select
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import get_current_org
-from app.db import get_session
-from app.models.compliance import Organization, UsageEvent
+from app.db import get_read_session
+from app.models.compliance import Organization
 from app.schemas.billing import UsageSummary
+from app.services.usage import usage_totals
 
 router = APIRouter(prefix="/billing", tags=["billing"])
 
 
 @router.get("/usage", response_model=UsageSummary)
 async def usage_summary(
-    session: AsyncSession = Depends(get_session),
+    start: date | None = None,
+    end: date | None = None,
+    session: AsyncSession = Depends(get_read_session),
     org: Organization = Depends(get_current_org),
 ) -> UsageSummary:
-    result = await session.execute(
-        select(func.coalesce(func.sum(UsageEvent.total_cost), 0.0), func.count(UsageEvent.id))
-        .where(
-            UsageEvent.event_type.in_(["policy_audit", "compliance_scan"]),
-            UsageEvent.org_id == org.id,
-        )
-    )
-    total_cost, total_scans = result.one()
-    return UsageSummary(total_cost=float(total_cost), total_scans=int(total_scans))
+    try:
+        total_cost, total_scans = await usage_totals(session, org.id, start, end)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return UsageSummary(total_cost=total_cost, total_scans=total_scans, start=start, end=end)
@@ -1,48 +1,83 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime, timedelta, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import get_current_org
-from app.db import get_session
-from app.models.compliance import ComplianceScore, Organization, RegulatoryAlert
-from app.schemas.compliance import ComplianceDashboard, ComplianceScore as ScoreSchema, RegulatoryAlert as AlertSchema
+from app.db import get_read_session
+from app.models.compliance import Organization, RegulatoryAlert
+from app.schemas.compliance import (
+    ComplianceDashboard,
+    ComplianceScore as ScoreSchema,
+    RegulatoryAlert as AlertSchema,
+    RegulatoryAlertPage,
+    ScoreHistory,
+)
+from app.services.org_summary import get_org_summary
+from app.services.pagination import MAX_PAGE_SIZE, keyset_page
+from app.services.score_history import score_history
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
+def _to_alert(alert: RegulatoryAlert) -> AlertSchema:
+    return AlertSchema(
+        id=str(alert.id),
+        title=alert.title,
+        summary=alert.summary,
+        severity=alert.severity,
+        source_url=alert.source_url,
+        published_at=alert.published_at,
+    )
+
+
 @router.get("", response_model=ComplianceDashboard)
 async def get_dashboard(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     org: Organization = Depends(get_current_org),
 ) -> ComplianceDashboard:
-    score_result = await session.execute(
-        select(ComplianceScore)
-        .where(ComplianceScore.org_id == org.id)
-        .order_by(ComplianceScore.created_at.desc())
-        .limit(1)
-    )
-    score_row = score_result.scalar_one_or_none()
-    if score_row:
-        score = ScoreSchema(score=score_row.score, rating=score_row.rating)
-    else:
-        score = ScoreSchema(score=78, rating="Needs attention")
-
-    alerts_result = await session.execute(
-        select(RegulatoryAlert)
-        .where(RegulatoryAlert.org_id == org.id)
-        .order_by(RegulatoryAlert.created_at.desc())
-        .limit(10)
-    )
+    summary = await get_org_summary(session, org.id)
+    score = None
+    if summary and summary.latest_score is not None:
+        score = ScoreSchema(score=summary.latest_score, rating=summary.latest_rating)
     alerts = [
-        AlertSchema(
-            id=str(alert.id),
-            title=alert.title,
-            summary=alert.summary,
-            severity=alert.severity,
-            source_url=alert.source_url,
-            published_at=alert.published_at,
-        )
-        for alert in alerts_result.scalars().all()
+        AlertSchema(**{**alert, "id": str(alert["id"])})
+        for alert in (summary.recent_alerts if summary else [])
     ]
-
     return ComplianceDashboard(score=score, active_alerts=alerts)
+
+
+@router.get("/history", response_model=ScoreHistory)
+async def get_score_history(
+    bucket: str = Query("day"),
+    days: int = Query(90, ge=1, le=3650),
+    session: AsyncSession = Depends(get_read_session),
+    org: Organization = Depends(get_current_org),
+) -> ScoreHistory:
+    since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+    try:
+        return await score_history(session, org.id, bucket, since)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get("/alerts", response_model=RegulatoryAlertPage)
+async def list_alerts(
+    limit: int = Query(25, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_read_session),
+    org: Organization = Depends(get_current_org),
+) -> RegulatoryAlertPage:
+    try:
+        rows, next_cursor = await keyset_page(
+            session,
+            select(RegulatoryAlert).where(RegulatoryAlert.org_id == org.id),
+            RegulatoryAlert.created_at,
+            RegulatoryAlert.id,
+            cursor,
+            limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return RegulatoryAlertPage(items=[_to_alert(alert) for alert in rows], next_cursor=next_cursor)
@@ -5,6 +5,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.auth import get_current_org
 from app.db import get_session
 from app.models.compliance import Organization
+from app.core.config import settings
+from app.services.classification_cache import classification_lru
+from app.services.classifier import openai_classifier
 from app.services.embeddings import EmbeddingProvider
 from app.services.settings import get_embedding_threshold
 
@@ -17,6 +20,13 @@ class EmbeddingDebug(BaseModel):
     threshold: float
 
 
+class ClassifierDebug(BaseModel):
+    provider: str
+    model: str
+    breaker_state: str
+    cache: dict[str, float]
+
+
 @router.get("/embeddings", response_model=EmbeddingDebug)
 async def embeddings_debug(
     session: AsyncSession = Depends(get_session),
@@ -26,3 +36,15 @@ async def embeddings_debug(
     threshold = await get_embedding_threshold(session, org.id)
     info = provider.info()
     return EmbeddingDebug(provider=info["provider"], model=info["model"], threshold=threshold)
+
+
+@router.get(
+    "/classifier", response_model=ClassifierDebug, dependencies=[Depends(get_current_org)]
+)
+async def classifier_debug() -> ClassifierDebug:
+    return ClassifierDebug(
+        provider=settings.classifier_provider,
+        model=settings.classifier_model,
+        breaker_state=openai_classifier.breaker.state,
+        cache=classification_lru.stats(),
+    )
@@ -1,23 +1,42 @@
-from io import BytesIO
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import FileResponse, JSONResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-
 from app.core.config import settings
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.schemas.audit import AuditLogCreate
 from app.auth import get_current_org
 from app.models.compliance import Organization, PolicyAudit
-from app.schemas.policy_audit import PolicyAuditRecord, PolicyAuditRunResponse, PolicyGap
+from app.schemas.policy_audit import (
+    GapAnalytics,
+    PolicyAuditPage,
+    PolicyAuditRecord,
+    PolicyAuditRunResponse,
+    PolicyAuditText,
+    PolicyGap,
+)
 from app.services.audit import log_audit_event
+from app.services.extraction import load_audit_extraction
+from app.services.gap_analytics import gap_analytics
+from app.services.pagination import MAX_PAGE_SIZE, keyset_page
 from app.services.policy_audit import run_policy_audit
+from app.services.report_pdf import (
+    audit_pdf_path,
+    audit_report_etag,
+    etag_matches,
+    render_audit_pdf,
+    render_off_loop,
+    write_cached_report,
+)
 
 router = APIRouter(prefix="/policy", tags=["policy-audit"])
+logger = logging.getLogger("safescale.reports")
 
 def _to_record(record: PolicyAudit) -> PolicyAuditRecord:
     gaps = [PolicyGap(**gap) for gap in record.gaps]
@@ -64,7 +83,7 @@ async def audit_policy(
 
 @router.get("/audits/latest", response_model=PolicyAuditRecord | None)
 async def latest_audit(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     org: Organization = Depends(get_current_org),
 ) -> PolicyAuditRecord | None:
     result = await session.execute(
@@ -79,33 +98,89 @@ async def latest_audit(
     return _to_record(record)
 
 
-@router.get("/audits", response_model=list[PolicyAuditRecord])
+@router.get("/audits", response_model=PolicyAuditPage)
 async def list_audits(
-    limit: int = 25,
-    session: AsyncSession = Depends(get_session),
+    limit: int = Query(25, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_read_session),
+    org: Organization = Depends(get_current_org),
+) -> PolicyAuditPage:
+    try:
+        rows, next_cursor = await keyset_page(
+            session,
+            select(PolicyAudit).where(PolicyAudit.org_id == org.id),
+            PolicyAudit.created_at,
+            PolicyAudit.id,
+            cursor,
+            limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return PolicyAuditPage(items=[_to_record(item) for item in rows], next_cursor=next_cursor)
+
+
+@router.get("/analytics/gaps", response_model=GapAnalytics)
+async def read_gap_analytics(
+    days: int = Query(90, ge=1, le=3650),
+    bucket: str = Query("week"),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_read_session),
     org: Organization = Depends(get_current_org),
-) -> list[PolicyAuditRecord]:
+) -> GapAnalytics:
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    try:
+        return await gap_analytics(session, org.id, since, bucket, limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+async def _owned_audit_file(session: AsyncSession, audit_id: int, org_id: int) -> str:
     result = await session.execute(
-        select(PolicyAudit)
-        .where(PolicyAudit.org_id == org.id)
-        .order_by(PolicyAudit.created_at.desc())
-        .limit(limit)
+        select(PolicyAudit.file_path).where(PolicyAudit.id == audit_id, PolicyAudit.org_id == org_id)
     )
-    return [_to_record(item) for item in result.scalars().all()]
+    file_path = result.scalar_one_or_none()
+    if file_path is None:
+        raise HTTPException(status_code=404, detail="Audit not found")
+    return file_path
+
+
+async def _load_audit(session: AsyncSession, audit_id: int) -> PolicyAudit:
+    result = await session.execute(select(PolicyAudit).where(PolicyAudit.id == audit_id))
+    record = result.scalar_one_or_none()
+    if not record:
+        raise HTTPException(status_code=404, detail="Audit not found")
+    return record
+
+
+@router.get("/audits/{audit_id}/text", response_model=PolicyAuditText)
+async def get_audit_text(
+    audit_id: int,
+    session: AsyncSession = Depends(get_read_session),
+    org: Organization = Depends(get_current_org),
+):
+    # Served from the extraction artifact; the PDF is only parsed if it is missing.
+    try:
+        document = await load_audit_extraction(session, audit_id, org.id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if document is None:
+        raise HTTPException(status_code=404, detail="Audit text not found")
+    return PolicyAuditText(audit_id=audit_id, pages=document.pages, chunks=document.chunks)
 
 
 @router.get("/audits/{audit_id}/report")
 async def download_audit_report(
     audit_id: int,
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
     org: Organization = Depends(get_current_org),
 ):
-    result = await session.execute(
-        select(PolicyAudit).where(PolicyAudit.id == audit_id, PolicyAudit.org_id == org.id)
-    )
-    record = result.scalar_one_or_none()
-    if not record:
-        raise HTTPException(status_code=404, detail="Audit not found")
+    # Audits are immutable once written, so the id alone identifies the report.
+    await _owned_audit_file(session, audit_id, org.id)
+    etag = audit_report_etag(audit_id, "json")
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    record = await _load_audit(session, audit_id)
 
     payload = {
         "id": record.id,
@@ -121,7 +196,9 @@ async def download_audit_report(
         "created_at": record.created_at.isoformat(),
     }
     headers = {
-        "Content-Disposition": f'attachment; filename="policy-audit-{record.id}.json"'
+        "Content-Disposition": f'attachment; filename="policy-audit-{record.id}.json"',
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
     }
     return JSONResponse(content=payload, headers=headers)
 
@@ -129,65 +206,43 @@ async def download_audit_report(
 @router.get("/audits/{audit_id}/report.pdf")
 async def download_audit_report_pdf(
     audit_id: int,
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
     org: Organization = Depends(get_current_org),
 ):
-    result = await session.execute(
-        select(PolicyAudit).where(PolicyAudit.id == audit_id, PolicyAudit.org_id == org.id)
-    )
-    record = result.scalar_one_or_none()
-    if not record:
-        raise HTTPException(status_code=404, detail="Audit not found")
-
-    buffer = BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
-    y = height - 50
-    pdf.setFont("Helvetica-Bold", 14)
-    pdf.drawString(40, y, "Policy Audit Report")
-    y -= 22
-    pdf.setFont("Helvetica", 10)
-
-    def draw_line(text: str) -> None:
-        nonlocal y
-        if y < 60:
-            pdf.showPage()
-            y = height - 50
-            pdf.setFont("Helvetica", 10)
-        pdf.drawString(40, y, text[:120])
-        y -= 14
-
-    draw_line(f"Audit ID: {record.id}")
-    draw_line(f"Filename: {record.filename}")
-    draw_line(f"Created: {record.created_at.isoformat()}")
-    draw_line(f"Score: {record.score} ({record.rating})")
-    draw_line(
-        "Classification: "
-        f"{record.doc_type or 'general'} / {record.jurisdiction or 'general'}"
-    )
-    draw_line(f"Matched items: {len(record.matched_items or [])}")
-    draw_line(f"Gaps: {len(record.gaps or [])}")
-    draw_line("")
-
-    gaps = record.gaps or []
-    if gaps:
-        draw_line("Top gaps:")
-        for gap in gaps[:10]:
-            severity = (gap.get("severity") or "medium").upper()
-            item = gap.get("checklist_item", "Unknown requirement")
-            draw_line(f"- {severity}: {item}")
-        draw_line("")
-
-    matched_items = record.matched_items or []
-    if matched_items:
-        draw_line("Top matched items:")
-        for item in matched_items[:10]:
-            draw_line(f"- {item}")
-
-    pdf.save()
-    buffer.seek(0)
-    return StreamingResponse(
-        buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="policy-audit-{record.id}.pdf"'},
+    file_path = await _owned_audit_file(session, audit_id, org.id)
+    etag = audit_report_etag(audit_id, "pdf")
+    headers = {
+        "Content-Disposition": f'attachment; filename="policy-audit-{audit_id}.pdf"',
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cached = audit_pdf_path(Path(file_path), audit_id)
+    if cached.exists():
+        return FileResponse(cached, media_type="application/pdf", headers=headers)
+
+    record = await _load_audit(session, audit_id)
+    content = await render_off_loop(
+        render_audit_pdf,
+        {
+            "id": record.id,
+            "filename": record.filename,
+            "created_at": record.created_at.isoformat(),
+            "score": record.score,
+            "rating": record.rating,
+            "doc_type": record.doc_type,
+            "jurisdiction": record.jurisdiction,
+            "matched_items": record.matched_items,
+            "gaps": record.gaps,
+        },
     )
+    # Only cache next to a policy blob that still exists, so GC can reclaim both.
+    if cached.parent.is_dir():
+        try:
+            await asyncio.to_thread(write_cached_report, cached, content)
+        except OSError:
+            logger.warning("Could not cache report for audit %s", audit_id, exc_info=True)
+    return Response(content=content, media_type="application/pdf", headers=headers)
@@ -1,63 +1,135 @@
+import asyncio
 import csv
-from io import BytesIO, StringIO
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime
+from io import StringIO
 
-from fastapi import APIRouter, Depends, Response
-from fastapi.responses import StreamingResponse
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import get_current_org
-from app.db import get_session
+from app.db import ReadSessionLocal, get_read_session
 from app.models.compliance import Organization, PolicyAudit, RegulatoryAlert
-
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from app.services.bulk_export import (
+    EXPORT_BATCH_SIZE,
+    EXPORT_DATASETS,
+    ExportDataset,
+    parquet_available,
+    stream_ndjson,
+    stream_parquet,
+)
+from app.services.report_pdf import (
+    etag_matches,
+    org_report_etag,
+    org_report_path,
+    render_alerts_pdf,
+    render_audits_pdf,
+    render_off_loop,
+    write_cached_report,
+)
 
 router = APIRouter(prefix="/reports", tags=["reports"])
+logger = logging.getLogger("safescale.reports")
+
+AUDIT_CSV_HEADER = [
+    "id",
+    "filename",
+    "score",
+    "rating",
+    "doc_type",
+    "jurisdiction",
+    "matched_count",
+    "gap_count",
+    "created_at",
+]
+ALERT_CSV_HEADER = [
+    "id",
+    "title",
+    "severity",
+    "summary",
+    "source_url",
+    "published_at",
+    "created_at",
+]
+
+
+async def _org_report_pdf(
+    request: Request,
+    session: AsyncSession,
+    org: Organization,
+    kind: str,
+    model,
+    load_rows: Callable[[], Awaitable[list[tuple]]],
+    render: Callable[[list[tuple]], bytes],
+) -> Response:
+    # Org-wide reports change only when rows are added or removed, so the newest
+    # created_at plus the row count is a cheap watermark for the rendered file.
+    latest, count = (
+        await session.execute(
+            select(func.max(model.created_at), func.count()).where(model.org_id == org.id)
+        )
+    ).one()
+    etag = org_report_etag(kind, org.id, latest, count)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": f"attachment; filename={kind}.pdf",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    path = org_report_path(org.id, kind, etag)
+    if path.exists():
+        return FileResponse(path, media_type="application/pdf", headers=headers)
+    content = await render_off_loop(render, await load_rows())
+    try:
+        await asyncio.to_thread(write_cached_report, path, content)
+    except OSError:
+        logger.warning("Could not cache %s report for org %s", kind, org.id, exc_info=True)
+    return Response(content=content, media_type="application/pdf", headers=headers)
+
+
+async def _stream_csv(header: list[str], stmt) -> AsyncIterator[str]:
+    # The export owns its session: a streamed response outlives request dependencies.
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    yield buffer.getvalue()
+    async with ReadSessionLocal() as session:
+        result = await session.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            buffer.seek(0)
+            buffer.truncate()
+            for row in rows:
+                writer.writerow(
+                    [value.isoformat() if isinstance(value, datetime) else value for value in row]
+                )
+            yield buffer.getvalue()
 
 
 @router.get("/audits.csv")
 async def export_audits_csv(
-    session: AsyncSession = Depends(get_session),
     org: Organization = Depends(get_current_org),
 ) -> Response:
-    result = await session.execute(
-        select(PolicyAudit)
+    stmt = (
+        select(
+            PolicyAudit.id,
+            PolicyAudit.filename,
+            PolicyAudit.score,
+            PolicyAudit.rating,
+            PolicyAudit.doc_type,
+            PolicyAudit.jurisdiction,
+            func.coalesce(func.jsonb_array_length(PolicyAudit.matched_items), 0),
+            func.coalesce(func.jsonb_array_length(PolicyAudit.gaps), 0),
+            PolicyAudit.created_at,
+        )
         .where(PolicyAudit.org_id == org.id)
-        .order_by(PolicyAudit.created_at.desc())
+        .order_by(PolicyAudit.created_at.desc(), PolicyAudit.id.desc())
     )
-    audits = result.scalars().all()
-    buffer = StringIO()
-    writer = csv.writer(buffer)
-    writer.writerow(
-        [
-            "id",
-            "filename",
-            "score",
-            "rating",
-            "doc_type",
-            "jurisdiction",
-            "matched_count",
-            "gap_count",
-            "created_at",
-        ]
-    )
-    for audit in audits:
-        writer.writerow(
-            [
-                audit.id,
-                audit.filename,
-                audit.score,
-                audit.rating,
-                audit.doc_type,
-                audit.jurisdiction,
-                len(audit.matched_items),
-                len(audit.gaps),
-                audit.created_at.isoformat(),
-            ]
-        )
-    return Response(
-        content=buffer.getvalue(),
+    return StreamingResponse(
+        _stream_csv(AUDIT_CSV_HEADER, stmt),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=policy-audits.csv"},
     )
@@ -65,85 +137,57 @@ async def export_audits_csv(
 
 @router.get("/audits.pdf")
 async def export_audits_pdf(
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
     org: Organization = Depends(get_current_org),
 ) -> Response:
-    result = await session.execute(
-        select(PolicyAudit)
-        .where(PolicyAudit.org_id == org.id)
-        .order_by(PolicyAudit.created_at.desc())
-    )
-    audits = result.scalars().all()
-    buffer = BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
-    y = height - 50
-    pdf.setFont("Helvetica-Bold", 14)
-    pdf.drawString(40, y, "Policy Audits Report")
-    y -= 24
-    pdf.setFont("Helvetica", 10)
-    if not audits:
-        pdf.drawString(40, y, "No policy audits found.")
-        y -= 14
-    for audit in audits:
-        line = (
-            f"{audit.created_at.date().isoformat()} | {audit.filename} | "
-            f"Score {audit.score} ({audit.rating}) | "
-            f"Gaps {len(audit.gaps)}"
+    async def load_rows() -> list[tuple]:
+        result = await session.execute(
+            select(
+                PolicyAudit.created_at,
+                PolicyAudit.filename,
+                PolicyAudit.score,
+                PolicyAudit.rating,
+                func.coalesce(func.jsonb_array_length(PolicyAudit.gaps), 0),
+            )
+            .where(PolicyAudit.org_id == org.id)
+            .order_by(PolicyAudit.created_at.desc(), PolicyAudit.id.desc())
         )
-        if y < 60:
-            pdf.showPage()
-            y = height - 50
-            pdf.setFont("Helvetica", 10)
-        pdf.drawString(40, y, line[:120])
-        y -= 14
-    pdf.save()
-    buffer.seek(0)
-    return StreamingResponse(
-        buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": "attachment; filename=policy-audits.pdf"},
+        return [
+            (created_at.date().isoformat(), filename, score, rating, gap_count)
+            for created_at, filename, score, rating, gap_count in result.all()
+        ]
+
+    return await _org_report_pdf(
+        request,
+        session,
+        org,
+        kind="policy-audits",
+        model=PolicyAudit,
+        load_rows=load_rows,
+        render=render_audits_pdf,
     )
 
 
 @router.get("/alerts.csv")
 async def export_alerts_csv(
-    session: AsyncSession = Depends(get_session),
     org: Organization = Depends(get_current_org),
 ) -> Response:
-    result = await session.execute(
-        select(RegulatoryAlert)
+    stmt = (
+        select(
+            RegulatoryAlert.id,
+            RegulatoryAlert.title,
+            RegulatoryAlert.severity,
+            RegulatoryAlert.summary,
+            RegulatoryAlert.source_url,
+            RegulatoryAlert.published_at,
+            RegulatoryAlert.created_at,
+        )
         .where(RegulatoryAlert.org_id == org.id)
-        .order_by(RegulatoryAlert.created_at.desc())
+        .order_by(RegulatoryAlert.created_at.desc(), RegulatoryAlert.id.desc())
     )
-    alerts = result.scalars().all()
-    buffer = StringIO()
-    writer = csv.writer(buffer)
-    writer.writerow(
-        [
-            "id",
-            "title",
-            "severity",
-            "summary",
-            "source_url",
-            "published_at",
-            "created_at",
-        ]
-    )
-    for alert in alerts:
-        writer.writerow(
-            [
-                alert.id,
-                alert.title,
-                alert.severity,
-                alert.summary,
-                alert.source_url,
-                alert.published_at,
-                alert.created_at.isoformat(),
-            ]
-        )
-    return Response(
-        content=buffer.getvalue(),
+    return StreamingResponse(
+        _stream_csv(ALERT_CSV_HEADER, stmt),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=regulatory-alerts.csv"},
     )
@@ -151,40 +195,59 @@ async def export_alerts_csv(
 
 @router.get("/alerts.pdf")
 async def export_alerts_pdf(
-    session: AsyncSession = Depends(get_session),
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
     org: Organization = Depends(get_current_org),
 ) -> Response:
-    result = await session.execute(
-        select(RegulatoryAlert)
-        .where(RegulatoryAlert.org_id == org.id)
-        .order_by(RegulatoryAlert.created_at.desc())
-    )
-    alerts = result.scalars().all()
-    buffer = BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
-    y = height - 50
-    pdf.setFont("Helvetica-Bold", 14)
-    pdf.drawString(40, y, "Regulatory Alerts Report")
-    y -= 24
-    pdf.setFont("Helvetica", 10)
-    if not alerts:
-        pdf.drawString(40, y, "No regulatory alerts found.")
-        y -= 14
-    for alert in alerts:
-        line = (
-            f"{alert.published_at} | {alert.severity} | {alert.title}"
+    async def load_rows() -> list[tuple]:
+        result = await session.execute(
+            select(RegulatoryAlert.published_at, RegulatoryAlert.severity, RegulatoryAlert.title)
+            .where(RegulatoryAlert.org_id == org.id)
+            .order_by(RegulatoryAlert.created_at.desc(), RegulatoryAlert.id.desc())
         )
-        if y < 60:
-            pdf.showPage()
-            y = height - 50
-            pdf.setFont("Helvetica", 10)
-        pdf.drawString(40, y, line[:120])
-        y -= 14
-    pdf.save()
-    buffer.seek(0)
+        return [(str(published_at), severity, title) for published_at, severity, title in result.all()]
+
+    return await _org_report_pdf(
+        request,
+        session,
+        org,
+        kind="regulatory-alerts",
+        model=RegulatoryAlert,
+        load_rows=load_rows,
+        render=render_alerts_pdf,
+    )
+
+
+def _export_dataset(dataset: str) -> ExportDataset:
+    spec = EXPORT_DATASETS.get(dataset)
+    if spec is None:
+        raise HTTPException(status_code=404, detail="Unknown export dataset")
+    return spec
+
+
+@router.get("/export/{dataset}.ndjson")
+async def export_ndjson(
+    dataset: str,
+    org: Organization = Depends(get_current_org),
+) -> Response:
+    spec = _export_dataset(dataset)
+    return StreamingResponse(
+        stream_ndjson(ReadSessionLocal, spec, org.id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f"attachment; filename={spec.name}.ndjson"},
+    )
+
+
+@router.get("/export/{dataset}.parquet")
+async def export_parquet(
+    dataset: str,
+    org: Organization = Depends(get_current_org),
+) -> Response:
+    spec = _export_dataset(dataset)
+    if not parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
     return StreamingResponse(
-        buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": "attachment; filename=regulatory-alerts.pdf"},
+        stream_parquet(ReadSessionLocal, spec, org.id),
+        media_type="application/vnd.apache.parquet",
+        headers={"Content-Disposition": f"attachment; filename={spec.name}.parquet"},
     )
@@ -4,11 +4,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.auth import get_current_org
 from app.core.config import settings
 from app.db import get_session
-from app.models.compliance import ComplianceScore, Organization, UsageEvent
+from app.models.compliance import Organization
 from app.schemas.audit import AuditLogCreate
 from app.schemas.scan import ComplianceScanResponse
 from app.services.audit import log_audit_event
 from app.services.scan import run_compliance_scan
+from app.services.score_history import add_compliance_score
+from app.services.usage import add_usage_event
 
 router = APIRouter(prefix="/scan", tags=["scan"])
 
@@ -20,16 +22,9 @@ async def run_scan(
 ) -> ComplianceScanResponse:
     score, rating, notes = await run_compliance_scan(session, org.id)
 
-    session.add(ComplianceScore(score=score, rating=rating, org_id=org.id))
-    session.add(
-        UsageEvent(
-            event_type="compliance_scan",
-            units=1,
-            unit_cost=settings.scan_unit_cost,
-            total_cost=settings.scan_unit_cost,
-            meta={"notes": notes},
-            org_id=org.id,
-        )
+    await add_compliance_score(session, org.id, score, rating)
+    await add_usage_event(
+        session, org.id, "compliance_scan", settings.scan_unit_cost, {"notes": notes}
     )
     await session.commit()
 
@@ -1,53 +1,62 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import get_current_org
 from app.core.config import settings
 from app.db import get_session
-from app.models.compliance import Organization, ScraperRun
-from app.schemas.audit import AuditLogCreate
-from app.schemas.scraper import ScraperFeeds, ScraperRunRequest, ScraperRunResponse, ScraperStatus
-from app.services.audit import log_audit_event
-from app.services.scraper import next_run_at, record_scraper_run, scrape_feeds, scrape_urls
+from app.models.compliance import Organization, ScraperJob, ScraperRun
+from app.schemas.scraper import (
+    ScraperFeeds,
+    ScraperJobResponse,
+    ScraperRunRequest,
+    ScraperSourceStatus,
+    ScraperStatus,
+)
+from app.services.scraper import SCRAPER_INTERVAL_SECONDS, org_sources
+from app.services.scraper_jobs import enqueue_scraper_job, get_scraper_job
 from app.services.settings import get_scraper_feed_urls, set_scraper_feed_urls
 
 router = APIRouter(prefix="/scraper", tags=["scraper"])
 
 
-@router.post("/run", response_model=ScraperRunResponse)
+def _job_response(job: ScraperJob, run: ScraperRun | None = None) -> ScraperJobResponse:
+    return ScraperJobResponse(
+        id=job.id,
+        status=job.status,
+        requested_at=job.requested_at.isoformat(),
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        finished_at=job.finished_at.isoformat() if job.finished_at else None,
+        error=job.error,
+        scanned=run.scanned if run else 0,
+        alerts_created=run.alerts_created if run else 0,
+        notes=run.notes if run else [],
+    )
+
+
+@router.post("/run", response_model=ScraperJobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def run_scraper(
     payload: ScraperRunRequest,
     session: AsyncSession = Depends(get_session),
     org: Organization = Depends(get_current_org),
-) -> ScraperRunResponse:
-    urls = payload.urls or settings.scraper_urls
-    started_at = datetime.utcnow()
-    url_scanned, url_created, url_notes, discovered_feeds = await scrape_urls(
-        session, urls, org.id
-    )
-    feed_urls = await get_scraper_feed_urls(session, org.id)
-    combined_feeds = list(dict.fromkeys(feed_urls + discovered_feeds))
-    feed_scanned, feed_created, feed_notes = await scrape_feeds(
-        session, combined_feeds, org.id
-    )
-    scanned = url_scanned + feed_scanned
-    created = url_created + feed_created
-    notes = url_notes + feed_notes
-    await record_scraper_run(session, scanned, created, notes, started_at, org.id)
-    await log_audit_event(
-        session,
-        AuditLogCreate(
-            action="scraper_run",
-            actor="system",
-            summary=f"Scanned {scanned} URLs, created {created} alerts",
-            metadata={"urls": urls},
-        ),
-        org.id,
-    )
-    return ScraperRunResponse(scanned=scanned, alerts_created=created, notes=notes)
+) -> ScraperJobResponse:
+    job = await enqueue_scraper_job(session, org.id, payload.urls)
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=ScraperJobResponse)
+async def read_scraper_job(
+    job_id: int,
+    session: AsyncSession = Depends(get_session),
+    org: Organization = Depends(get_current_org),
+) -> ScraperJobResponse:
+    job = await get_scraper_job(session, org.id, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scraper job not found")
+    run = await session.get(ScraperRun, job.run_id) if job.run_id else None
+    return _job_response(job, run)
 
 
 @router.get("/status", response_model=ScraperStatus)
@@ -62,14 +71,33 @@ async def scraper_status(
         .limit(1)
     )
     record = result.scalar_one_or_none()
+    sources = [
+        ScraperSourceStatus(
+            url=source.url,
+            interval_seconds=source.interval_seconds or SCRAPER_INTERVAL_SECONDS,
+            next_run_at=source.next_run_at.isoformat() if source.next_run_at else None,
+            checked_at=source.checked_at.isoformat() if source.checked_at else None,
+            changed_at=source.changed_at.isoformat() if source.changed_at else None,
+            consecutive_errors=source.consecutive_errors or 0,
+            last_error=source.last_error,
+        )
+        for source in await org_sources(session, org.id)
+    ]
+    next_run = None
+    if settings.scraper_enabled and sources:
+        # Sources that were never fetched are due on the scheduler's next tick.
+        next_run = min(
+            source.next_run_at or datetime.now(timezone.utc).isoformat() for source in sources
+        )
     return ScraperStatus(
         enabled=settings.scraper_enabled,
         last_run_at=record.started_at.isoformat() if record else None,
-        next_run_at=next_run_at(record.finished_at) if record else None,
+        next_run_at=next_run,
         status=record.status if record else None,
         scanned=record.scanned if record else 0,
         alerts_created=record.alerts_created if record else 0,
         notes=record.notes if record else [],
+        sources=sources,
     )
 
 
@@ -88,6 +116,9 @@ async def update_scraper_feeds(
     session: AsyncSession = Depends(get_session),
     org: Organization = Depends(get_current_org),
 ) -> ScraperFeeds:
-    await set_scraper_feed_urls(session, org.id, payload.feeds)
+    try:
+        await set_scraper_feed_urls(session, org.id, payload.feeds)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     feeds = await get_scraper_feed_urls(session, org.id)
     return ScraperFeeds(feeds=feeds)
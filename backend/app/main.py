@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -20,14 +19,16 @@ from app.api.policy_audit import router as policy_audit_router
 from app.api.scan import router as scan_router
 from app.api.scraper import router as scraper_router
 from app.core.config import settings
-from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.db import AsyncSessionLocal
-from app.models.compliance import Organization
 from app.mcp import mcp_server
 from app.mcp.connectors.email_mbox import EmailMboxConnector
 from app.mcp.connectors.local_files import LocalFilesConnector
-from app.services.scraper import scraper_loop
+from app.services.classification_cache import CACHEABLE_PROVIDERS, purge_stale_classifications
+from app.services.classifier import close_classifier
+from app.services.ml_classifier import load_local_classifier
+from app.services.report_pdf import shutdown_report_renderer
 
 logger = logging.getLogger("safescale")
 
@@ -36,29 +37,17 @@ logger = logging.getLogger("safescale")
 async def lifespan(app: FastAPI):
     mcp_server.register(LocalFilesConnector(Path(settings.mcp_base_path)))
     mcp_server.register(EmailMboxConnector(Path(settings.mcp_mbox_path)))
-    if settings.scraper_enabled:
-        org_id = None
-        if settings.scraper_org_api_key:
+    if settings.classifier_provider == "local":
+        load_local_classifier(Path(settings.local_classifier_path))
+    if settings.classifier_provider in CACHEABLE_PROVIDERS:
+        try:
             async with AsyncSessionLocal() as session:
-                result = await session.execute(
-                    select(Organization).where(Organization.api_key == settings.scraper_org_api_key)
-                )
-                org = result.scalar_one_or_none()
-                org_id = org.id if org else None
-        if org_id:
-            task = asyncio.create_task(
-                scraper_loop(
-                    AsyncSessionLocal,
-                    settings.scraper_urls,
-                    org_id,
-                )
-            )
-            yield
-            task.cancel()
-        else:
-            yield
-    else:
-        yield
+                await purge_stale_classifications(session)
+        except SQLAlchemyError:
+            logger.warning("Could not purge stale classification cache entries", exc_info=True)
+    yield
+    await close_classifier()
+    shutdown_report_renderer()
 
 
 app = FastAPI(title="SafeScale AI Backend", version="0.1.0", lifespan=lifespan)
@@ -3,11 +3,18 @@ from app.models.base import Base
 from app.models.compliance import (
     AppSetting,
     ChecklistItem,
+    ClassificationCache,
     ComplianceScore,
+    ComplianceScoreDaily,
     Organization,
+    OrgSummary,
     PolicyAudit,
+    PolicyAuditItem,
     RegulatoryAlert,
+    ScraperJob,
     ScraperRun,
+    ScraperSource,
+    UsageDaily,
     UsageEvent,
 )
 
@@ -15,11 +22,18 @@ __all__ = [
     "AuditLog",
     "Base",
     "ChecklistItem",
+    "ClassificationCache",
     "ComplianceScore",
+    "ComplianceScoreDaily",
     "AppSetting",
     "PolicyAudit",
+    "PolicyAuditItem",
     "Organization",
+    "OrgSummary",
     "RegulatoryAlert",
+    "ScraperJob",
     "ScraperRun",
+    "ScraperSource",
+    "UsageDaily",
     "UsageEvent",
 ]
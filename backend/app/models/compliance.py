@@ -1,8 +1,21 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, PrimaryKeyConstraint, String, Text, func
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -10,6 +23,9 @@ from app.models.base import Base
 
 class RegulatoryAlert(Base):
     __tablename__ = "regulatory_alert"
+    __table_args__ = (
+        Index("regulatory_alert_org_source_url_key", "org_id", "source_url", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     org_id: Mapped[int] = mapped_column(ForeignKey("organization.id"), index=True)
@@ -32,6 +48,19 @@ class ComplianceScore(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
+class ComplianceScoreDaily(Base):
+    __tablename__ = "compliance_score_daily"
+    __table_args__ = (PrimaryKeyConstraint("org_id", "day"),)
+
+    org_id: Mapped[int] = mapped_column(ForeignKey("organization.id"))
+    day: Mapped[date] = mapped_column(Date)
+    score_count: Mapped[int] = mapped_column(Integer, default=0)
+    score_sum: Mapped[int] = mapped_column(Integer, default=0)
+    score_min: Mapped[int] = mapped_column(Integer)
+    score_max: Mapped[int] = mapped_column(Integer)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 class UsageEvent(Base):
     __tablename__ = "usage_event"
 
@@ -45,6 +74,19 @@ class UsageEvent(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
+class UsageDaily(Base):
+    __tablename__ = "usage_daily"
+    __table_args__ = (PrimaryKeyConstraint("org_id", "day", "event_type"),)
+
+    org_id: Mapped[int] = mapped_column(ForeignKey("organization.id"))
+    day: Mapped[date] = mapped_column(Date)
+    event_type: Mapped[str] = mapped_column(String(60))
+    event_count: Mapped[int] = mapped_column(Integer, default=0)
+    units: Mapped[int] = mapped_column(Integer, default=0)
+    total_cost: Mapped[float] = mapped_column(default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 class ChecklistItem(Base):
     __tablename__ = "compliance_checklist"
 
@@ -76,6 +118,60 @@ class PolicyAudit(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
 
+class PolicyAuditItem(Base):
+    __tablename__ = "policy_audit_item"
+    __table_args__ = (
+        Index("policy_audit_item_org_created_at_idx", "org_id", "created_at"),
+        Index("policy_audit_item_org_checklist_idx", "org_id", "checklist_item_id", "matched"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    org_id: Mapped[int] = mapped_column(ForeignKey("organization.id"))
+    audit_id: Mapped[int] = mapped_column(
+        ForeignKey("policy_audit.id", ondelete="CASCADE"), index=True
+    )
+    checklist_item_id: Mapped[int | None] = mapped_column(
+        ForeignKey("compliance_checklist.id", ondelete="SET NULL"), nullable=True
+    )
+    checklist_item: Mapped[str] = mapped_column(Text)
+    matched: Mapped[bool] = mapped_column(Boolean)
+    severity: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    distance: Mapped[float | None] = mapped_column(Float, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class OrgSummary(Base):
+    __tablename__ = "org_summary"
+
+    org_id: Mapped[int] = mapped_column(ForeignKey("organization.id"), primary_key=True)
+    latest_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    latest_rating: Mapped[str | None] = mapped_column(String(40), nullable=True)
+    audit_count: Mapped[int] = mapped_column(Integer, default=0)
+    rolling_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    recent_audits: Mapped[list[dict[str, Any]]] = mapped_column(JSON, default=list)
+    alert_count: Mapped[int] = mapped_column(Integer, default=0)
+    alerts_high: Mapped[int] = mapped_column(Integer, default=0)
+    alerts_medium: Mapped[int] = mapped_column(Integer, default=0)
+    alerts_low: Mapped[int] = mapped_column(Integer, default=0)
+    recent_alerts: Mapped[list[dict[str, Any]]] = mapped_column(JSON, default=list)
+    last_scraper_status: Mapped[str | None] = mapped_column(String(40), nullable=True)
+    last_scraper_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class ClassificationCache(Base):
+    __tablename__ = "classification_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    doc_type: Mapped[str] = mapped_column(String(80))
+    jurisdiction: Mapped[str] = mapped_column(String(40))
+    reasoning: Mapped[str] = mapped_column(Text)
+    provider: Mapped[str] = mapped_column(String(40))
+    model: Mapped[str] = mapped_column(String(120))
+    version: Mapped[str] = mapped_column(String(16))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 class ScraperRun(Base):
     __tablename__ = "scraper_run"
 
@@ -89,6 +185,38 @@ class ScraperRun(Base):
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
+class ScraperJob(Base):
+    __tablename__ = "scraper_job"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    org_id: Mapped[int] = mapped_column(ForeignKey("organization.id"), index=True)
+    status: Mapped[str] = mapped_column(String(20), default="queued")
+    urls: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+    run_id: Mapped[int | None] = mapped_column(ForeignKey("scraper_run.id"), nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    requested_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class ScraperSource(Base):
+    __tablename__ = "scraper_source"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    url: Mapped[str] = mapped_column(Text, unique=True)
+    etag: Mapped[str | None] = mapped_column(String(400), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    subscribers: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    discovered_feeds: Mapped[list[str]] = mapped_column(JSON, default=list)
+    checked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    changed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    interval_seconds: Mapped[int] = mapped_column(Integer, default=3600)
+    next_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    consecutive_errors: Mapped[int] = mapped_column(Integer, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
 class AppSetting(Base):
     __tablename__ = "app_setting"
     __table_args__ = (PrimaryKeyConstraint("org_id", "key"),)
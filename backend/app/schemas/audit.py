@@ -16,3 +16,8 @@ class AuditLogCreate(BaseModel):
 class AuditLogRead(AuditLogCreate):
     id: int
     created_at: datetime
+
+
+class AuditLogPage(BaseModel):
+    items: list[AuditLogRead]
+    next_cursor: str | None = None
@@ -1,6 +1,10 @@
+from datetime import date
+
 from pydantic import BaseModel
 
 
 class UsageSummary(BaseModel):
     total_cost: float
     total_scans: int
+    start: date | None = None
+    end: date | None = None
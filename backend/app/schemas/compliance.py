@@ -1,3 +1,5 @@
+from datetime import date
+
 from pydantic import BaseModel, Field
 
 
@@ -15,6 +17,25 @@ class RegulatoryAlert(BaseModel):
     published_at: str
 
 
+class RegulatoryAlertPage(BaseModel):
+    items: list[RegulatoryAlert]
+    next_cursor: str | None = None
+
+
 class ComplianceDashboard(BaseModel):
-    score: ComplianceScore
+    score: ComplianceScore | None = None
     active_alerts: list[RegulatoryAlert]
+
+
+class ScoreHistoryPoint(BaseModel):
+    bucket_start: date
+    min: int
+    avg: float
+    max: int
+    count: int
+
+
+class ScoreHistory(BaseModel):
+    bucket: str
+    since: date
+    points: list[ScoreHistoryPoint]
@@ -28,3 +28,44 @@ class PolicyAuditRecord(PolicyAuditBase):
 
 class PolicyAuditRunResponse(PolicyAuditRecord):
     pass
+
+
+class PolicyAuditPage(BaseModel):
+    items: list[PolicyAuditRecord]
+    next_cursor: str | None = None
+
+
+class PolicyAuditText(BaseModel):
+    audit_id: int
+    pages: list[str]
+    chunks: list[str]
+
+
+class GapFrequency(BaseModel):
+    checklist_item_id: int | None = None
+    checklist_item: str
+    gaps: int
+    matches: int
+    gap_rate: float
+    avg_distance: float | None = None
+
+
+class GapSeverityCount(BaseModel):
+    severity: str
+    gaps: int
+
+
+class GapTrendPoint(BaseModel):
+    bucket_start: datetime
+    audits: int
+    gaps: int
+
+
+class GapAnalytics(BaseModel):
+    since: datetime
+    bucket: str
+    audits: int
+    gaps: int
+    items: list[GapFrequency]
+    severity: list[GapSeverityCount]
+    trend: list[GapTrendPoint]
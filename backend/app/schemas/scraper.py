@@ -5,10 +5,26 @@ class ScraperRunRequest(BaseModel):
     urls: list[str] | None = Field(default=None, description="Optional override for URLs")
 
 
-class ScraperRunResponse(BaseModel):
-    scanned: int
-    alerts_created: int
-    notes: list[str]
+class ScraperJobResponse(BaseModel):
+    id: int
+    status: str
+    requested_at: str
+    started_at: str | None
+    finished_at: str | None
+    error: str | None
+    scanned: int = 0
+    alerts_created: int = 0
+    notes: list[str] = Field(default_factory=list)
+
+
+class ScraperSourceStatus(BaseModel):
+    url: str
+    interval_seconds: int
+    next_run_at: str | None
+    checked_at: str | None
+    changed_at: str | None
+    consecutive_errors: int
+    last_error: str | None
 
 
 class ScraperStatus(BaseModel):
@@ -19,6 +35,7 @@ class ScraperStatus(BaseModel):
     scanned: int
     alerts_created: int
     notes: list[str]
+    sources: list[ScraperSourceStatus] = Field(default_factory=list)
 
 
 class ScraperFeeds(BaseModel):
@@ -0,0 +1,264 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.models.compliance import PolicyAudit, RegulatoryAlert
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - Parquet export is optional
+    pyarrow = None
+
+EXPORT_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class ExportDataset:
+    name: str
+    # (column, type) with type one of "int", "str" or "timestamp".
+    fields: tuple[tuple[str, str], ...]
+    query: Callable[[int], Select]
+    flatten: Callable[[Any], Iterable[dict[str, Any]]]
+
+    @property
+    def column_names(self) -> list[str]:
+        return [name for name, _ in self.fields]
+
+
+def _audits_query(org_id: int) -> Select:
+    return (
+        select(
+            PolicyAudit.id,
+            PolicyAudit.filename,
+            PolicyAudit.score,
+            PolicyAudit.rating,
+            PolicyAudit.doc_type,
+            PolicyAudit.jurisdiction,
+            func.coalesce(func.jsonb_array_length(PolicyAudit.matched_items), 0),
+            func.coalesce(func.jsonb_array_length(PolicyAudit.gaps), 0),
+            PolicyAudit.guardrail_note,
+            PolicyAudit.created_at,
+        )
+        .where(PolicyAudit.org_id == org_id)
+        .order_by(PolicyAudit.created_at.desc(), PolicyAudit.id.desc())
+    )
+
+
+def _flatten_audit(row: Any) -> Iterable[dict[str, Any]]:
+    yield dict(zip(AUDITS.column_names, row))
+
+
+def _audit_column_query(column: Any) -> Callable[[int], Select]:
+    def query(org_id: int) -> Select:
+        return (
+            select(PolicyAudit.id, PolicyAudit.created_at, column)
+            .where(PolicyAudit.org_id == org_id)
+            .order_by(PolicyAudit.created_at.desc(), PolicyAudit.id.desc())
+        )
+
+    return query
+
+
+def _flatten_gaps(row: Any) -> Iterable[dict[str, Any]]:
+    audit_id, created_at, gaps = row
+    for position, gap in enumerate(gaps or []):
+        yield {
+            "audit_id": audit_id,
+            "audit_created_at": created_at,
+            "position": position,
+            "checklist_item": gap.get("checklist_item"),
+            "reason": gap.get("reason"),
+            "severity": gap.get("severity") or "medium",
+        }
+
+
+def _flatten_matches(row: Any) -> Iterable[dict[str, Any]]:
+    audit_id, created_at, matched_items = row
+    for position, item in enumerate(matched_items or []):
+        yield {
+            "audit_id": audit_id,
+            "audit_created_at": created_at,
+            "position": position,
+            "checklist_item": item,
+        }
+
+
+def _alerts_query(org_id: int) -> Select:
+    return (
+        select(
+            RegulatoryAlert.id,
+            RegulatoryAlert.title,
+            RegulatoryAlert.severity,
+            RegulatoryAlert.summary,
+            RegulatoryAlert.source_url,
+            RegulatoryAlert.published_at,
+            RegulatoryAlert.created_at,
+        )
+        .where(RegulatoryAlert.org_id == org_id)
+        .order_by(RegulatoryAlert.created_at.desc(), RegulatoryAlert.id.desc())
+    )
+
+
+def _flatten_alert(row: Any) -> Iterable[dict[str, Any]]:
+    yield dict(zip(ALERTS.column_names, row))
+
+
+AUDITS = ExportDataset(
+    "audits",
+    (
+        ("id", "int"),
+        ("filename", "str"),
+        ("score", "int"),
+        ("rating", "str"),
+        ("doc_type", "str"),
+        ("jurisdiction", "str"),
+        ("matched_count", "int"),
+        ("gap_count", "int"),
+        ("guardrail_note", "str"),
+        ("created_at", "timestamp"),
+    ),
+    _audits_query,
+    _flatten_audit,
+)
+GAPS = ExportDataset(
+    "gaps",
+    (
+        ("audit_id", "int"),
+        ("audit_created_at", "timestamp"),
+        ("position", "int"),
+        ("checklist_item", "str"),
+        ("reason", "str"),
+        ("severity", "str"),
+    ),
+    _audit_column_query(PolicyAudit.gaps),
+    _flatten_gaps,
+)
+MATCHES = ExportDataset(
+    "matches",
+    (
+        ("audit_id", "int"),
+        ("audit_created_at", "timestamp"),
+        ("position", "int"),
+        ("checklist_item", "str"),
+    ),
+    _audit_column_query(PolicyAudit.matched_items),
+    _flatten_matches,
+)
+ALERTS = ExportDataset(
+    "alerts",
+    (
+        ("id", "int"),
+        ("title", "str"),
+        ("severity", "str"),
+        ("summary", "str"),
+        ("source_url", "str"),
+        ("published_at", "str"),
+        ("created_at", "timestamp"),
+    ),
+    _alerts_query,
+    _flatten_alert,
+)
+EXPORT_DATASETS = {dataset.name: dataset for dataset in (AUDITS, GAPS, MATCHES, ALERTS)}
+
+
+def parquet_available() -> bool:
+    return pyarrow is not None
+
+
+async def _record_batches(
+    session_factory: async_sessionmaker, dataset: ExportDataset, org_id: int
+) -> AsyncIterator[list[dict[str, Any]]]:
+    # Streams own their session: a streamed response outlives request dependencies.
+    async with session_factory() as session:
+        stmt = dataset.query(org_id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        result = await session.stream(stmt)
+        async for rows in result.partitions():
+            yield [record for row in rows for record in dataset.flatten(row)]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+async def stream_ndjson(
+    session_factory: async_sessionmaker, dataset: ExportDataset, org_id: int
+) -> AsyncIterator[str]:
+    async for records in _record_batches(session_factory, dataset, org_id):
+        if records:
+            yield "".join(
+                json.dumps(record, default=_json_default, separators=(",", ":")) + "\n"
+                for record in records
+            )
+
+
+class _ChunkSink:
+    """Write-only file object that hands encoded bytes back between row groups."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema(dataset: ExportDataset):
+    types = {
+        "int": pyarrow.int64(),
+        "str": pyarrow.string(),
+        "timestamp": pyarrow.timestamp("us", tz="UTC"),
+    }
+    return pyarrow.schema([(name, types[kind]) for name, kind in dataset.fields])
+
+
+def _write_row_group(writer, sink: _ChunkSink, schema, records: list[dict[str, Any]]) -> bytes:
+    writer.write_table(pyarrow.Table.from_pylist(records, schema=schema))
+    return sink.drain()
+
+
+def _close_writer(writer, sink: _ChunkSink) -> bytes:
+    writer.close()
+    return sink.drain()
+
+
+async def stream_parquet(
+    session_factory: async_sessionmaker, dataset: ExportDataset, org_id: int
+) -> AsyncIterator[bytes]:
+    if pyarrow is None:
+        raise RuntimeError("Parquet export requires pyarrow")
+    schema = _arrow_schema(dataset)
+    sink = _ChunkSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema, compression="zstd")
+    # One row group per database batch; encoding runs off the event loop.
+    async for records in _record_batches(session_factory, dataset, org_id):
+        if records:
+            chunk = await asyncio.to_thread(_write_row_group, writer, sink, schema, records)
+            if chunk:
+                yield chunk
+    yield await asyncio.to_thread(_close_writer, writer, sink)
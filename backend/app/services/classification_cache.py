@@ -0,0 +1,152 @@
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.compliance import ClassificationCache
+from app.services.classifier import (
+    CLASSIFIER_PROMPT_CHARS,
+    DOC_TYPES,
+    DocumentClassification,
+    classify_document,
+)
+
+CACHE_FORMAT = "1"
+CACHE_VERSION = hashlib.sha256(
+    f"{CACHE_FORMAT}:{','.join(sorted(DOC_TYPES))}".encode("utf-8")
+).hexdigest()[:16]
+
+CACHEABLE_PROVIDERS = {"openai"}
+
+
+class ClassificationLRU:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[float, DocumentClassification]] = OrderedDict()
+        self.memory_hits = 0
+        self.memory_misses = 0
+        self.db_hits = 0
+
+    def get(self, key: str) -> DocumentClassification | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] < time.time():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.memory_misses += 1
+            return None
+        self.memory_hits += 1
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(
+        self,
+        key: str,
+        value: DocumentClassification,
+        expires_at: float,
+        from_db: bool = False,
+    ) -> None:
+        """Remember ``value``; ``from_db`` marks a memory miss served by the database."""
+        if from_db:
+            self.db_hits += 1
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, float]:
+        # Every lookup starts in get(), so the counters always add up.
+        lookups = self.memory_hits + self.memory_misses
+        return {
+            "entries": len(self._entries),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.memory_misses - self.db_hits,
+            "hit_rate": (self.memory_hits + self.db_hits) / lookups if lookups else 0.0,
+        }
+
+
+classification_lru = ClassificationLRU(settings.classifier_cache_max_entries)
+
+
+def cache_key(text: str, industry: str | None, provider: str, model: str) -> str:
+    digest = hashlib.sha256()
+    for part in (CACHE_VERSION, provider, model, industry or "general"):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(text[:CLASSIFIER_PROMPT_CHARS].encode("utf-8"))
+    return digest.hexdigest()
+
+
+async def classify_document_cached(
+    session: AsyncSession, text: str, industry: str | None = None
+) -> DocumentClassification:
+    provider = settings.classifier_provider
+    if provider not in CACHEABLE_PROVIDERS:
+        return await classify_document(text, industry=industry)
+
+    model = settings.classifier_model
+    key = cache_key(text, industry, provider, model)
+    cached = classification_lru.get(key)
+    if cached is not None:
+        return cached
+
+    ttl = settings.classifier_cache_ttl_seconds
+    result = await session.execute(
+        select(ClassificationCache).where(
+            ClassificationCache.cache_key == key,
+            ClassificationCache.version == CACHE_VERSION,
+            ClassificationCache.created_at >= datetime.now(timezone.utc) - timedelta(seconds=ttl),
+        )
+    )
+    row = result.scalar_one_or_none()
+    if row is not None:
+        value = DocumentClassification(
+            doc_type=row.doc_type,
+            jurisdiction=row.jurisdiction,
+            reasoning=row.reasoning,
+            provider=row.provider,
+        )
+        classification_lru.put(key, value, row.created_at.timestamp() + ttl, from_db=True)
+        return value
+
+    value = await classify_document(text, industry=industry)
+    if value.provider != provider:
+        # Heuristic fallbacks (breaker open, timeouts) are not worth remembering.
+        return value
+
+    classification_lru.put(key, value, time.time() + ttl)
+    values = {
+        "doc_type": value.doc_type,
+        "jurisdiction": value.jurisdiction,
+        "reasoning": value.reasoning,
+        "provider": value.provider,
+        "model": model,
+        "version": CACHE_VERSION,
+    }
+    stmt = insert(ClassificationCache).values(cache_key=key, **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ClassificationCache.cache_key],
+        set_={**values, "created_at": func.now()},
+    )
+    await session.execute(stmt)
+    return value
+
+
+async def purge_stale_classifications(session: AsyncSession) -> int:
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.classifier_cache_ttl_seconds)
+    result = await session.execute(
+        delete(ClassificationCache).where(
+            or_(
+                ClassificationCache.version != CACHE_VERSION,
+                ClassificationCache.created_at < cutoff,
+            )
+        )
+    )
+    await session.commit()
+    return result.rowcount or 0
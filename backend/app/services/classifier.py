@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+import time
 from dataclasses import dataclass
 
 DOC_TYPES = {
@@ -21,6 +25,8 @@ DOC_TYPES = {
     "formulary",
 }
 
+CLASSIFIER_PROMPT_CHARS = 4000
+
 DOC_TYPE_SYNONYMS = {
     "privacy_notice": "privacy_policy",
     "incident_response_plan": "incident_response",
@@ -39,6 +45,10 @@ DOC_TYPE_SYNONYMS = {
 }
 
 from app.core.config import settings
+from app.services.keywords import KeywordMatcher
+from app.services.ml_classifier import get_local_classifier
+
+logger = logging.getLogger("safescale.classifier")
 
 
 @dataclass
@@ -46,6 +56,63 @@ class DocumentClassification:
     doc_type: str
     jurisdiction: str
     reasoning: str
+    provider: str = "heuristic"
+
+
+STRONG_HIPAA_PHRASES = (
+    "protected health information",
+    "phi",
+    "covered entity",
+    "business associate",
+    "hipaa privacy rule",
+    "hipaa security rule",
+)
+
+_CLASSIFIER_KEYWORDS = KeywordMatcher(
+    [
+        "formulary",
+        "tier",
+        "medication",
+        "drug",
+        "employee handbook",
+        "employee",
+        "handbook",
+        "privacy policy",
+        "privacy notice",
+        "incident response",
+        "business continuity",
+        "disaster recovery",
+        "risk assessment",
+        "risk analysis",
+        "audit report",
+        "assessment report",
+        "security architecture",
+        "architecture diagram",
+        "vendor",
+        "third party",
+        "management",
+        "program",
+        "due diligence",
+        "training",
+        "security awareness",
+        "attestation",
+        "contract",
+        "agreement",
+        "msa",
+        "compliance report",
+        "soc 2",
+        "iso 27001",
+        "policy",
+        "procedure",
+        "sop",
+        "gdpr",
+        "european union",
+        "ccpa",
+        "california",
+        "hipaa",
+        *STRONG_HIPAA_PHRASES,
+    ]
+)
 
 
 def _normalize_doc_type(value: str) -> str:
@@ -54,98 +121,93 @@ def _normalize_doc_type(value: str) -> str:
     return normalized if normalized in DOC_TYPES else "general"
 
 
-def _has_strong_hipaa_signal(text: str) -> bool:
-    lowered = text.lower()
-    if "hipaa" not in lowered:
+def _has_strong_hipaa_signal(hits: set[str]) -> bool:
+    if "hipaa" not in hits:
         return False
-    return any(
-        phrase in lowered
-        for phrase in [
-            "protected health information",
-            "phi",
-            "covered entity",
-            "business associate",
-            "hipaa privacy rule",
-            "hipaa security rule",
-        ]
-    )
+    return any(phrase in hits for phrase in STRONG_HIPAA_PHRASES)
 
 
 def _apply_industry_bias(
-    doc_type: str, jurisdiction: str, text: str, industry: str | None
+    doc_type: str,
+    jurisdiction: str,
+    text: str,
+    industry: str | None,
+    hits: set[str] | None = None,
 ) -> tuple[str, str, str | None]:
     if jurisdiction == "us-hipaa" and industry and industry != "healthcare":
-        if not _has_strong_hipaa_signal(text):
+        if hits is None:
+            hits = _CLASSIFIER_KEYWORDS.matched(text)
+        if not _has_strong_hipaa_signal(hits):
             return doc_type, "general", "Adjusted jurisdiction to general for non-healthcare industry"
     return doc_type, jurisdiction, None
 
 
 def _heuristic_classify(text: str, industry: str | None = None) -> DocumentClassification:
-    lowered = text.lower()
+    hits = _CLASSIFIER_KEYWORDS.matched(text)
     doc_type = "general"
     jurisdiction = "general"
     reasons: list[str] = []
 
-    if "formulary" in lowered or ("tier" in lowered and ("medication" in lowered or "drug" in lowered)):
+    if "formulary" in hits or ("tier" in hits and ("medication" in hits or "drug" in hits)):
         doc_type = "formulary"
         reasons.append("Detected formulary/medication tier language")
-    elif "employee handbook" in lowered or ("employee" in lowered and "handbook" in lowered):
+    elif "employee handbook" in hits or ("employee" in hits and "handbook" in hits):
         doc_type = "employee_handbook"
         reasons.append("Detected employee handbook language")
-    elif "privacy policy" in lowered or "privacy notice" in lowered:
+    elif "privacy policy" in hits or "privacy notice" in hits:
         doc_type = "privacy_policy"
         reasons.append("Detected privacy policy/notice language")
-    elif "incident response" in lowered:
+    elif "incident response" in hits:
         doc_type = "incident_response"
         reasons.append("Detected incident response language")
-    elif "business continuity" in lowered or "disaster recovery" in lowered:
+    elif "business continuity" in hits or "disaster recovery" in hits:
         doc_type = "business_continuity"
         reasons.append("Detected business continuity/disaster recovery language")
-    elif "risk assessment" in lowered or "risk analysis" in lowered:
+    elif "risk assessment" in hits or "risk analysis" in hits:
         doc_type = "risk_assessment"
         reasons.append("Detected risk assessment language")
-    elif "audit report" in lowered or "assessment report" in lowered:
+    elif "audit report" in hits or "assessment report" in hits:
         doc_type = "audit_report"
         reasons.append("Detected audit/assessment report language")
-    elif "security architecture" in lowered or "architecture diagram" in lowered:
+    elif "security architecture" in hits or "architecture diagram" in hits:
         doc_type = "security_architecture"
         reasons.append("Detected security architecture language")
-    elif "vendor" in lowered or "third party" in lowered:
-        if "management" in lowered or "program" in lowered or "due diligence" in lowered:
+    elif "vendor" in hits or "third party" in hits:
+        if "management" in hits or "program" in hits or "due diligence" in hits:
             doc_type = "vendor_program"
             reasons.append("Detected vendor/third-party program language")
-    elif "training" in lowered or "security awareness" in lowered or "attestation" in lowered:
+    elif "training" in hits or "security awareness" in hits or "attestation" in hits:
         doc_type = "training_attestation"
         reasons.append("Detected training/attestation language")
-    elif "contract" in lowered or "agreement" in lowered or "msa" in lowered:
+    elif "contract" in hits or "agreement" in hits or "msa" in hits:
         doc_type = "legal_contract"
         reasons.append("Detected contractual language")
-    elif "compliance report" in lowered or "soc 2" in lowered or "iso 27001" in lowered:
+    elif "compliance report" in hits or "soc 2" in hits or "iso 27001" in hits:
         doc_type = "compliance_report"
         reasons.append("Detected compliance report language")
-    elif "policy" in lowered:
+    elif "policy" in hits:
         doc_type = "policy"
         reasons.append("Detected policy language")
-    elif "procedure" in lowered or "sop" in lowered:
+    elif "procedure" in hits or "sop" in hits:
         doc_type = "procedure"
         reasons.append("Detected procedure language")
 
     if industry and industry != "general":
         reasons.append(f"Industry context: {industry}")
 
-    if "gdpr" in lowered or "european union" in lowered:
+    if "gdpr" in hits or "european union" in hits:
         jurisdiction = "eu"
         reasons.append("Detected GDPR/EU references")
-    elif "ccpa" in lowered or "california" in lowered:
+    elif "ccpa" in hits or "california" in hits:
         jurisdiction = "us-ca"
         reasons.append("Detected California/CCPA references")
-    elif "hipaa" in lowered:
+    elif "hipaa" in hits:
         jurisdiction = "us-hipaa"
         reasons.append("Detected HIPAA references")
 
     normalized_doc_type = _normalize_doc_type(doc_type)
     adjusted_doc_type, adjusted_jurisdiction, adjustment_note = _apply_industry_bias(
-        normalized_doc_type, jurisdiction, text, industry
+        normalized_doc_type, jurisdiction, text, industry, hits
     )
     if adjustment_note:
         reasons.append(adjustment_note)
@@ -157,50 +219,163 @@ def _heuristic_classify(text: str, industry: str | None = None) -> DocumentClass
     )
 
 
-def classify_document(text: str, industry: str | None = None) -> DocumentClassification:
-    if settings.classifier_provider != "openai" or not settings.openai_api_key:
-        return _heuristic_classify(text, industry=industry)
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int, reset_seconds: float) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "half_open":
+            # Let a single trial call through; re-arm so concurrent callers keep falling back.
+            self.opened_at = time.monotonic()
+            return True
+        return state == "closed"
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
 
+def _classifier_prompt(text: str, industry: str | None) -> str:
+    return (
+        "Classify the document text into a JSON object with keys: "
+        "doc_type ("
+        "general, policy, procedure, risk_assessment, control_mapping, audit_report, "
+        "incident_response, business_continuity, privacy_policy, security_architecture, "
+        "vendor_program, training_attestation, legal_contract, compliance_report, "
+        "employee_handbook, formulary"
+        "), "
+        "jurisdiction (us-ca, us-hipaa, eu, general), "
+        "reasoning (short string).\n\n"
+        f"Industry context: {industry or 'general'}\n\n"
+        f"Text:\n{text[:CLASSIFIER_PROMPT_CHARS]}"
+    )
+
+
+def _parse_llm_output(output: str, text: str, industry: str | None) -> DocumentClassification | None:
     try:
-        from openai import OpenAI
-
-        client = OpenAI(api_key=settings.openai_api_key)
-        prompt = (
-            "Classify the document text into a JSON object with keys: "
-            "doc_type ("
-            "general, policy, procedure, risk_assessment, control_mapping, audit_report, "
-            "incident_response, business_continuity, privacy_policy, security_architecture, "
-            "vendor_program, training_attestation, legal_contract, compliance_report, "
-            "employee_handbook, formulary"
-            "), "
-            "jurisdiction (us-ca, us-hipaa, eu, general), "
-            "reasoning (short string).\n\n"
-            f"Industry context: {industry or 'general'}\n\n"
-            f"Text:\n{text[:4000]}"
-        )
-        response = client.responses.create(
-            model=settings.classifier_model,
-            input=prompt,
+        data = json.loads(output)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    normalized_doc_type = _normalize_doc_type(str(data.get("doc_type", "general")))
+    jurisdiction = str(data.get("jurisdiction", "general"))
+    adjusted_doc_type, adjusted_jurisdiction, adjustment_note = _apply_industry_bias(
+        normalized_doc_type, jurisdiction, text, industry
+    )
+    reasoning = str(data.get("reasoning", "OpenAI classification"))
+    if adjustment_note:
+        reasoning = f"{reasoning}; {adjustment_note}"
+    return DocumentClassification(
+        doc_type=adjusted_doc_type,
+        jurisdiction=adjusted_jurisdiction,
+        reasoning=reasoning,
+        provider="openai",
+    )
+
+
+class OpenAIClassifier:
+    def __init__(self) -> None:
+        self._client = None
+        self._semaphore = asyncio.Semaphore(max(1, settings.classifier_max_concurrency))
+        self.breaker = CircuitBreaker(
+            settings.classifier_breaker_threshold,
+            settings.classifier_breaker_reset_seconds,
         )
-        output = response.output_text
-        if output:
-            import json
-
-            data = json.loads(output)
-            normalized_doc_type = _normalize_doc_type(str(data.get("doc_type", "general")))
-            jurisdiction = str(data.get("jurisdiction", "general"))
-            adjusted_doc_type, adjusted_jurisdiction, adjustment_note = _apply_industry_bias(
-                normalized_doc_type, jurisdiction, text, industry
-            )
-            reasoning = str(data.get("reasoning", "OpenAI classification"))
-            if adjustment_note:
-                reasoning = f"{reasoning}; {adjustment_note}"
-            return DocumentClassification(
-                doc_type=adjusted_doc_type,
-                jurisdiction=adjusted_jurisdiction,
-                reasoning=reasoning,
+
+    def _get_client(self):
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                base_url=settings.openai_base_url or None,
+                timeout=settings.classifier_timeout_seconds,
+                max_retries=0,
             )
-    except Exception:
-        return _heuristic_classify(text, industry=industry)
+        return self._client
+
+    async def classify(self, text: str, industry: str | None = None) -> DocumentClassification | None:
+        if not self.breaker.allow():
+            return None
+        # Only the upstream call is timed: waiting for a slot is local
+        # back-pressure and must not count against the breaker.
+        async with self._semaphore:
+            try:
+                client = self._get_client()
+                async with asyncio.timeout(settings.classifier_timeout_seconds):
+                    response = await client.responses.create(
+                        model=settings.classifier_model,
+                        input=_classifier_prompt(text, industry),
+                    )
+            except Exception as exc:
+                self.breaker.record_failure()
+                logger.warning("Classifier request failed (%s): %r", self.breaker.state, exc)
+                return None
+        self.breaker.record_success()
+        output = response.output_text
+        if not output:
+            return None
+        return _parse_llm_output(output, text, industry)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+openai_classifier = OpenAIClassifier()
+
 
+def _local_classify(text: str, industry: str | None = None) -> DocumentClassification | None:
+    model = get_local_classifier()
+    if model is None:
+        return None
+    doc_type, doc_confidence, jurisdiction, jurisdiction_confidence = model.predict(text)
+    adjusted_doc_type, adjusted_jurisdiction, adjustment_note = _apply_industry_bias(
+        _normalize_doc_type(doc_type), jurisdiction, text, industry
+    )
+    reasoning = (
+        f"Local model: doc_type {doc_confidence:.2f}, jurisdiction {jurisdiction_confidence:.2f}"
+    )
+    if adjustment_note:
+        reasoning = f"{reasoning}; {adjustment_note}"
+    return DocumentClassification(
+        doc_type=adjusted_doc_type,
+        jurisdiction=adjusted_jurisdiction,
+        reasoning=reasoning,
+        provider="local",
+    )
+
+
+async def classify_document(text: str, industry: str | None = None) -> DocumentClassification:
+    if settings.classifier_provider == "local":
+        result = _local_classify(text, industry=industry)
+        if result is not None:
+            return result
+    elif settings.classifier_provider == "openai" and settings.openai_api_key:
+        result = await openai_classifier.classify(text, industry=industry)
+        if result is not None:
+            return result
     return _heuristic_classify(text, industry=industry)
+
+
+async def close_classifier() -> None:
+    await openai_classifier.aclose()
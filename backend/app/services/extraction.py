@@ -0,0 +1,124 @@
+import asyncio
+import gzip
+import json
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from uuid import uuid4
+
+from pypdf import PdfReader, errors as pdf_errors
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.compliance import PolicyAudit
+
+EXTRACTION_FORMAT_VERSION = 1
+EXTRACTION_SUFFIX = ".extract.json.gz"
+DEFAULT_CHUNK_CHARS = 1500
+
+
+@dataclass
+class ExtractedDocument:
+    pages: list[str]
+    chunks: list[str]
+    chunk_chars: int = DEFAULT_CHUNK_CHARS
+    version: int = EXTRACTION_FORMAT_VERSION
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.pages)
+
+
+def extract_pdf_pages(data: bytes) -> list[str]:
+    try:
+        reader = PdfReader(BytesIO(data))
+    except pdf_errors.DependencyError as exc:
+        raise ValueError("Encrypted PDF requires cryptography") from exc
+    return [page.extract_text() or "" for page in reader.pages]
+
+
+def chunk_text(text: str, max_chars: int = DEFAULT_CHUNK_CHARS) -> list[str]:
+    chunks: list[str] = []
+    buffer: list[str] = []
+    size = 0
+    for paragraph in text.split("\n"):
+        if not paragraph.strip():
+            continue
+        if size + len(paragraph) > max_chars and buffer:
+            chunks.append(" ".join(buffer))
+            buffer = []
+            size = 0
+        buffer.append(paragraph.strip())
+        size += len(paragraph)
+    if buffer:
+        chunks.append(" ".join(buffer))
+    return chunks
+
+
+def extract_document(data: bytes, max_chars: int = DEFAULT_CHUNK_CHARS) -> ExtractedDocument:
+    pages = extract_pdf_pages(data)
+    return ExtractedDocument(
+        pages=pages,
+        chunks=chunk_text("\n".join(pages), max_chars),
+        chunk_chars=max_chars,
+    )
+
+
+def artifact_path(file_path: Path) -> Path:
+    return file_path.with_name(f"{file_path.name}{EXTRACTION_SUFFIX}")
+
+
+def write_extraction_artifact(file_path: Path, document: ExtractedDocument) -> Path:
+    target = artifact_path(file_path)
+    payload = {
+        "version": document.version,
+        "chunk_chars": document.chunk_chars,
+        "pages": document.pages,
+        "chunks": document.chunks,
+    }
+    tmp = target.with_name(f"{target.name}.{uuid4().hex}.tmp")
+    tmp.write_bytes(gzip.compress(json.dumps(payload).encode("utf-8")))
+    tmp.replace(target)
+    return target
+
+
+def read_extraction_artifact(file_path: Path) -> ExtractedDocument | None:
+    target = artifact_path(file_path)
+    try:
+        payload = json.loads(gzip.decompress(target.read_bytes()))
+    except (OSError, EOFError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != EXTRACTION_FORMAT_VERSION:
+        return None
+    return ExtractedDocument(
+        pages=list(payload.get("pages") or []),
+        chunks=list(payload.get("chunks") or []),
+        chunk_chars=int(payload.get("chunk_chars") or DEFAULT_CHUNK_CHARS),
+    )
+
+
+def load_or_extract(file_path: Path, data: bytes | None = None) -> ExtractedDocument:
+    """Read the blob's artifact, extracting (from ``data`` if given) only when missing."""
+    cached = read_extraction_artifact(file_path)
+    if cached is not None:
+        return cached
+    document = extract_document(data if data is not None else file_path.read_bytes())
+    write_extraction_artifact(file_path, document)
+    return document
+
+
+async def load_audit_extraction(
+    session: AsyncSession, audit_id: int, org_id: int
+) -> ExtractedDocument | None:
+    result = await session.execute(
+        select(PolicyAudit.file_path).where(
+            PolicyAudit.id == audit_id, PolicyAudit.org_id == org_id
+        )
+    )
+    file_path = result.scalar_one_or_none()
+    if not file_path:
+        return None
+    path = Path(file_path)
+    if not path.exists():
+        return None
+    return await asyncio.to_thread(load_or_extract, path)
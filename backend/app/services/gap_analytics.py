@@ -0,0 +1,95 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.compliance import PolicyAuditItem
+from app.schemas.policy_audit import (
+    GapAnalytics,
+    GapFrequency,
+    GapSeverityCount,
+    GapTrendPoint,
+)
+
+ANALYTICS_BUCKETS = ("day", "week", "month")
+
+
+async def gap_analytics(
+    session: AsyncSession,
+    org_id: int,
+    since: datetime,
+    bucket: str,
+    limit: int,
+) -> GapAnalytics:
+    if bucket not in ANALYTICS_BUCKETS:
+        raise ValueError(f"Unsupported bucket: {bucket}")
+    window = (PolicyAuditItem.org_id == org_id, PolicyAuditItem.created_at >= since)
+    is_gap = PolicyAuditItem.matched.is_(False)
+    gap_count = func.count().filter(is_gap)
+
+    audits, gaps = (
+        await session.execute(
+            select(func.count(func.distinct(PolicyAuditItem.audit_id)), gap_count).where(*window)
+        )
+    ).one()
+
+    item_gaps = gap_count.label("gaps")
+    items_result = await session.execute(
+        select(
+            PolicyAuditItem.checklist_item_id,
+            PolicyAuditItem.checklist_item,
+            item_gaps,
+            func.count().filter(PolicyAuditItem.matched.is_(True)),
+            func.avg(PolicyAuditItem.distance),
+        )
+        .where(*window)
+        .group_by(PolicyAuditItem.checklist_item_id, PolicyAuditItem.checklist_item)
+        .having(gap_count > 0)
+        .order_by(item_gaps.desc(), PolicyAuditItem.checklist_item)
+        .limit(limit)
+    )
+    items = [
+        GapFrequency(
+            checklist_item_id=item_id,
+            checklist_item=text,
+            gaps=item_gap_count,
+            matches=match_count,
+            gap_rate=round(item_gap_count / (item_gap_count + match_count), 4),
+            avg_distance=float(avg_distance) if avg_distance is not None else None,
+        )
+        for item_id, text, item_gap_count, match_count, avg_distance in items_result.all()
+    ]
+
+    severity_result = await session.execute(
+        select(PolicyAuditItem.severity, func.count())
+        .where(*window, is_gap)
+        .group_by(PolicyAuditItem.severity)
+        .order_by(func.count().desc())
+    )
+    severity = [
+        GapSeverityCount(severity=name or "medium", gaps=count)
+        for name, count in severity_result.all()
+    ]
+
+    # Group by the label so the bucket expression is bound once.
+    bucket_start = func.date_trunc(bucket, PolicyAuditItem.created_at).label("bucket_start")
+    trend_result = await session.execute(
+        select(bucket_start, func.count(func.distinct(PolicyAuditItem.audit_id)), gap_count)
+        .where(*window)
+        .group_by("bucket_start")
+        .order_by("bucket_start")
+    )
+    trend = [
+        GapTrendPoint(bucket_start=start, audits=bucket_audits, gaps=bucket_gaps)
+        for start, bucket_audits, bucket_gaps in trend_result.all()
+    ]
+
+    return GapAnalytics(
+        since=since,
+        bucket=bucket,
+        audits=audits,
+        gaps=gaps,
+        items=items,
+        severity=severity,
+        trend=trend,
+    )
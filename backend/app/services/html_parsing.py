@@ -0,0 +1,152 @@
+import codecs
+import html
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from app.core.config import settings
+
+try:
+    import lxml.etree
+    import lxml.html
+except ImportError:  # pragma: no cover - fall back to the streaming tokenizer
+    lxml = None
+
+SKIPPED_TAGS = ("script", "style", "noscript", "template")
+FEED_LINK_TYPES = ("rss", "atom", "xml")
+TOKENIZER_WINDOW = 64 * 1024
+
+
+@dataclass
+class ParsedPage:
+    title: str | None = None
+    feed_links: list[str] = field(default_factory=list)
+    text: str = ""
+
+
+def _is_feed_link(rel: str | None, link_type: str | None) -> bool:
+    if "alternate" not in (rel or "").lower().split():
+        return False
+    link_type = (link_type or "").lower()
+    return any(kind in link_type for kind in FEED_LINK_TYPES)
+
+
+def _collapse(parts) -> str:
+    return " ".join(" ".join(parts).split())
+
+
+class _PageTokenizer(HTMLParser):
+    """Streaming tokenizer that keeps only the title, feed links and visible text."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title_parts: list[str] | None = None
+        self.feed_hrefs: list[str] = []
+        self.text_parts: list[str] = []
+        self._skip_depth = 0
+        self._in_title = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "title" and self.title_parts is None:
+            self.title_parts = []
+            self._in_title = True
+        elif tag == "link":
+            values = dict(attrs)
+            href = values.get("href")
+            if href and _is_feed_link(values.get("rel"), values.get("type")):
+                self.feed_hrefs.append(href)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._in_title and self.title_parts is not None:
+            self.title_parts.append(data)
+        self.text_parts.append(data)
+
+
+def _normalize_encoding(encoding: str | None) -> str | None:
+    """Canonical codec name for a declared charset, or None if it is unknown."""
+    if not encoding:
+        return None
+    try:
+        return codecs.lookup(encoding.strip().strip("'\"")).name
+    except LookupError:
+        return None
+
+
+def _decode(content: bytes, encoding: str | None) -> str:
+    return content.decode(encoding or "utf-8", errors="replace")
+
+
+def _parse_page_stream(content: bytes, base_url: str, encoding: str | None) -> ParsedPage:
+    tokenizer = _PageTokenizer()
+    text = _decode(content, encoding)
+    # Feed in windows so unfinished markup buffered by the tokenizer stays small.
+    for start in range(0, len(text), TOKENIZER_WINDOW):
+        tokenizer.feed(text[start : start + TOKENIZER_WINDOW])
+    tokenizer.close()
+    title = _collapse(tokenizer.title_parts) if tokenizer.title_parts is not None else None
+    return ParsedPage(
+        title=title or None,
+        feed_links=[urljoin(base_url, href) for href in tokenizer.feed_hrefs],
+        text=_collapse(tokenizer.text_parts),
+    )
+
+
+def _parse_page_lxml(content: bytes, base_url: str, encoding: str | None) -> ParsedPage:
+    parser = lxml.html.HTMLParser(encoding=encoding, remove_comments=True, remove_pis=True)
+    root = lxml.html.document_fromstring(content, parser=parser)
+    feed_links = [
+        urljoin(base_url, link.get("href"))
+        for link in root.iter("link")
+        if link.get("href") and _is_feed_link(link.get("rel"), link.get("type"))
+    ]
+    title_element = root.find(".//title")
+    title = " ".join(title_element.text_content().split()) if title_element is not None else ""
+    lxml.etree.strip_elements(root, *SKIPPED_TAGS, with_tail=False)
+    return ParsedPage(
+        title=title or None,
+        feed_links=feed_links,
+        text=" ".join(root.text_content().split()),
+    )
+
+
+def _use_lxml() -> bool:
+    return lxml is not None and settings.scraper_html_parser == "lxml"
+
+
+def parse_page(content: bytes, base_url: str, encoding: str | None = None) -> ParsedPage:
+    if not content.strip():
+        return ParsedPage()
+    # A bogus header charset falls back to utf-8 (or, for lxml, to detection).
+    encoding = _normalize_encoding(encoding)
+    if _use_lxml():
+        try:
+            return _parse_page_lxml(content, base_url, encoding)
+        except (lxml.etree.ParserError, ValueError, LookupError):
+            # LookupError: a codec Python knows but libxml2 does not (e.g. euc_jp).
+            pass
+    return _parse_page_stream(content, base_url, encoding)
+
+
+def html_to_text(fragment: str) -> str:
+    if "<" not in fragment:
+        return " ".join(html.unescape(fragment).split())
+    if _use_lxml():
+        try:
+            element = lxml.html.fragment_fromstring(fragment, create_parent="div")
+            return " ".join(element.text_content().split())
+        except (lxml.etree.ParserError, ValueError):
+            pass
+    tokenizer = _PageTokenizer()
+    tokenizer.feed(fragment)
+    tokenizer.close()
+    return _collapse(tokenizer.text_parts)
@@ -0,0 +1,279 @@
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+import httpcore
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger("safescale.scraper")
+
+SCRAPER_USER_AGENT = "SafeScaleAI/1.0 (+https://safescale.ai)"
+DNS_CACHE_MAX_ENTRIES = 1024
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        return max(0, self.requests - self.connections)
+
+
+@dataclass
+class HttpClientMetrics:
+    hosts: dict[str, HostStats] = field(default_factory=dict)
+    dns_lookups: int = 0
+    dns_hits: int = 0
+
+    def host(self, name: str) -> HostStats:
+        return self.hosts.setdefault(name.lower(), HostStats())
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "dns_lookups": self.dns_lookups,
+            "dns_hits": self.dns_hits,
+            "hosts": {
+                name: {"requests": s.requests, "connections": s.connections, "reused": s.reused}
+                for name, s in sorted(self.hosts.items())
+            },
+        }
+
+    def summary(self) -> str:
+        requests = sum(s.requests for s in self.hosts.values())
+        connections = sum(s.connections for s in self.hosts.values())
+        return (
+            f"{requests} requests over {connections} new connections to {len(self.hosts)} hosts, "
+            f"{self.dns_hits} DNS cache hits"
+        )
+
+
+class CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches DNS answers and counts new connections per host.
+
+    Only the TCP connect target is swapped for the cached address; TLS still uses
+    the original hostname for SNI and certificate checks.
+    """
+
+    def __init__(
+        self,
+        metrics: HttpClientMetrics,
+        ttl_seconds: float,
+        max_entries: int = DNS_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._backend = httpcore.AnyIOBackend()
+        self._metrics = metrics
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._cache: OrderedDict[tuple[str, int], tuple[float, list[str]]] = OrderedDict()
+
+    async def _resolve(self, host: str, port: int) -> list[str]:
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+        key = (host.lower(), port)
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            self._metrics.dns_hits += 1
+            return cached[1]
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        if not addresses:
+            raise OSError(f"No addresses found for {host}")
+        self._metrics.dns_lookups += 1
+        self._cache[key] = (time.monotonic() + self._ttl, addresses)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options=None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await asyncio.wait_for(self._resolve(host, port), timeout)
+        except (OSError, asyncio.TimeoutError) as exc:
+            raise httpcore.ConnectError(f"Could not resolve {host}: {exc}") from exc
+        key = (host.lower(), port)
+        error: httpcore.ConnectError | None = None
+        # Try every address in resolver order, e.g. IPv4 after an unreachable AAAA.
+        for address in addresses:
+            try:
+                stream = await self._backend.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except httpcore.ConnectError as exc:
+                error = exc
+                continue
+            cached = self._cache.get(key)
+            if cached and cached[1][0] != address:
+                # Remember the reachable address so later connects try it first.
+                self._cache[key] = (cached[0], [address, *(a for a in cached[1] if a != address)])
+            self._metrics.host(host).connections += 1
+            return stream
+        # Every cached address failed; resolve again on the next attempt.
+        self._cache.pop(key, None)
+        raise error or httpcore.ConnectError(f"Could not connect to {host}")
+
+    async def connect_unix_socket(self, path: str, timeout: float | None = None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+# Most specific first: timeouts and connect errors subclass the broader classes.
+_HTTPCORE_ERRORS: tuple[tuple[type[Exception], type[httpx.TransportError]], ...] = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+_HTTPCORE_ERROR_TYPES = tuple(core_type for core_type, _ in _HTTPCORE_ERRORS)
+
+
+def _as_httpx_error(exc: Exception, request: httpx.Request) -> Exception:
+    for core_type, httpx_type in _HTTPCORE_ERRORS:
+        if isinstance(exc, core_type):
+            return httpx_type(str(exc), request=request)
+    return exc
+
+
+class _PoolResponseStream(httpx.AsyncByteStream):
+    def __init__(self, response: httpcore.Response, request: httpx.Request) -> None:
+        self._response = response
+        self._request = request
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._response.aiter_stream():
+                yield chunk
+        except _HTTPCORE_ERROR_TYPES as exc:
+            raise _as_httpx_error(exc, self._request) from exc
+
+    async def aclose(self) -> None:
+        await self._response.aclose()
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """httpx transport over an httpcore pool that uses the caching resolver.
+
+    httpx.AsyncHTTPTransport cannot take a network backend, so the pool is
+    built here and requests are mapped onto it directly.
+    """
+
+    def __init__(self, pool: httpcore.AsyncConnectionPool) -> None:
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        try:
+            response = await self._pool.handle_async_request(core_request)
+        except _HTTPCORE_ERROR_TYPES as exc:
+            raise _as_httpx_error(exc, request) from exc
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_PoolResponseStream(response, request),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _pooled_transport(metrics: HttpClientMetrics) -> PooledTransport:
+    http2 = settings.scraper_http2
+    if http2 and not _http2_available():
+        logger.warning("SCRAPER_HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
+        http2 = False
+    pool = httpcore.AsyncConnectionPool(
+        ssl_context=httpx.create_ssl_context(),
+        max_connections=settings.scraper_max_connections,
+        max_keepalive_connections=settings.scraper_max_keepalive_connections,
+        keepalive_expiry=settings.scraper_keepalive_expiry_seconds,
+        http1=True,
+        http2=http2,
+        network_backend=CachingResolverBackend(metrics, settings.scraper_dns_cache_seconds),
+    )
+    return PooledTransport(pool)
+
+
+def create_scraper_client(
+    transport: httpx.AsyncBaseTransport | None = None,
+    metrics: HttpClientMetrics | None = None,
+) -> httpx.AsyncClient:
+    metrics = metrics if metrics is not None else scraper_http_metrics
+
+    async def count_request(request: httpx.Request) -> None:
+        metrics.host(request.url.host).requests += 1
+
+    return httpx.AsyncClient(
+        transport=transport or _pooled_transport(metrics),
+        timeout=settings.scraper_request_timeout_seconds,
+        headers={"User-Agent": SCRAPER_USER_AGENT},
+        event_hooks={"request": [count_request]},
+    )
+
+
+scraper_http_metrics = HttpClientMetrics()
+_scraper_client: httpx.AsyncClient | None = None
+
+
+def get_scraper_client() -> httpx.AsyncClient:
+    global _scraper_client
+    if _scraper_client is None or _scraper_client.is_closed:
+        _scraper_client = create_scraper_client()
+    return _scraper_client
+
+
+async def close_scraper_client() -> None:
+    global _scraper_client
+    client, _scraper_client = _scraper_client, None
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,69 @@
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    keyword: str
+    start: int
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Optional tails keep the match greedy, so each position reports its longest keyword.
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Case-insensitive substring matcher for a fixed keyword list.
+
+    All keywords are compiled into a single trie-shaped regex and found in one
+    pass over the text. Hits may overlap, so every keyword contained in the
+    text is reported, just like a separate ``keyword in text`` check would.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords if keyword))
+        self._pattern = re.compile(f"(?=({_trie_pattern(self.keywords)}))") if self.keywords else None
+        # Shorter keywords that start where a longer one matched are not reported by the
+        # regex itself, so expand each hit with the keywords that are its prefixes.
+        self._prefixes = {
+            keyword: tuple(
+                other for other in self.keywords if other != keyword and keyword.startswith(other)
+            )
+            for keyword in self.keywords
+        }
+
+    def finditer(self, text: str) -> Iterator[KeywordHit]:
+        if self._pattern is None:
+            return
+        for match in self._pattern.finditer(text.lower()):
+            keyword = match.group(1)
+            start = match.start()
+            yield KeywordHit(keyword, start)
+            for prefix in self._prefixes[keyword]:
+                yield KeywordHit(prefix, start)
+
+    def find_all(self, text: str) -> list[KeywordHit]:
+        return list(self.finditer(text))
+
+    def matched(self, text: str) -> set[str]:
+        return {hit.keyword for hit in self.finditer(text)}
+
+    def matched_in_order(self, text: str) -> list[str]:
+        hits = self.matched(text)
+        return [keyword for keyword in self.keywords if keyword in hits]
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger("safescale.leader")
+
+SCRAPER_LEADER_LOCK_ID = 0x5AFE5CA1E
+
+
+class AdvisoryLock:
+    """Session-level Postgres advisory lock held on a dedicated connection.
+
+    The lock lives as long as the connection does, so a crashed holder releases
+    it as soon as Postgres notices the connection is gone. Checks are bounded by
+    ``check_timeout``: a stalled connection may already have lost the lock on
+    the server, so it counts as lost rather than blocking the holder.
+    """
+
+    def __init__(self, engine: AsyncEngine, lock_id: int, check_timeout: float = 5.0) -> None:
+        self.engine = engine
+        self.lock_id = lock_id
+        self.check_timeout = check_timeout
+        self._connection: AsyncConnection | None = None
+
+    @property
+    def held(self) -> bool:
+        return self._connection is not None
+
+    async def try_acquire(self) -> bool:
+        if self._connection is not None:
+            return True
+        connection = await self.engine.connect()
+        try:
+            # Autocommit keeps the holder from sitting "idle in transaction".
+            connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            acquired = await connection.scalar(
+                text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": self.lock_id}
+            )
+        except BaseException:
+            await connection.close()
+            raise
+        if not acquired:
+            await connection.close()
+            return False
+        self._connection = connection
+        return True
+
+    async def check(self) -> bool:
+        if self._connection is None:
+            return False
+        try:
+            await asyncio.wait_for(
+                self._connection.execute(text("SELECT 1")), self.check_timeout
+            )
+        except (SQLAlchemyError, OSError, asyncio.TimeoutError):
+            logger.warning("Advisory lock %s connection check failed", self.lock_id, exc_info=True)
+            await self._discard()
+            return False
+        return True
+
+    async def _discard(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        # Unlocking over a broken connection could hang; dropping it releases the lock.
+        with suppress(SQLAlchemyError):
+            await connection.invalidate()
+            await connection.close()
+
+    async def release(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        unlocked = False
+        try:
+            unlocked = bool(
+                await asyncio.wait_for(
+                    connection.scalar(
+                        text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": self.lock_id}
+                    ),
+                    self.check_timeout,
+                )
+            )
+        except (SQLAlchemyError, OSError, asyncio.TimeoutError):
+            logger.warning("Could not release advisory lock %s", self.lock_id, exc_info=True)
+        finally:
+            with suppress(SQLAlchemyError):
+                # A pooled connection that may still hold the lock must never be
+                # handed out again; dropping it makes Postgres release the lock.
+                if not unlocked:
+                    await connection.invalidate()
+                await connection.close()
+
+
+async def run_as_leader(
+    engine: AsyncEngine,
+    lock_id: int,
+    work: Callable[[], Awaitable[None]],
+    retry_seconds: float,
+    name: str = "worker",
+) -> None:
+    """Run ``work`` only while this process holds the advisory lock.
+
+    Followers retry every ``retry_seconds``; the leader re-checks its lock
+    connection at the same interval and stops working if it was lost.
+    """
+    # A check may take at most one retry interval before leadership counts as lost.
+    lock = AdvisoryLock(engine, lock_id, check_timeout=retry_seconds)
+    while True:
+        try:
+            if await lock.try_acquire():
+                logger.info("Acquired %s leadership", name)
+                task = asyncio.create_task(work())
+                try:
+                    while not task.done():
+                        await asyncio.wait({task}, timeout=retry_seconds)
+                        if not task.done() and not await lock.check():
+                            logger.warning("Lost %s leadership", name)
+                            break
+                finally:
+                    task.cancel()
+                    (outcome,) = await asyncio.gather(task, return_exceptions=True)
+                    if isinstance(outcome, Exception):
+                        logger.error("%s stopped unexpectedly", name, exc_info=outcome)
+                    await lock.release()
+        except (SQLAlchemyError, OSError):
+            logger.warning("Could not acquire %s leadership", name, exc_info=True)
+        await asyncio.sleep(retry_seconds)
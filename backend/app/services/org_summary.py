@@ -0,0 +1,135 @@
+from collections import Counter
+from typing import Any, Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.compliance import OrgSummary, PolicyAudit, RegulatoryAlert, ScraperRun
+
+ROLLING_AUDITS = 3
+RECENT_ALERTS = 10
+ALERT_SEVERITY_COLUMNS = {"high": "alerts_high", "medium": "alerts_medium", "low": "alerts_low"}
+
+
+async def _upsert_summary(
+    session: AsyncSession,
+    org_id: int,
+    values: dict[str, Any] | None = None,
+    increments: dict[str, int] | None = None,
+) -> None:
+    """Write the org's summary row in the caller's transaction.
+
+    ``values`` replace columns outright, ``increments`` are added to them. A
+    missing row starts from the increments, which matches the org's history:
+    migration 019 backfills existing orgs and an org reset deletes the row
+    together with the data it summarises.
+    """
+    values = values or {}
+    increments = increments or {}
+    stmt = insert(OrgSummary).values(org_id=org_id, updated_at=func.now(), **values, **increments)
+    updates: dict[str, Any] = {name: stmt.excluded[name] for name in values}
+    updates.update(
+        {name: getattr(OrgSummary, name) + stmt.excluded[name] for name in increments}
+    )
+    updates["updated_at"] = func.now()
+    await session.execute(
+        stmt.on_conflict_do_update(index_elements=[OrgSummary.org_id], set_=updates)
+    )
+
+
+async def _lock_summary(session: AsyncSession, org_id: int) -> None:
+    """Create the org's summary row if needed and lock it until the caller commits.
+
+    Snapshot fields are recomputed from source rows; holding the row lock while
+    reading them means a concurrent writer recomputes after our commit and
+    sees our rows, instead of overwriting the snapshot with an older one.
+    """
+    await session.execute(
+        insert(OrgSummary)
+        .values(org_id=org_id, updated_at=func.now())
+        .on_conflict_do_nothing(index_elements=[OrgSummary.org_id])
+    )
+    await session.execute(
+        select(OrgSummary.org_id).where(OrgSummary.org_id == org_id).with_for_update()
+    )
+
+
+async def record_score(session: AsyncSession, org_id: int, score: int, rating: str) -> None:
+    await _upsert_summary(session, org_id, {"latest_score": score, "latest_rating": rating})
+
+
+async def record_audit(session: AsyncSession, org_id: int) -> None:
+    """Refresh the rolling audit fields; call after the new audit is flushed."""
+    await _lock_summary(session, org_id)
+    result = await session.execute(
+        select(
+            PolicyAudit.filename,
+            PolicyAudit.score,
+            func.coalesce(func.jsonb_array_length(PolicyAudit.gaps), 0),
+        )
+        .where(PolicyAudit.org_id == org_id)
+        .order_by(PolicyAudit.created_at.desc(), PolicyAudit.id.desc())
+        .limit(ROLLING_AUDITS)
+    )
+    recent = [
+        {"filename": filename, "score": score, "gaps": gaps}
+        for filename, score, gaps in result.all()
+    ]
+    rolling = int(round(sum(item["score"] for item in recent) / len(recent))) if recent else None
+    await _upsert_summary(
+        session,
+        org_id,
+        {"recent_audits": recent, "rolling_score": rolling},
+        {"audit_count": 1},
+    )
+
+
+async def _recent_alerts(session: AsyncSession, org_id: int) -> list[dict[str, Any]]:
+    result = await session.execute(
+        select(
+            RegulatoryAlert.id,
+            RegulatoryAlert.title,
+            RegulatoryAlert.summary,
+            RegulatoryAlert.severity,
+            RegulatoryAlert.source_url,
+            RegulatoryAlert.published_at,
+        )
+        .where(RegulatoryAlert.org_id == org_id)
+        .order_by(RegulatoryAlert.created_at.desc(), RegulatoryAlert.id.desc())
+        .limit(RECENT_ALERTS)
+    )
+    return [dict(row._mapping) for row in result.all()]
+
+
+async def record_alerts(session: AsyncSession, created: Iterable[tuple[int, str]]) -> None:
+    """Count newly inserted alerts, given as (org_id, severity) pairs."""
+    by_org: dict[int, Counter] = {}
+    for org_id, severity in created:
+        by_org.setdefault(org_id, Counter())[(severity or "").lower()] += 1
+    # Lock in org order so concurrent batches cannot deadlock on each other.
+    for org_id, severities in sorted(by_org.items()):
+        await _lock_summary(session, org_id)
+        increments = {"alert_count": sum(severities.values())}
+        for severity, column in ALERT_SEVERITY_COLUMNS.items():
+            if severities[severity]:
+                increments[column] = severities[severity]
+        await _upsert_summary(
+            session, org_id, {"recent_alerts": await _recent_alerts(session, org_id)}, increments
+        )
+
+
+async def record_scraper_runs(session: AsyncSession, runs: Iterable[ScraperRun]) -> None:
+    # Same lock and org order as the snapshot writers, so this never interleaves
+    # with a recompute in progress or deadlocks against one.
+    for run in sorted(runs, key=lambda run: run.org_id):
+        await _lock_summary(session, run.org_id)
+        await _upsert_summary(
+            session,
+            run.org_id,
+            {"last_scraper_status": run.status, "last_scraper_run_at": run.finished_at},
+        )
+
+
+async def get_org_summary(session: AsyncSession, org_id: int) -> OrgSummary | None:
+    return await session.get(OrgSummary, org_id)
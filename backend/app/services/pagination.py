@@ -0,0 +1,59 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    payload = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def keyset_statement(
+    stmt: Select, created_column: Any, id_column: Any, cursor: str | None, limit: int
+) -> Select:
+    """Seek ``stmt`` past ``cursor``, newest first, fetching one extra row."""
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        # Bind with the column types so timestamptz cursors compare as timestamptz.
+        bound = tuple_(literal(created_at, created_column.type), literal(row_id, id_column.type))
+        stmt = stmt.where(tuple_(created_column, id_column) < bound)
+    return stmt.order_by(created_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+async def keyset_page(
+    session: AsyncSession,
+    stmt: Select,
+    created_column: Any,
+    id_column: Any,
+    cursor: str | None,
+    limit: int,
+) -> tuple[Sequence[Any], str | None]:
+    """Newest-first page of ``stmt`` that starts strictly after ``cursor``.
+
+    Seeks on (created_at, id) instead of using OFFSET, so every page costs the
+    same as the first one given an (org_id, created_at DESC, id DESC) index.
+    """
+    stmt = keyset_statement(stmt, created_column, id_column, cursor, limit)
+    rows = (await session.execute(stmt)).scalars().all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(
+        getattr(last, created_column.key), getattr(last, id_column.key)
+    )
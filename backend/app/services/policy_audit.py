@@ -1,49 +1,26 @@
+import asyncio
 from typing import Iterable
 
-from io import BytesIO
-
 from langchain_core.documents import Document
-from pypdf import PdfReader, errors as pdf_errors
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pathlib import Path
 
 from app.core.config import settings
-from app.models.compliance import ChecklistItem, ComplianceScore, PolicyAudit, UsageEvent
+from app.models.compliance import ChecklistItem, PolicyAudit, PolicyAuditItem
 from app.schemas.policy_audit import PolicyAuditBase, PolicyAuditRecord, PolicyGap
-from app.services.classifier import classify_document
+from app.services.classification_cache import classify_document_cached
 from app.services.checklist import ensure_checklist
 from app.services.embeddings import EmbeddingProvider
+from app.services.extraction import load_or_extract
 from app.services.guardrail import apply_guardrail
+from app.services.keywords import KeywordMatcher
+from app.services.org_summary import record_audit
+from app.services.score_history import add_compliance_score
 from app.services.settings import get_embedding_threshold, get_industry_setting
 from app.services.storage import save_policy_file
-
-
-def _extract_text_from_pdf(data: bytes) -> str:
-    try:
-        reader = PdfReader(BytesIO(data))
-    except pdf_errors.DependencyError as exc:
-        raise ValueError("Encrypted PDF requires cryptography") from exc
-    return "\n".join(page.extract_text() or "" for page in reader.pages)
-
-
-def _chunk_text(text: str, max_chars: int = 1500) -> list[str]:
-    chunks: list[str] = []
-    buffer: list[str] = []
-    size = 0
-    for paragraph in text.split("\n"):
-        if not paragraph.strip():
-            continue
-        if size + len(paragraph) > max_chars and buffer:
-            chunks.append(" ".join(buffer))
-            buffer = []
-            size = 0
-        buffer.append(paragraph.strip())
-        size += len(paragraph)
-    if buffer:
-        chunks.append(" ".join(buffer))
-    return chunks
+from app.services.usage import add_usage_event
 
 
 def _score_rating(score: int) -> str:
@@ -54,32 +31,37 @@ def _score_rating(score: int) -> str:
     return "High risk"
 
 
+HIGH_SEVERITY_KEYWORDS = (
+    "incident",
+    "breach",
+    "hipaa",
+    "gdpr",
+    "ccpa",
+    "cpra",
+    "access control",
+    "access controls",
+    "access review",
+    "user provisioning",
+    "data retention",
+    "data classification",
+    "vendor risk",
+    "security",
+)
+
+LOW_SEVERITY_KEYWORDS = (
+    "employee handbook",
+    "remote work",
+    "confidentiality",
+)
+
+_SEVERITY_KEYWORDS = KeywordMatcher(HIGH_SEVERITY_KEYWORDS + LOW_SEVERITY_KEYWORDS)
+
+
 def _gap_severity(text: str) -> str:
-    lowered = text.lower()
-    high_keywords = [
-        "incident",
-        "breach",
-        "hipaa",
-        "gdpr",
-        "ccpa",
-        "cpra",
-        "access control",
-        "access controls",
-        "access review",
-        "user provisioning",
-        "data retention",
-        "data classification",
-        "vendor risk",
-        "security",
-    ]
-    low_keywords = [
-        "employee handbook",
-        "remote work",
-        "confidentiality",
-    ]
-    if any(keyword in lowered for keyword in high_keywords):
+    hits = _SEVERITY_KEYWORDS.matched(text)
+    if any(keyword in hits for keyword in HIGH_SEVERITY_KEYWORDS):
         return "high"
-    if any(keyword in lowered for keyword in low_keywords):
+    if any(keyword in hits for keyword in LOW_SEVERITY_KEYWORDS):
         return "low"
     return "medium"
 
@@ -89,7 +71,7 @@ async def _find_matches(
     checklist: Iterable[ChecklistItem],
     doc_chunks: list[str],
     threshold: float,
-) -> tuple[list[str], list[PolicyGap]]:
+) -> tuple[list[str], list[PolicyGap], list[PolicyAuditItem]]:
     matched: dict[int, float] = {}
     embeddings = EmbeddingProvider()
     documents = [Document(page_content=chunk) for chunk in doc_chunks]
@@ -114,20 +96,32 @@ async def _find_matches(
 
     matched_items = []
     gaps: list[PolicyGap] = []
+    outcomes: list[PolicyAuditItem] = []
     for item in checklist:
         distance = matched.get(item.id)
         if distance is not None and distance <= threshold:
             matched_items.append(item.text)
+            severity = None
         else:
+            severity = _gap_severity(item.text)
             gaps.append(
                 PolicyGap(
                     checklist_item=item.text,
                     reason="Missing in submitted PDF",
-                    severity=_gap_severity(item.text),
+                    severity=severity,
                 )
             )
+        outcomes.append(
+            PolicyAuditItem(
+                checklist_item_id=item.id,
+                checklist_item=item.text,
+                matched=severity is None,
+                severity=severity,
+                distance=distance,
+            )
+        )
 
-    return matched_items, gaps
+    return matched_items, gaps, outcomes
 
 
 async def run_policy_audit(
@@ -137,10 +131,15 @@ async def run_policy_audit(
     filename: str,
     org_id: int,
 ) -> PolicyAuditRecord:
-    text = _extract_text_from_pdf(pdf_bytes)
-    chunks = _chunk_text(text)
+    # Blobs are content-addressed, so a re-upload reuses the stored extraction.
+    file_path = await save_policy_file(
+        Path(settings.policy_audit_storage_path), filename, pdf_bytes
+    )
+    document = await asyncio.to_thread(load_or_extract, file_path, pdf_bytes)
+    text = document.text
+    chunks = document.chunks
     industry = await get_industry_setting(session, org_id)
-    classification = classify_document(text, industry=industry)
+    classification = await classify_document_cached(session, text, industry=industry)
     checklist_result = await session.execute(
         select(ChecklistItem).where(
             ChecklistItem.org_id == org_id,
@@ -154,20 +153,17 @@ async def run_policy_audit(
         checklist = await ensure_checklist(session, org_id)
 
     threshold = await get_embedding_threshold(session, org_id)
-    matched, gaps = await _find_matches(session, checklist, chunks, threshold)
+    matched, gaps, outcomes = await _find_matches(session, checklist, chunks, threshold)
     score = int(round((len(matched) / max(1, len(checklist))) * 100))
     rating = _score_rating(score)
 
-    session.add(ComplianceScore(score=score, rating=rating, org_id=org_id))
-    session.add(
-        UsageEvent(
-            event_type="policy_audit",
-            units=1,
-            unit_cost=scan_unit_cost,
-            total_cost=scan_unit_cost,
-            meta={"matched": len(matched), "gaps": len(gaps)},
-            org_id=org_id,
-        )
+    await add_compliance_score(session, org_id, score, rating)
+    await add_usage_event(
+        session,
+        org_id,
+        "policy_audit",
+        scan_unit_cost,
+        {"matched": len(matched), "gaps": len(gaps)},
     )
     await session.commit()
 
@@ -180,7 +176,6 @@ async def run_policy_audit(
     )
     guarded = apply_guardrail(base_response)
 
-    file_path = save_policy_file(Path(settings.policy_audit_storage_path), filename, pdf_bytes)
     record = PolicyAudit(
         filename=filename or "policy.pdf",
         file_path=str(file_path),
@@ -194,11 +189,18 @@ async def run_policy_audit(
         jurisdiction=classification.jurisdiction,
         classifier_notes={
             "reasoning": classification.reasoning,
-            "provider": settings.classifier_provider,
+            "provider": classification.provider,
             "industry": industry,
         },
     )
     session.add(record)
+    await session.flush()
+    # Same transaction as the audit, so now() gives both rows the same created_at.
+    for outcome in outcomes:
+        outcome.org_id = org_id
+        outcome.audit_id = record.id
+    session.add_all(outcomes)
+    await record_audit(session, org_id)
     await session.commit()
     await session.refresh(record)
 
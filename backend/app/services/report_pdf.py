@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Callable
+from uuid import uuid4
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+from app.core.config import settings
+
+REPORT_FORMAT_VERSION = 1
+
+
+class _PdfWriter:
+    def __init__(self, title: str, title_gap: int) -> None:
+        self.buffer = BytesIO()
+        self.pdf = canvas.Canvas(self.buffer, pagesize=letter)
+        _, self.height = letter
+        self.y = self.height - 50
+        self.pdf.setFont("Helvetica-Bold", 14)
+        self.pdf.drawString(40, self.y, title)
+        self.y -= title_gap
+        self.pdf.setFont("Helvetica", 10)
+
+    def line(self, text: str) -> None:
+        if self.y < 60:
+            self.pdf.showPage()
+            self.y = self.height - 50
+            self.pdf.setFont("Helvetica", 10)
+        self.pdf.drawString(40, self.y, text[:120])
+        self.y -= 14
+
+    def finish(self) -> bytes:
+        self.pdf.save()
+        return self.buffer.getvalue()
+
+
+def render_audit_pdf(audit: dict[str, Any]) -> bytes:
+    writer = _PdfWriter("Policy Audit Report", 22)
+    writer.line(f"Audit ID: {audit['id']}")
+    writer.line(f"Filename: {audit['filename']}")
+    writer.line(f"Created: {audit['created_at']}")
+    writer.line(f"Score: {audit['score']} ({audit['rating']})")
+    writer.line(
+        "Classification: "
+        f"{audit['doc_type'] or 'general'} / {audit['jurisdiction'] or 'general'}"
+    )
+    matched_items = audit["matched_items"] or []
+    gaps = audit["gaps"] or []
+    writer.line(f"Matched items: {len(matched_items)}")
+    writer.line(f"Gaps: {len(gaps)}")
+    writer.line("")
+
+    if gaps:
+        writer.line("Top gaps:")
+        for gap in gaps[:10]:
+            severity = (gap.get("severity") or "medium").upper()
+            item = gap.get("checklist_item", "Unknown requirement")
+            writer.line(f"- {severity}: {item}")
+        writer.line("")
+
+    if matched_items:
+        writer.line("Top matched items:")
+        for item in matched_items[:10]:
+            writer.line(f"- {item}")
+    return writer.finish()
+
+
+def render_audits_pdf(rows: list[tuple[str, str, int, str, int]]) -> bytes:
+    writer = _PdfWriter("Policy Audits Report", 24)
+    if not rows:
+        writer.line("No policy audits found.")
+    for created_on, filename, score, rating, gap_count in rows:
+        writer.line(f"{created_on} | {filename} | Score {score} ({rating}) | Gaps {gap_count}")
+    return writer.finish()
+
+
+def render_alerts_pdf(rows: list[tuple[str, str, str]]) -> bytes:
+    writer = _PdfWriter("Regulatory Alerts Report", 24)
+    if not rows:
+        writer.line("No regulatory alerts found.")
+    for published_at, severity, title in rows:
+        writer.line(f"{published_at} | {severity} | {title}")
+    return writer.finish()
+
+
+_executor: Executor | None = None
+
+
+def _render_executor() -> Executor | None:
+    global _executor
+    if _executor is None and settings.report_render_processes > 0:
+        _executor = ProcessPoolExecutor(max_workers=settings.report_render_processes)
+    return _executor
+
+
+async def render_off_loop(render: Callable[[Any], bytes], payload: Any) -> bytes:
+    executor = _render_executor()
+    if executor is None:
+        return await asyncio.to_thread(render, payload)
+    return await asyncio.get_running_loop().run_in_executor(executor, render, payload)
+
+
+def shutdown_report_renderer() -> None:
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def audit_pdf_path(policy_file: Path, audit_id: int) -> Path:
+    # Stored next to the policy blob so storage GC removes it with the blob.
+    return policy_file.with_name(
+        f"{policy_file.name}.audit-{audit_id}-v{REPORT_FORMAT_VERSION}.pdf"
+    )
+
+
+def audit_report_etag(audit_id: int, kind: str) -> str:
+    return f'"audit-{audit_id}-{kind}-v{REPORT_FORMAT_VERSION}"'
+
+
+def org_report_etag(kind: str, org_id: int, latest: datetime | None, count: int) -> str:
+    watermark = f"{kind}:{org_id}:{latest.isoformat() if latest else '-'}:{count}"
+    digest = hashlib.sha256(f"{watermark}:v{REPORT_FORMAT_VERSION}".encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def org_report_path(org_id: int, kind: str, etag: str) -> Path:
+    name = etag.strip('"')
+    return Path(settings.report_cache_path) / str(org_id) / f"{kind}-{name}.pdf"
+
+
+def write_cached_report(path: Path, content: bytes) -> None:
+    # Superseded reports are left for sweep_report_cache: a response may still
+    # be streaming one of them.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+
+
+def sweep_report_cache(cache_dir: Path, grace_seconds: int) -> int:
+    """Remove org reports superseded by a newer one for longer than the grace period."""
+    if not cache_dir.exists():
+        return 0
+    cutoff = time.time() - grace_seconds
+    removed = 0
+    for org_dir in cache_dir.iterdir():
+        if not org_dir.is_dir():
+            continue
+        by_kind: dict[str, list[tuple[float, Path]]] = {}
+        for path in org_dir.iterdir():
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if path.suffix == ".tmp":
+                # Left behind by a writer that died before its rename.
+                if mtime < cutoff:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                continue
+            by_kind.setdefault(path.name.split("-", 1)[0], []).append((mtime, path))
+        for reports in by_kind.values():
+            reports.sort()
+            newest_mtime = reports[-1][0]
+            if newest_mtime > cutoff:
+                continue
+            for _, path in reports[:-1]:
+                path.unlink(missing_ok=True)
+                removed += 1
+    return removed
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
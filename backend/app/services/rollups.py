@@ -0,0 +1,6 @@
+from sqlalchemy import Date, cast, func
+
+
+def utc_day(value):
+    """UTC calendar day of a timestamptz expression; rollup tables key on it."""
+    return cast(func.timezone("UTC", value), Date)
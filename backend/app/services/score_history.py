@@ -0,0 +1,110 @@
+from datetime import date
+
+from sqlalchemy import Date, DateTime, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.compliance import ComplianceScore, ComplianceScoreDaily
+from app.schemas.compliance import ScoreHistory, ScoreHistoryPoint
+from app.services.org_summary import record_score
+from app.services.rollups import utc_day
+
+HISTORY_BUCKETS = ("day", "week", "month")
+
+
+async def record_daily_score(session: AsyncSession, org_id: int, score: int) -> None:
+    stmt = insert(ComplianceScoreDaily).values(
+        org_id=org_id,
+        day=utc_day(func.now()),
+        score_count=1,
+        score_sum=score,
+        score_min=score,
+        score_max=score,
+        updated_at=func.now(),
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ComplianceScoreDaily.org_id, ComplianceScoreDaily.day],
+            set_={
+                "score_count": ComplianceScoreDaily.score_count + stmt.excluded.score_count,
+                "score_sum": ComplianceScoreDaily.score_sum + stmt.excluded.score_sum,
+                "score_min": func.least(ComplianceScoreDaily.score_min, stmt.excluded.score_min),
+                "score_max": func.greatest(ComplianceScoreDaily.score_max, stmt.excluded.score_max),
+                "updated_at": func.now(),
+            },
+        )
+    )
+
+
+async def add_compliance_score(session: AsyncSession, org_id: int, score: int, rating: str) -> None:
+    """Add a score row and update its rollups; the caller commits."""
+    session.add(ComplianceScore(score=score, rating=rating, org_id=org_id))
+    await record_score(session, org_id, score, rating)
+    await record_daily_score(session, org_id, score)
+
+
+async def backfill_score_rollups(session: AsyncSession, org_id: int | None = None) -> int:
+    """Rebuild daily rollups from compliance_score; returns the number of days written."""
+    source = select(
+        ComplianceScore.org_id,
+        utc_day(ComplianceScore.created_at).label("day"),
+        func.count(),
+        func.sum(ComplianceScore.score),
+        func.min(ComplianceScore.score),
+        func.max(ComplianceScore.score),
+    ).group_by(ComplianceScore.org_id, "day")
+    if org_id is not None:
+        source = source.where(ComplianceScore.org_id == org_id)
+    stmt = insert(ComplianceScoreDaily).from_select(
+        ["org_id", "day", "score_count", "score_sum", "score_min", "score_max"], source
+    )
+    # Overwrite rather than add, so the backfill can be re-run safely.
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ComplianceScoreDaily.org_id, ComplianceScoreDaily.day],
+        set_={
+            "score_count": stmt.excluded.score_count,
+            "score_sum": stmt.excluded.score_sum,
+            "score_min": stmt.excluded.score_min,
+            "score_max": stmt.excluded.score_max,
+            "updated_at": func.now(),
+        },
+    )
+    result = await session.execute(stmt)
+    await session.commit()
+    return result.rowcount or 0
+
+
+async def score_history(
+    session: AsyncSession, org_id: int, bucket: str, since: date
+) -> ScoreHistory:
+    if bucket not in HISTORY_BUCKETS:
+        raise ValueError(f"Unsupported bucket: {bucket}")
+    # Weeks and months are folded from the daily rows, so a long range reads at
+    # most one row per day regardless of how many scores were recorded.
+    bucket_start = cast(
+        func.date_trunc(bucket, cast(ComplianceScoreDaily.day, DateTime())), Date
+    ).label("bucket_start")
+    result = await session.execute(
+        select(
+            bucket_start,
+            func.min(ComplianceScoreDaily.score_min),
+            func.sum(ComplianceScoreDaily.score_sum),
+            func.max(ComplianceScoreDaily.score_max),
+            func.sum(ComplianceScoreDaily.score_count),
+        )
+        .where(ComplianceScoreDaily.org_id == org_id, ComplianceScoreDaily.day >= since)
+        .group_by("bucket_start")
+        .order_by("bucket_start")
+    )
+    points = [
+        ScoreHistoryPoint(
+            bucket_start=start,
+            min=low,
+            avg=round(total / count, 1),
+            max=high,
+            count=count,
+        )
+        for start, low, total, high, count in result.all()
+        if count
+    ]
+    return ScoreHistory(bucket=bucket, since=since, points=points)
@@ -1,176 +1,482 @@
 import asyncio
-from datetime import datetime, timedelta
+import hashlib
+import logging
+import random
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 
 import feedparser
 import httpx
-from bs4 import BeautifulSoup
-from sqlalchemy import select
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 from app.core.config import settings
-from app.models.compliance import RegulatoryAlert, ScraperRun
-from app.services.settings import get_scraper_feed_urls
+from app.models.compliance import Organization, RegulatoryAlert, ScraperRun, ScraperSource
+from app.services.html_parsing import html_to_text, parse_page
+from app.services.http_client import get_scraper_client, scraper_http_metrics
+from app.services.keywords import KeywordMatcher
+from app.services.org_summary import record_alerts, record_scraper_runs
+from app.services.settings import get_scraper_feed_urls, get_scraper_feed_urls_by_org
+
+logger = logging.getLogger("safescale.scraper")
 
 SCRAPER_INTERVAL_SECONDS = 3600
+SCRAPER_TICK_SECONDS = 60
+SCHEDULE_JITTER = 0.1
+MAX_ERROR_BACKOFF_STEPS = 6
+ALERT_INSERT_BATCH = 1000
 
 KEYWORDS = ["small business", "privacy"]
 
-
-def _keyword_match(text: str) -> bool:
-    lowered = text.lower()
-    return any(keyword in lowered for keyword in KEYWORDS)
+PAGE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+FEED_HEADERS = {
+    "Accept": "application/rss+xml,application/atom+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+_KEYWORD_MATCHER = KeywordMatcher(KEYWORDS)
+
+
+def _matched_keywords(text: str) -> list[str]:
+    return _KEYWORD_MATCHER.matched_in_order(text)
+
+
+@dataclass
+class FetchResult:
+    url: str
+    content: bytes | None = None
+    headers: httpx.Headers | None = None
+    encoding: str | None = None
+    error: str | None = None
+    not_modified: bool = False
+    truncated: bool = False
+
+
+@dataclass
+class FetchChange:
+    content_changed: bool = False
+    subscribers_changed: bool = False
+
+    @property
+    def needs_processing(self) -> bool:
+        return self.content_changed or self.subscribers_changed
+
+
+@dataclass
+class OrgScrapeResult:
+    scanned: int = 0
+    created: int = 0
+    notes: list[str] = field(default_factory=list)
+
+
+async def _read_capped(response: httpx.Response, limit: int) -> tuple[bytes, bool]:
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        if size + len(chunk) > limit:
+            chunks.append(chunk[: limit - size])
+            return b"".join(chunks), True
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks), False
+
+
+async def _get(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str] | None
+) -> FetchResult:
+    async with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            return FetchResult(url, not_modified=True)
+        response.raise_for_status()
+        content, truncated = await _read_capped(response, settings.scraper_max_response_bytes)
+    if truncated:
+        logger.info("Truncated %s at %d bytes", url, settings.scraper_max_response_bytes)
+    return FetchResult(
+        url,
+        content=content,
+        headers=response.headers,
+        encoding=response.charset_encoding,
+        truncated=truncated,
+    )
 
 
-def _discover_feeds(soup: BeautifulSoup, base_url: str) -> list[str]:
-    feeds: list[str] = []
-    for link in soup.find_all("link", rel="alternate"):
-        link_type = (link.get("type") or "").lower()
-        href = link.get("href")
-        if not href:
+def run_deadline() -> float:
+    return asyncio.get_running_loop().time() + settings.scraper_run_timeout_seconds
+
+
+async def fetch_all(
+    client: httpx.AsyncClient,
+    urls: list[str],
+    deadline: float | None = None,
+    conditional_headers: dict[str, dict[str, str]] | None = None,
+    headers: dict[str, str] | None = None,
+) -> list[FetchResult]:
+    loop = asyncio.get_running_loop()
+    deadline = deadline if deadline is not None else run_deadline()
+    global_limit = asyncio.Semaphore(max(1, settings.scraper_max_concurrency))
+    host_limits: dict[str, asyncio.Semaphore] = {}
+
+    async def fetch(url: str) -> FetchResult:
+        host = (urlsplit(url).hostname or "").lower()
+        host_limit = host_limits.setdefault(
+            host, asyncio.Semaphore(max(1, settings.scraper_per_host_concurrency))
+        )
+        request_headers = {**(headers or {}), **(conditional_headers or {}).get(url, {})}
+        # Take the host slot first so a task queued on a busy host does not
+        # hold a global slot that another host could use.
+        async with host_limit, global_limit:
+            try:
+                return await asyncio.wait_for(
+                    _get(client, url, request_headers),
+                    timeout=settings.scraper_request_timeout_seconds,
+                )
+            except httpx.HTTPError as exc:
+                return FetchResult(url, error=str(exc))
+            except asyncio.TimeoutError:
+                return FetchResult(url, error="request timed out")
+            except Exception as exc:
+                # Fetches are shared across orgs: one bad URL (invalid host,
+                # unsupported scheme, bad encoding) only fails its own source.
+                logger.warning("Unexpected error fetching %s", url, exc_info=True)
+                return FetchResult(url, error=f"{type(exc).__name__}: {exc}")
+
+    tasks = [asyncio.create_task(fetch(url)) for url in urls]
+    if not tasks:
+        return []
+    done, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - loop.time()))
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    # Results are returned in input order so downstream processing stays deterministic.
+    return [
+        task.result() if task in done else FetchResult(url, error="run deadline exceeded")
+        for url, task in zip(urls, tasks)
+    ]
+
+
+def subscriber_digest(org_ids: list[int]) -> str:
+    joined = ",".join(str(org_id) for org_id in sorted(set(org_ids)))
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+async def load_sources(session: AsyncSession, urls: list[str]) -> dict[str, ScraperSource]:
+    if not urls:
+        return {}
+    stmt = select(ScraperSource).where(ScraperSource.url.in_(urls))
+    result = await session.execute(stmt)
+    sources = {source.url: source for source in result.scalars().all()}
+    missing = [url for url in dict.fromkeys(urls) if url not in sources]
+    if missing:
+        # Workers, queued jobs and the scheduled cycle may register the same URL
+        # at once; losing that race must not abort the run.
+        await session.execute(
+            insert(ScraperSource)
+            .values([{"url": url, "discovered_feeds": []} for url in missing])
+            .on_conflict_do_nothing(index_elements=[ScraperSource.url])
+        )
+        result = await session.execute(stmt.where(ScraperSource.url.in_(missing)))
+        sources.update({source.url: source for source in result.scalars().all()})
+    return sources
+
+
+def conditional_headers(
+    sources: dict[str, ScraperSource], digests: dict[str, str]
+) -> dict[str, dict[str, str]]:
+    headers: dict[str, dict[str, str]] = {}
+    for url, source in sources.items():
+        # Validators only apply if the same set of orgs already received this content.
+        if source.subscribers != digests.get(url):
             continue
-        if "rss" in link_type or "atom" in link_type or "xml" in link_type:
-            feeds.append(urljoin(base_url, href))
-    return feeds
+        validators: dict[str, str] = {}
+        if source.etag:
+            validators["If-None-Match"] = source.etag
+        if source.last_modified:
+            validators["If-Modified-Since"] = source.last_modified
+        if validators:
+            headers[url] = validators
+    return headers
+
+
+def _validator(headers, name: str, max_length: int) -> str | None:
+    # A truncated validator would never match again, so an oversized one is dropped.
+    value = headers.get(name)
+    if value is None or len(value) > max_length:
+        return None
+    return value
+
+
+def record_fetch(source: ScraperSource, result: FetchResult, subscribers: str) -> FetchChange:
+    now = datetime.utcnow()
+    source.checked_at = now
+    if result.not_modified or result.content is None:
+        return FetchChange()
+    content_hash = hashlib.sha256(result.content).hexdigest()
+    change = FetchChange(
+        content_changed=source.content_hash != content_hash,
+        subscribers_changed=source.subscribers != subscribers,
+    )
+    if change.content_changed:
+        source.changed_at = now
+    headers = result.headers or {}
+    source.etag = _validator(headers, "etag", ScraperSource.etag.type.length)
+    source.last_modified = _validator(
+        headers, "last-modified", ScraperSource.last_modified.type.length
+    )
+    source.content_hash = content_hash
+    source.subscribers = subscribers
+    return change
+
+
+def is_due(source: ScraperSource, now: datetime) -> bool:
+    return source.next_run_at is None or source.next_run_at <= now
+
+
+def reschedule(source: ScraperSource, error: str | None = None, changed: bool = False) -> None:
+    """Pick the next poll time from how often the source changes.
+
+    Sources that changed on this fetch are polled twice as often, unchanged ones
+    back off by half again, and failures back off exponentially without touching
+    the learned interval. Jitter keeps sources from firing in lockstep.
+    """
+    now = datetime.now(timezone.utc)
+    interval = source.interval_seconds or SCRAPER_INTERVAL_SECONDS
+    if error:
+        source.consecutive_errors = (source.consecutive_errors or 0) + 1
+        source.last_error = error[:500]
+        delay = interval * 2 ** min(source.consecutive_errors, MAX_ERROR_BACKOFF_STEPS)
+    else:
+        source.consecutive_errors = 0
+        source.last_error = None
+        interval = interval // 2 if changed else int(interval * 1.5)
+        delay = interval
+    low = settings.scraper_min_interval_seconds
+    high = settings.scraper_max_interval_seconds
+    source.interval_seconds = min(high, max(low, interval))
+    delay = min(high, max(low, delay)) * random.uniform(1 - SCHEDULE_JITTER, 1 + SCHEDULE_JITTER)
+    source.next_run_at = now + timedelta(seconds=delay)
+
+
+async def insert_alerts(session: AsyncSession, rows: list[dict]) -> set[tuple[int, str]]:
+    created: set[tuple[int, str]] = set()
+    for start in range(0, len(rows), ALERT_INSERT_BATCH):
+        stmt = (
+            insert(RegulatoryAlert)
+            .values(rows[start : start + ALERT_INSERT_BATCH])
+            .on_conflict_do_nothing(index_elements=["org_id", "source_url"])
+            .returning(
+                RegulatoryAlert.org_id, RegulatoryAlert.source_url, RegulatoryAlert.severity
+            )
+        )
+        result = await session.execute(stmt)
+        inserted = result.all()
+        created.update((org_id, source_url) for org_id, source_url, _ in inserted)
+        await record_alerts(session, ((org_id, severity) for org_id, _, severity in inserted))
+    return created
 
 
-async def scrape_urls(
-    session: AsyncSession, urls: list[str], org_id: int
-) -> tuple[int, int, list[str], list[str]]:
-    alerts_created = 0
-    notes: list[str] = []
+def _note(results: dict[int, OrgScrapeResult], org_ids: list[int], note: str) -> None:
+    for org_id in org_ids:
+        results[org_id].notes.append(note)
 
-    headers = {
-        "User-Agent": "SafeScaleAI/1.0 (+https://safescale.ai)",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
-    discovered_feeds: list[str] = []
-    async with httpx.AsyncClient(timeout=20.0, headers=headers) as client:
-        for url in urls:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-            except httpx.HTTPError as exc:
-                notes.append(f"Failed to fetch {url}: {exc}")
-                continue
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            discovered_feeds.extend(_discover_feeds(soup, url))
-            text = " ".join(soup.get_text(" ").split())
-            if not _keyword_match(text):
-                notes.append(f"No keyword match for {url}")
-                continue
-
-            title = soup.title.string.strip() if soup.title and soup.title.string else "Regulatory update"
-            summary = "Keyword match: " + ", ".join([kw for kw in KEYWORDS if kw in text.lower()])
-            exists = await session.execute(
-                select(RegulatoryAlert).where(
-                    RegulatoryAlert.source_url == url,
-                    RegulatoryAlert.org_id == org_id,
-                )
-            )
-            if exists.scalar_one_or_none():
-                notes.append(f"Alert already exists for {url}")
-                continue
-
-            alert = RegulatoryAlert(
-                title=title[:200],
-                summary=summary,
-                severity="Medium",
-                source_url=url,
-                published_at=datetime.utcnow().strftime("%b %d, %Y"),
-                raw_payload={"keywords": KEYWORDS},
-                org_id=org_id,
-            )
-            session.add(alert)
-            await session.commit()
-            alerts_created += 1
-            notes.append(f"Alert created for {url}")
 
-    return len(urls), alerts_created, notes, list(dict.fromkeys(discovered_feeds))
+async def scrape_page_sources(
+    session: AsyncSession,
+    subscriptions: dict[str, list[int]],
+    deadline: float | None = None,
+) -> tuple[dict[int, OrgScrapeResult], dict[str, list[int]]]:
+    """Fetch each page once and fan keyword matches out to every subscribed org.
+
+    Returns per-org results plus the feeds discovered on those pages, mapped to
+    the orgs that subscribe to the page they were found on.
+    """
+    results: dict[int, OrgScrapeResult] = defaultdict(OrgScrapeResult)
+    discovered: dict[str, list[int]] = {}
+    urls = list(subscriptions)
+    digests = {url: subscriber_digest(org_ids) for url, org_ids in subscriptions.items()}
+    sources = await load_sources(session, urls)
+    fetched = await fetch_all(
+        get_scraper_client(),
+        urls,
+        deadline,
+        conditional_headers(sources, digests),
+        headers=PAGE_HEADERS,
+    )
+
+    rows: list[dict] = []
+    for result in fetched:
+        url = result.url
+        org_ids = subscriptions[url]
+        source = sources[url]
+        for org_id in org_ids:
+            results[org_id].scanned += 1
+        if result.error:
+            reschedule(source, result.error)
+            _note(results, org_ids, f"Failed to fetch {url}: {result.error}")
+            continue
 
+        change = record_fetch(source, result, digests[url])
+        reschedule(source, changed=change.content_changed)
+        if not change.needs_processing or result.content is None:
+            _note(results, org_ids, f"Unchanged since last check: {url}")
+            page_feeds = source.discovered_feeds or []
+        else:
+            page = parse_page(result.content, url, result.encoding)
+            page_feeds = source.discovered_feeds = page.feed_links
+            keywords = _matched_keywords(page.text)
+            if keywords:
+                title = page.title or "Regulatory update"
+                alert = {
+                    "title": title[:200],
+                    "summary": "Keyword match: " + ", ".join(keywords),
+                    "severity": "Medium",
+                    "source_url": url,
+                    "published_at": datetime.utcnow().strftime("%b %d, %Y"),
+                    "raw_payload": {"keywords": KEYWORDS},
+                }
+                rows.extend({**alert, "org_id": org_id} for org_id in org_ids)
+            else:
+                _note(results, org_ids, f"No keyword match for {url}")
+
+        for feed_url in page_feeds:
+            subscribers = discovered.setdefault(feed_url, [])
+            subscribers.extend(org_id for org_id in org_ids if org_id not in subscribers)
+
+    created = await insert_alerts(session, rows)
+    for row in rows:
+        org_result = results[row["org_id"]]
+        if (row["org_id"], row["source_url"]) in created:
+            org_result.created += 1
+            org_result.notes.append(f"Alert created for {row['source_url']}")
+        else:
+            org_result.notes.append(f"Alert already exists for {row['source_url']}")
 
-async def scrape_feeds(
-    session: AsyncSession, feed_urls: list[str], org_id: int
-) -> tuple[int, int, list[str]]:
-    alerts_created = 0
+    await session.commit()
+    return results, discovered
+
+
+def _feed_alerts(parsed, feed_url: str) -> tuple[list[dict], list[str]]:
+    alerts: dict[str, dict] = {}
     notes: list[str] = []
+    for entry in parsed.entries:
+        title = (entry.get("title") or "").strip()
+        summary_html = (entry.get("summary") or entry.get("description") or "").strip()
+        link = (entry.get("link") or "").strip()
+        published = (entry.get("published") or entry.get("updated") or "").strip()
+        summary_text = html_to_text(summary_html) if summary_html else ""
+        combined = f"{title} {summary_text}".strip()
+        if not combined:
+            continue
+        keywords = _matched_keywords(combined)
+        matched = bool(keywords)
+        if settings.scraper_feed_require_keyword and not matched:
+            continue
+
+        if not link:
+            notes.append(f"Feed entry missing link in {feed_url}")
+            continue
+
+        if link in alerts:
+            continue
+
+        keyword_note = (
+            "Keyword match: " + ", ".join(keywords)
+            if matched
+            else "Feed item ingested"
+        )
+        alerts[link] = {
+            "title": title[:200] if title else "Regulatory update",
+            "summary": summary_text[:500] if summary_text else keyword_note,
+            "severity": "Medium" if matched else "Low",
+            "source_url": link,
+            "published_at": published or datetime.utcnow().strftime("%b %d, %Y"),
+            "raw_payload": {"feed": feed_url},
+        }
+    return list(alerts.values()), notes
+
+
+async def scrape_feed_sources(
+    session: AsyncSession,
+    subscriptions: dict[str, list[int]],
+    deadline: float | None = None,
+) -> dict[int, OrgScrapeResult]:
+    """Fetch and parse each feed once, then bulk insert its entries for every subscribed org."""
+    results: dict[int, OrgScrapeResult] = defaultdict(OrgScrapeResult)
+    feed_urls = list(subscriptions)
     if not feed_urls:
-        return 0, 0, notes
+        return results
+
+    digests = {url: subscriber_digest(org_ids) for url, org_ids in subscriptions.items()}
+    sources = await load_sources(session, feed_urls)
+    fetched = await fetch_all(
+        get_scraper_client(),
+        feed_urls,
+        deadline,
+        conditional_headers(sources, digests),
+        headers=FEED_HEADERS,
+    )
 
-    headers = {
-        "User-Agent": "SafeScaleAI/1.0 (+https://safescale.ai)",
-        "Accept": "application/rss+xml,application/atom+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
-    async with httpx.AsyncClient(timeout=20.0, headers=headers) as client:
-        for feed_url in feed_urls:
-            try:
-                response = await client.get(feed_url)
-                response.raise_for_status()
-            except httpx.HTTPError as exc:
-                notes.append(f"Failed to fetch feed {feed_url}: {exc}")
-                continue
-
-            parsed = feedparser.parse(response.text)
-            if parsed.bozo:
-                notes.append(f"Malformed feed {feed_url}")
-                continue
-
-            for entry in parsed.entries:
-                title = (entry.get("title") or "").strip()
-                summary_html = (entry.get("summary") or entry.get("description") or "").strip()
-                link = (entry.get("link") or "").strip()
-                published = (entry.get("published") or entry.get("updated") or "").strip()
-                summary_text = (
-                    BeautifulSoup(summary_html, "html.parser").get_text(" ", strip=True)
-                    if summary_html
-                    else ""
-                )
-                combined = f"{title} {summary_text}".strip()
-                if not combined:
-                    continue
-                matched = _keyword_match(combined)
-                if settings.scraper_feed_require_keyword and not matched:
-                    continue
-
-                if not link:
-                    notes.append(f"Feed entry missing link in {feed_url}")
-                    continue
-
-                exists = await session.execute(
-                    select(RegulatoryAlert).where(
-                        RegulatoryAlert.source_url == link,
-                        RegulatoryAlert.org_id == org_id,
-                    )
-                )
-                if exists.scalar_one_or_none():
-                    continue
+    for result in fetched:
+        feed_url = result.url
+        org_ids = subscriptions[feed_url]
+        source = sources[feed_url]
+        for org_id in org_ids:
+            results[org_id].scanned += 1
+        if result.error:
+            reschedule(source, result.error)
+            _note(results, org_ids, f"Failed to fetch feed {feed_url}: {result.error}")
+            continue
+        change = record_fetch(source, result, digests[feed_url])
+        if not change.needs_processing or result.content is None:
+            reschedule(source)
+            _note(results, org_ids, f"Unchanged since last check: {feed_url}")
+            continue
 
-                keyword_note = (
-                    "Keyword match: " + ", ".join([kw for kw in KEYWORDS if kw in combined.lower()])
-                    if matched
-                    else "Feed item ingested"
-                )
-                alert = RegulatoryAlert(
-                    title=title[:200] if title else "Regulatory update",
-                    summary=summary_text[:500] if summary_text else keyword_note,
-                    severity="Medium" if matched else "Low",
-                    source_url=link,
-                    published_at=published or datetime.utcnow().strftime("%b %d, %Y"),
-                    raw_payload={"feed": feed_url},
-                    org_id=org_id,
-                )
-                session.add(alert)
-                await session.commit()
-                alerts_created += 1
+        # Raw bytes plus the response headers let feedparser pick the declared encoding.
+        parsed = feedparser.parse(result.content, response_headers=dict(result.headers or {}))
+        # A feed cut off by the byte cap still yields the entries parsed before the cut.
+        if parsed.bozo and not parsed.entries:
+            reschedule(source, "malformed feed")
+            _note(results, org_ids, f"Malformed feed {feed_url}")
+            continue
+        reschedule(source, changed=change.content_changed)
 
-            notes.append(f"Parsed feed {feed_url}")
+        alerts, entry_notes = _feed_alerts(parsed, feed_url)
+        for note in entry_notes:
+            _note(results, org_ids, note)
+        rows = [{**alert, "org_id": org_id} for org_id in org_ids for alert in alerts]
+        for org_id, _ in await insert_alerts(session, rows):
+            results[org_id].created += 1
+        await session.commit()
+        _note(results, org_ids, f"Parsed feed {feed_url}")
 
-    return len(feed_urls), alerts_created, notes
+    await session.commit()
+    return results
 
 
-async def record_scraper_run(
-    session: AsyncSession,
+async def scrape_urls(
+    session: AsyncSession, urls: list[str], org_id: int, deadline: float | None = None
+) -> tuple[int, int, list[str], list[str]]:
+    subscriptions = {url: [org_id] for url in dict.fromkeys(urls)}
+    results, discovered = await scrape_page_sources(session, subscriptions, deadline)
+    result = results.get(org_id) or OrgScrapeResult()
+    return len(subscriptions), result.created, result.notes, list(discovered)
+
+
+async def scrape_feeds(
+    session: AsyncSession, feed_urls: list[str], org_id: int, deadline: float | None = None
+) -> tuple[int, int, list[str]]:
+    subscriptions = {url: [org_id] for url in dict.fromkeys(feed_urls)}
+    results = await scrape_feed_sources(session, subscriptions, deadline)
+    result = results.get(org_id) or OrgScrapeResult()
+    return len(subscriptions), result.created, result.notes
+
+
+def build_scraper_run(
     scanned: int,
     created: int,
     notes: list[str],
@@ -182,8 +488,11 @@ async def record_scraper_run(
         status = "partial"
     if scanned == 0:
         status = "no_urls"
+    unchanged = sum(1 for note in notes if note.startswith("Unchanged since last check"))
+    if unchanged:
+        notes = notes + [f"{unchanged} of {scanned} sources unchanged since last check"]
 
-    record = ScraperRun(
+    return ScraperRun(
         status=status,
         scanned=scanned,
         alerts_created=created,
@@ -192,32 +501,170 @@ async def record_scraper_run(
         finished_at=datetime.utcnow(),
         org_id=org_id,
     )
+
+
+async def record_scraper_run(
+    session: AsyncSession,
+    scanned: int,
+    created: int,
+    notes: list[str],
+    started_at: datetime,
+    org_id: int,
+) -> ScraperRun:
+    record = build_scraper_run(scanned, created, notes, started_at, org_id)
     session.add(record)
+    await record_scraper_runs(session, [record])
     await session.commit()
     await session.refresh(record)
     return record
 
 
-def next_run_at(last_finished: datetime | None) -> str | None:
-    if not last_finished:
-        return None
-    return (last_finished + timedelta(seconds=SCRAPER_INTERVAL_SECONDS)).isoformat()
+async def org_sources(session: AsyncSession, org_id: int) -> list[ScraperSource]:
+    """Sources the org's scrape covers; ones never fetched are returned unsaved."""
+
+    async def lookup(urls: list[str]) -> dict[str, ScraperSource]:
+        result = await session.execute(select(ScraperSource).where(ScraperSource.url.in_(urls)))
+        found = {source.url: source for source in result.scalars().all()}
+        return {
+            url: found.get(url) or ScraperSource(url=url, discovered_feeds=[], consecutive_errors=0)
+            for url in urls
+        }
+
+    page_urls = list(dict.fromkeys(settings.scraper_urls))
+    feed_urls = await get_scraper_feed_urls(session, org_id)
+    pages = await lookup(page_urls)
+    discovered = [feed for url in page_urls for feed in pages[url].discovered_feeds or []]
+    sources = await lookup(list(dict.fromkeys(page_urls + feed_urls + discovered)))
+    return list(sources.values())
+
+
+async def reset_org_sources(session: AsyncSession, org_id: int) -> int:
+    """Make every source the org reads deliver to its subscribers again.
+
+    Sources remember which subscriber set already received their content, so
+    after an org's alerts are deleted an unchanged page would never re-create
+    them. Clearing that digest (and making the source due) forces the next
+    fetch to skip the validators and re-process the content; other orgs'
+    duplicates are absorbed by the (org_id, source_url) unique constraint.
+    Call before the org's feed settings are deleted.
+    """
+    urls = list(
+        dict.fromkeys(
+            [
+                *settings.scraper_urls,
+                *settings.scraper_feed_urls,
+                *await get_scraper_feed_urls(session, org_id),
+            ]
+        )
+    )
+    if not urls:
+        return 0
+    result = await session.execute(
+        select(ScraperSource.discovered_feeds).where(
+            ScraperSource.url.in_(settings.scraper_urls)
+        )
+    )
+    for feeds in result.scalars().all():
+        urls.extend(feed for feed in feeds or [] if feed not in urls)
+    result = await session.execute(
+        update(ScraperSource)
+        .where(ScraperSource.url.in_(urls))
+        .values(subscribers=None, next_run_at=None)
+    )
+    return result.rowcount or 0
+
+
+async def seconds_until_next_run(session: AsyncSession) -> float:
+    result = await session.execute(select(func.min(ScraperSource.next_run_at)))
+    earliest = result.scalar_one_or_none()
+    if earliest is None:
+        return SCRAPER_TICK_SECONDS
+    remaining = (earliest - datetime.now(timezone.utc)).total_seconds()
+    # New sources have no row until their first fetch, so keep polling on the tick as well.
+    return min(SCRAPER_TICK_SECONDS, max(1.0, remaining))
 
 
-async def scraper_loop(session_factory, urls: list[str], org_id: int) -> None:
+async def run_scrape_cycle(
+    session: AsyncSession,
+    org_ids: list[int] | None = None,
+    deadline: float | None = None,
+    due_only: bool = True,
+) -> dict[int, ScraperRun]:
+    """Scrape every distinct due source once and record a ScraperRun for each affected org."""
+    started_at = datetime.utcnow()
+    now = datetime.now(timezone.utc)
+    deadline = deadline if deadline is not None else run_deadline()
+    if org_ids is None:
+        result = await session.execute(select(Organization.id).order_by(Organization.id))
+        org_ids = list(result.scalars().all())
+    if not org_ids:
+        return {}
+
+    feeds_by_org = await get_scraper_feed_urls_by_org(session, org_ids)
+    page_subscriptions = {url: list(org_ids) for url in dict.fromkeys(settings.scraper_urls)}
+    page_sources = await load_sources(session, list(page_subscriptions))
+    due_pages = {
+        url: subscribers
+        for url, subscribers in page_subscriptions.items()
+        if not due_only or is_due(page_sources[url], now)
+    }
+    page_results, discovered = await scrape_page_sources(session, due_pages, deadline)
+    for url, subscribers in page_subscriptions.items():
+        if url in due_pages:
+            continue
+        # Pages that are not due still contribute the feeds found on their last fetch.
+        for feed_url in page_sources[url].discovered_feeds or []:
+            current = discovered.setdefault(feed_url, [])
+            current.extend(org_id for org_id in subscribers if org_id not in current)
+
+    feed_subscriptions: dict[str, list[int]] = {}
+    for org_id in org_ids:
+        for feed_url in feeds_by_org[org_id]:
+            feed_subscriptions.setdefault(feed_url, []).append(org_id)
+    for feed_url, subscribers in discovered.items():
+        current = feed_subscriptions.setdefault(feed_url, [])
+        current.extend(org_id for org_id in subscribers if org_id not in current)
+    if due_only:
+        feed_sources = await load_sources(session, list(feed_subscriptions))
+        feed_subscriptions = {
+            url: subscribers
+            for url, subscribers in feed_subscriptions.items()
+            if is_due(feed_sources[url], now)
+        }
+    feed_results = await scrape_feed_sources(session, feed_subscriptions, deadline)
+
+    runs: dict[int, ScraperRun] = {}
+    for org_id in org_ids:
+        pages = page_results.get(org_id) or OrgScrapeResult()
+        feeds = feed_results.get(org_id) or OrgScrapeResult()
+        if due_only and not pages.scanned + feeds.scanned:
+            continue
+        runs[org_id] = build_scraper_run(
+            pages.scanned + feeds.scanned,
+            pages.created + feeds.created,
+            pages.notes + feeds.notes,
+            started_at,
+            org_id,
+        )
+    session.add_all(runs.values())
+    await record_scraper_runs(session, runs.values())
+    await session.commit()
+    return runs
+
+
+async def scraper_loop(session_factory, org_ids: list[int] | None = None) -> None:
     while True:
-        started_at = datetime.utcnow()
-        async with session_factory() as session:
-            feed_urls = await get_scraper_feed_urls(session, org_id)
-            url_scanned, url_created, url_notes, discovered_feeds = await scrape_urls(
-                session, urls, org_id
-            )
-            combined_feeds = list(dict.fromkeys(feed_urls + discovered_feeds))
-            feed_scanned, feed_created, feed_notes = await scrape_feeds(
-                session, combined_feeds, org_id
-            )
-            scanned = url_scanned + feed_scanned
-            created = url_created + feed_created
-            notes = url_notes + feed_notes
-            await record_scraper_run(session, scanned, created, notes, started_at, org_id)
-        await asyncio.sleep(SCRAPER_INTERVAL_SECONDS)
+        delay = SCRAPER_TICK_SECONDS
+        try:
+            async with session_factory() as session:
+                runs = await run_scrape_cycle(session, org_ids)
+                delay = await seconds_until_next_run(session)
+            if runs:
+                logger.info(
+                    "Scraper cycle finished for %d orgs (%s)",
+                    len(runs),
+                    scraper_http_metrics.summary(),
+                )
+        except Exception:
+            logger.exception("Scraper cycle failed")
+        await asyncio.sleep(delay)
@@ -0,0 +1,106 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.compliance import ScraperJob, ScraperRun
+from app.schemas.audit import AuditLogCreate
+from app.services.audit import log_audit_event
+from app.services.scraper import record_scraper_run, run_deadline, scrape_feeds, scrape_urls
+from app.services.settings import get_scraper_feed_urls
+
+logger = logging.getLogger("safescale.scraper")
+
+
+async def enqueue_scraper_job(
+    session: AsyncSession, org_id: int, urls: list[str] | None = None
+) -> ScraperJob:
+    job = ScraperJob(org_id=org_id, status="queued", urls=urls or None)
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+    return job
+
+
+async def claim_scraper_job(session: AsyncSession) -> ScraperJob | None:
+    # Jobs left "running" by a worker that died are picked up again once they
+    # have outlived the run timeout.
+    stale_before = datetime.now(timezone.utc) - timedelta(
+        seconds=settings.scraper_run_timeout_seconds * 2
+    )
+    result = await session.execute(
+        select(ScraperJob)
+        .where(
+            or_(
+                ScraperJob.status == "queued",
+                and_(ScraperJob.status == "running", ScraperJob.started_at < stale_before),
+            )
+        )
+        .order_by(ScraperJob.requested_at, ScraperJob.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    job = result.scalar_one_or_none()
+    if job is None:
+        await session.rollback()
+        return None
+    job.status = "running"
+    job.started_at = datetime.now(timezone.utc)
+    await session.commit()
+    return job
+
+
+async def run_scraper_job(session: AsyncSession, job: ScraperJob) -> ScraperRun:
+    urls = job.urls or settings.scraper_urls
+    started_at = datetime.utcnow()
+    deadline = run_deadline()
+    url_scanned, url_created, url_notes, discovered_feeds = await scrape_urls(
+        session, urls, job.org_id, deadline
+    )
+    feed_urls = await get_scraper_feed_urls(session, job.org_id)
+    combined_feeds = list(dict.fromkeys(feed_urls + discovered_feeds))
+    feed_scanned, feed_created, feed_notes = await scrape_feeds(
+        session, combined_feeds, job.org_id, deadline
+    )
+    scanned = url_scanned + feed_scanned
+    created = url_created + feed_created
+    notes = url_notes + feed_notes
+    run = await record_scraper_run(session, scanned, created, notes, started_at, job.org_id)
+    await log_audit_event(
+        session,
+        AuditLogCreate(
+            action="scraper_run",
+            actor="system",
+            summary=f"Scanned {scanned} URLs, created {created} alerts",
+            metadata={"urls": urls, "job_id": job.id},
+        ),
+        job.org_id,
+    )
+    return run
+
+
+async def process_scraper_job(session: AsyncSession, job: ScraperJob) -> None:
+    try:
+        run = await run_scraper_job(session, job)
+    except Exception as exc:
+        logger.exception("Scraper job %s failed", job.id)
+        await session.rollback()
+        job = await session.get(ScraperJob, job.id)
+        if job is None:
+            return
+        job.status = "failed"
+        job.error = str(exc)[:500] or exc.__class__.__name__
+    else:
+        job.status = "done"
+        job.run_id = run.id
+    job.finished_at = datetime.now(timezone.utc)
+    await session.commit()
+
+
+async def get_scraper_job(session: AsyncSession, org_id: int, job_id: int) -> ScraperJob | None:
+    result = await session.execute(
+        select(ScraperJob).where(ScraperJob.id == job_id, ScraperJob.org_id == org_id)
+    )
+    return result.scalar_one_or_none()
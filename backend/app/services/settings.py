@@ -1,5 +1,6 @@
 import json
 
+import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -40,8 +41,7 @@ async def get_embedding_threshold(session: AsyncSession, org_id: int) -> float:
         return settings.embedding_similarity_threshold
 
 
-async def get_scraper_feed_urls(session: AsyncSession, org_id: int) -> list[str]:
-    value = await get_setting(session, org_id, "scraper_feed_urls")
+def parse_scraper_feed_urls(value: str | None) -> list[str]:
     if value is None:
         return settings.scraper_feed_urls
     try:
@@ -54,6 +54,36 @@ async def get_scraper_feed_urls(session: AsyncSession, org_id: int) -> list[str]
     return cleaned
 
 
+async def get_scraper_feed_urls(session: AsyncSession, org_id: int) -> list[str]:
+    value = await get_setting(session, org_id, "scraper_feed_urls")
+    return parse_scraper_feed_urls(value)
+
+
+async def get_scraper_feed_urls_by_org(
+    session: AsyncSession, org_ids: list[int]
+) -> dict[int, list[str]]:
+    result = await session.execute(
+        select(AppSetting.org_id, AppSetting.value).where(
+            AppSetting.key == "scraper_feed_urls", AppSetting.org_id.in_(org_ids)
+        )
+    )
+    values = dict(result.all())
+    return {org_id: parse_scraper_feed_urls(values.get(org_id)) for org_id in org_ids}
+
+
+def _check_feed_url(url: str) -> None:
+    # Parse with the scraper's own client library so accepted URLs are fetchable.
+    try:
+        parsed = httpx.URL(url)
+        host, port = parsed.host, parsed.port
+    except (httpx.InvalidURL, ValueError) as exc:  # IDNA errors are ValueErrors
+        raise ValueError(f"Invalid feed URL {url!r}: {exc}") from exc
+    if parsed.scheme not in ("http", "https") or not host:
+        raise ValueError(f"Feed URL must be an absolute http(s) URL: {url!r}")
+    if any(char.isspace() for char in url) or not 0 < (port or 443) < 65536:
+        raise ValueError(f"Invalid feed URL {url!r}")
+
+
 async def set_scraper_feed_urls(session: AsyncSession, org_id: int, urls: list[str]) -> AppSetting:
     cleaned = []
     seen = set()
@@ -61,6 +91,7 @@ async def set_scraper_feed_urls(session: AsyncSession, org_id: int, urls: list[s
         normalized = item.strip()
         if not normalized or normalized in seen:
             continue
+        _check_feed_url(normalized)
         cleaned.append(normalized)
         seen.add(normalized)
     return await set_setting(session, org_id, "scraper_feed_urls", json.dumps(cleaned))
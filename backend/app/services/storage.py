@@ -1,15 +1,80 @@
+import asyncio
+import hashlib
+import os
+import time
 from pathlib import Path
 from uuid import uuid4
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.compliance import PolicyAudit
+
+ORPHAN_GRACE_SECONDS = 3600
+
 
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def save_policy_file(storage_dir: Path, filename: str, content: bytes) -> Path:
-    ensure_dir(storage_dir)
+def blob_path(storage_dir: Path, digest: str, extension: str) -> Path:
+    return storage_dir / digest[:2] / digest[2:4] / f"{digest}{extension}"
+
+
+def _write_blob(target: Path, content: bytes) -> None:
+    if target.exists():
+        # Refresh the mtime so a concurrent sweep treats the blob as recently used.
+        os.utime(target)
+        return
+    ensure_dir(target.parent)
+    tmp = target.with_name(f"{target.name}.{uuid4().hex}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, target)
+
+
+async def save_policy_file(storage_dir: Path, filename: str, content: bytes) -> Path:
     safe_name = Path(filename).name if filename else "policy.pdf"
-    extension = Path(safe_name).suffix or ".pdf"
-    target = storage_dir / f"{uuid4().hex}{extension}"
-    target.write_bytes(content)
+    extension = (Path(safe_name).suffix or ".pdf").lower()
+    digest = hashlib.sha256(content).hexdigest()
+    target = blob_path(storage_dir, digest, extension)
+    await asyncio.to_thread(_write_blob, target, content)
     return target
+
+
+def _blob_for(path: Path) -> Path:
+    # Derived files (extraction artifacts, rendered reports) are stored as
+    # "<blob name>.<suffix>" next to the blob they belong to.
+    parts = path.name.split(".")
+    return path.with_name(".".join(parts[:2]))
+
+
+def _sweep(storage_dir: Path, referenced: set[Path], grace_seconds: int) -> int:
+    if not storage_dir.exists():
+        return 0
+    cutoff = time.time() - grace_seconds
+    removed = 0
+    for path in sorted(storage_dir.rglob("*"), reverse=True):
+        if path.is_dir():
+            if path != storage_dir and not any(path.iterdir()):
+                path.rmdir()
+            continue
+        if _blob_for(path).resolve() in referenced:
+            continue
+        try:
+            if path.stat().st_mtime > cutoff:
+                continue
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        removed += 1
+    return removed
+
+
+async def collect_orphaned_policy_files(
+    session: AsyncSession,
+    storage_dir: Path,
+    grace_seconds: int = ORPHAN_GRACE_SECONDS,
+) -> int:
+    result = await session.execute(select(PolicyAudit.file_path).distinct())
+    referenced = {Path(file_path).resolve() for file_path in result.scalars().all() if file_path}
+    return await asyncio.to_thread(_sweep, storage_dir, referenced, grace_seconds)
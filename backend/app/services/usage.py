@@ -0,0 +1,105 @@
+from datetime import date
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.compliance import UsageDaily, UsageEvent
+from app.services.rollups import utc_day
+
+BILLABLE_EVENT_TYPES = ("policy_audit", "compliance_scan")
+
+
+async def add_usage_event(
+    session: AsyncSession,
+    org_id: int,
+    event_type: str,
+    unit_cost: float,
+    meta: dict[str, Any],
+    units: int = 1,
+) -> None:
+    """Add a usage event and fold it into the daily rollup; the caller commits."""
+    total_cost = unit_cost * units
+    session.add(
+        UsageEvent(
+            event_type=event_type,
+            units=units,
+            unit_cost=unit_cost,
+            total_cost=total_cost,
+            meta=meta,
+            org_id=org_id,
+        )
+    )
+    stmt = insert(UsageDaily).values(
+        org_id=org_id,
+        day=utc_day(func.now()),
+        event_type=event_type,
+        event_count=1,
+        units=units,
+        total_cost=total_cost,
+        updated_at=func.now(),
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[UsageDaily.org_id, UsageDaily.day, UsageDaily.event_type],
+            set_={
+                "event_count": UsageDaily.event_count + stmt.excluded.event_count,
+                "units": UsageDaily.units + stmt.excluded.units,
+                "total_cost": UsageDaily.total_cost + stmt.excluded.total_cost,
+                "updated_at": func.now(),
+            },
+        )
+    )
+
+
+async def backfill_usage_rollups(session: AsyncSession, org_id: int | None = None) -> int:
+    """Rebuild daily usage rollups from usage_event; returns the number of rows written."""
+    source = select(
+        UsageEvent.org_id,
+        utc_day(UsageEvent.created_at).label("day"),
+        UsageEvent.event_type,
+        func.count(),
+        func.sum(UsageEvent.units),
+        func.sum(UsageEvent.total_cost),
+    ).group_by(UsageEvent.org_id, "day", UsageEvent.event_type)
+    if org_id is not None:
+        source = source.where(UsageEvent.org_id == org_id)
+    stmt = insert(UsageDaily).from_select(
+        ["org_id", "day", "event_type", "event_count", "units", "total_cost"], source
+    )
+    # Overwrite rather than add, so the backfill can be re-run safely.
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UsageDaily.org_id, UsageDaily.day, UsageDaily.event_type],
+        set_={
+            "event_count": stmt.excluded.event_count,
+            "units": stmt.excluded.units,
+            "total_cost": stmt.excluded.total_cost,
+            "updated_at": func.now(),
+        },
+    )
+    result = await session.execute(stmt)
+    await session.commit()
+    return result.rowcount or 0
+
+
+async def usage_totals(
+    session: AsyncSession,
+    org_id: int,
+    start: date | None = None,
+    end: date | None = None,
+    event_types: tuple[str, ...] = BILLABLE_EVENT_TYPES,
+) -> tuple[float, int]:
+    """Total cost and event count between two UTC days, both inclusive."""
+    if start and end and start > end:
+        raise ValueError("start must not be after end")
+    stmt = select(
+        func.coalesce(func.sum(UsageDaily.total_cost), 0.0),
+        func.coalesce(func.sum(UsageDaily.event_count), 0),
+    ).where(UsageDaily.org_id == org_id, UsageDaily.event_type.in_(event_types))
+    if start:
+        stmt = stmt.where(UsageDaily.day >= start)
+    if end:
+        stmt = stmt.where(UsageDaily.day <= end)
+    total_cost, total_events = (await session.execute(stmt)).one()
+    return float(total_cost), int(total_events)
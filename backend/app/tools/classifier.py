@@ -0,0 +1,135 @@
+"""Train and benchmark the local document classifier.
+
+    python -m app.tools.classifier train [--org-id N] [--output PATH]
+    python -m app.tools.classifier benchmark [--org-id N] [--holdout 0.2]
+
+Training samples are stored policy audits: the extracted text of each
+audit's PDF labelled with its recorded doc_type and jurisdiction.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from pathlib import Path
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db import AsyncSessionLocal
+from app.models.compliance import PolicyAudit
+from app.services.classifier import _heuristic_classify
+from app.services.extraction import load_or_extract
+from app.services.ml_classifier import train_model
+
+
+async def load_samples(org_id: int | None) -> list[tuple[str, str, str]]:
+    stmt = select(PolicyAudit.file_path, PolicyAudit.doc_type, PolicyAudit.jurisdiction)
+    if org_id is not None:
+        stmt = stmt.where(PolicyAudit.org_id == org_id)
+    async with AsyncSessionLocal() as session:
+        rows = (await session.execute(stmt.order_by(PolicyAudit.id))).all()
+
+    samples: list[tuple[str, str, str]] = []
+    seen: set[str] = set()
+    for file_path, doc_type, jurisdiction in rows:
+        path = Path(file_path)
+        key = f"{path.resolve()}:{doc_type}:{jurisdiction}"
+        if key in seen or not path.exists():
+            continue
+        seen.add(key)
+        try:
+            document = await asyncio.to_thread(load_or_extract, path)
+        except ValueError:
+            continue
+        if document.text.strip():
+            samples.append((document.text, doc_type or "general", jurisdiction or "general"))
+    return samples
+
+
+def _accuracy(predicted: list[str], expected: list[str]) -> float:
+    if not expected:
+        return 0.0
+    return sum(1 for p, e in zip(predicted, expected) if p == e) / len(expected)
+
+
+def _latency_summary(samples_us: list[float]) -> str:
+    ordered = sorted(samples_us)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50 {statistics.median(ordered):.0f}us, p95 {p95:.0f}us"
+
+
+async def train(args: argparse.Namespace) -> None:
+    samples = await load_samples(args.org_id)
+    if not samples:
+        raise SystemExit("No labelled policy audits with stored files found")
+    texts, doc_types, jurisdictions = (list(column) for column in zip(*samples))
+    model = train_model(texts, doc_types, jurisdictions)
+    output = Path(args.output)
+    model.save(output)
+    print(f"Trained on {len(samples)} documents -> {output}")
+    print(f"doc_type classes: {', '.join(model.doc_type.labels)}")
+    print(f"jurisdiction classes: {', '.join(model.jurisdiction.labels)}")
+
+
+async def benchmark(args: argparse.Namespace) -> None:
+    samples = await load_samples(args.org_id)
+    if len(samples) < 2:
+        raise SystemExit("Need at least two labelled policy audits to benchmark")
+    random.Random(args.seed).shuffle(samples)
+    split = max(1, int(len(samples) * (1 - args.holdout)))
+    train_set, test_set = samples[:split], samples[split:] or samples[:1]
+
+    started = time.perf_counter()
+    model = train_model(*(list(column) for column in zip(*train_set)))
+    print(f"Trained on {len(train_set)} documents in {time.perf_counter() - started:.2f}s")
+
+    results: dict[str, tuple[list[str], list[str], list[float]]] = {}
+    for name in ("local", "heuristic"):
+        doc_types: list[str] = []
+        jurisdictions: list[str] = []
+        latencies: list[float] = []
+        for text, _, _ in test_set:
+            started = time.perf_counter()
+            if name == "local":
+                doc_type, _, jurisdiction, _ = model.predict(text)
+            else:
+                classification = _heuristic_classify(text)
+                doc_type, jurisdiction = classification.doc_type, classification.jurisdiction
+            latencies.append((time.perf_counter() - started) * 1_000_000)
+            doc_types.append(doc_type)
+            jurisdictions.append(jurisdiction)
+        results[name] = (doc_types, jurisdictions, latencies)
+
+    expected_doc_types = [doc_type for _, doc_type, _ in test_set]
+    expected_jurisdictions = [jurisdiction for _, _, jurisdiction in test_set]
+    print(f"Evaluated on {len(test_set)} held-out documents")
+    for name, (doc_types, jurisdictions, latencies) in results.items():
+        print(
+            f"{name:>9}: doc_type {_accuracy(doc_types, expected_doc_types):.1%}, "
+            f"jurisdiction {_accuracy(jurisdictions, expected_jurisdictions):.1%}, "
+            f"{_latency_summary(latencies)}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.tools.classifier")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    train_parser = subparsers.add_parser("train", help="Train a model from stored audits")
+    train_parser.add_argument("--org-id", type=int, default=None)
+    train_parser.add_argument("--output", default=settings.local_classifier_path)
+
+    bench_parser = subparsers.add_parser("benchmark", help="Compare local model and heuristic")
+    bench_parser.add_argument("--org-id", type=int, default=None)
+    bench_parser.add_argument("--holdout", type=float, default=0.2)
+    bench_parser.add_argument("--seed", type=int, default=7)
+
+    args = parser.parse_args()
+    handler = train if args.command == "train" else benchmark
+    asyncio.run(handler(args))
+
+
+if __name__ == "__main__":
+    main()
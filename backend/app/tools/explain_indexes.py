@@ -0,0 +1,140 @@
+"""Check that listing and dashboard queries use the per-org recency indexes.
+
+    python -m app.tools.explain_indexes [--org-id N]
+
+Runs EXPLAIN (FORMAT JSON) on each query against a migrated database and
+fails unless the plan reaches the expected migration 017 index through an
+Index Scan, without a Sort node. Sequential and bitmap scans are disabled for
+the check, so small dev databases still report whether the index is usable.
+Exits non-zero if any query regresses, so it can gate CI.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db import engine
+from app.models.audit import AuditLog
+from app.models.compliance import PolicyAudit, RegulatoryAlert, ScraperRun
+from app.services.org_summary import RECENT_ALERTS, ROLLING_AUDITS
+from app.services.pagination import encode_cursor, keyset_statement
+
+INDEX_SCANS = {"Index Scan", "Index Only Scan"}
+PAGE_SIZE = 25
+
+
+def _checks(org_id: int) -> list[tuple[str, str, Select]]:
+    cursor = encode_cursor(datetime.now(timezone.utc), 2**31 - 1)
+    pages = [
+        ("alerts", "regulatory_alert_org_created_at_idx", RegulatoryAlert),
+        ("policy audits", "policy_audit_org_created_at_idx", PolicyAudit),
+        ("audit log", "audit_log_org_created_at_idx", AuditLog),
+    ]
+    checks = []
+    for label, index, model in pages:
+        base = select(model).where(model.org_id == org_id)
+        for page_cursor, suffix in ((None, "first page"), (cursor, "after cursor")):
+            checks.append(
+                (
+                    f"{label} {suffix}",
+                    index,
+                    keyset_statement(base, model.created_at, model.id, page_cursor, PAGE_SIZE),
+                )
+            )
+    checks += [
+        (
+            "latest policy audit",
+            "policy_audit_org_created_at_idx",
+            select(PolicyAudit)
+            .where(PolicyAudit.org_id == org_id)
+            .order_by(PolicyAudit.created_at.desc())
+            .limit(1),
+        ),
+        (
+            "latest scraper run",
+            "scraper_run_org_started_at_idx",
+            select(ScraperRun)
+            .where(ScraperRun.org_id == org_id)
+            .order_by(ScraperRun.started_at.desc())
+            .limit(1),
+        ),
+        (
+            "dashboard recent audits",
+            "policy_audit_org_created_at_idx",
+            select(
+                PolicyAudit.filename,
+                PolicyAudit.score,
+                func.coalesce(func.jsonb_array_length(PolicyAudit.gaps), 0),
+            )
+            .where(PolicyAudit.org_id == org_id)
+            .order_by(PolicyAudit.created_at.desc(), PolicyAudit.id.desc())
+            .limit(ROLLING_AUDITS),
+        ),
+        (
+            "dashboard recent alerts",
+            "regulatory_alert_org_created_at_idx",
+            select(RegulatoryAlert.id, RegulatoryAlert.title, RegulatoryAlert.severity)
+            .where(RegulatoryAlert.org_id == org_id)
+            .order_by(RegulatoryAlert.created_at.desc(), RegulatoryAlert.id.desc())
+            .limit(RECENT_ALERTS),
+        ),
+    ]
+    return checks
+
+
+def _nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+async def _explain(connection: AsyncConnection, stmt: Select) -> dict[str, Any]:
+    sql = stmt.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    # Driver SQL, so ":" inside rendered timestamp literals is not read as a bind.
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    output = result.scalar()
+    if isinstance(output, str):
+        output = json.loads(output)
+    return output[0]["Plan"]
+
+
+async def run(org_id: int) -> bool:
+    ok = True
+    async with engine.connect() as connection:
+        # SET LOCAL only lasts for this transaction, which is rolled back.
+        await connection.execute(text("SET LOCAL enable_seqscan = off"))
+        await connection.execute(text("SET LOCAL enable_bitmapscan = off"))
+        for label, index, stmt in _checks(org_id):
+            nodes = list(_nodes(await _explain(connection, stmt)))
+            scans = [
+                node for node in nodes
+                if node["Node Type"] in INDEX_SCANS and node.get("Index Name") == index
+            ]
+            sorts = any(node["Node Type"] == "Sort" for node in nodes)
+            if scans and not sorts:
+                print(f"ok    {label}: {scans[0]['Node Type']} using {index}")
+                continue
+            ok = False
+            used = sorted({node.get("Index Name") or node["Node Type"] for node in nodes})
+            print(f"FAIL  {label}: expected {index} without a sort, plan used {', '.join(used)}")
+        await connection.rollback()
+    await engine.dispose()
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.tools.explain_indexes")
+    parser.add_argument("--org-id", type=int, default=1)
+    args = parser.parse_args()
+    if not asyncio.run(run(args.org_id)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
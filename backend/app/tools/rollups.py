@@ -0,0 +1,47 @@
+"""Rebuild rollup tables from their source rows.
+
+    python -m app.tools.rollups scores [--org-id N]
+    python -m app.tools.rollups usage [--org-id N]
+
+Rollups are maintained as rows are written; this backfills history recorded
+before a rollup existed, or repairs one after manual edits. Days are rebuilt
+from scratch, so it is safe to re-run.
+"""
+
+import argparse
+import asyncio
+
+from app.db import AsyncSessionLocal
+from app.services.score_history import backfill_score_rollups
+from app.services.usage import backfill_usage_rollups
+
+
+async def scores(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        days = await backfill_score_rollups(session, args.org_id)
+    print(f"Rebuilt {days} daily score rollups")
+
+
+async def usage(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        rows = await backfill_usage_rollups(session, args.org_id)
+    print(f"Rebuilt {rows} daily usage rollups")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.tools.rollups")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scores_parser = subparsers.add_parser("scores", help="Rebuild daily compliance score rollups")
+    scores_parser.add_argument("--org-id", type=int, default=None)
+
+    usage_parser = subparsers.add_parser("usage", help="Rebuild daily usage rollups")
+    usage_parser.add_argument("--org-id", type=int, default=None)
+
+    args = parser.parse_args()
+    handler = scores if args.command == "scores" else usage
+    asyncio.run(handler(args))
+
+
+if __name__ == "__main__":
+    main()
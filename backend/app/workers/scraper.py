@@ -0,0 +1,99 @@
+"""Standalone scraper worker.
+
+    python -m app.workers.scraper
+
+Drains jobs queued by ``POST /scraper/run`` and, when SCRAPER_ENABLED is set,
+runs the scheduled scrape. Any number of workers can run side by side: jobs are
+claimed with ``SKIP LOCKED`` and a Postgres advisory lock keeps a single
+scheduler leader.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.db import build_engine
+from app.models.compliance import Organization
+from app.services.http_client import close_scraper_client
+from app.services.leader import SCRAPER_LEADER_LOCK_ID, run_as_leader
+from app.services.scraper import scraper_loop
+from app.services.scraper_jobs import claim_scraper_job, process_scraper_job
+
+logger = logging.getLogger("safescale.scraper")
+
+
+async def job_loop(session_factory) -> None:
+    while True:
+        try:
+            async with session_factory() as session:
+                job = await claim_scraper_job(session)
+                if job is not None:
+                    logger.info("Running scraper job %s for org %s", job.id, job.org_id)
+                    await process_scraper_job(session, job)
+                    continue
+        except Exception:
+            logger.exception("Scraper job loop failed")
+        await asyncio.sleep(settings.scraper_worker_poll_seconds)
+
+
+async def scheduled_org_ids(session_factory) -> list[int] | None:
+    # Without a pinned org the scheduled scrape fetches each source once for every org.
+    if not settings.scraper_org_api_key:
+        return None
+    async with session_factory() as session:
+        result = await session.execute(
+            select(Organization.id).where(Organization.api_key == settings.scraper_org_api_key)
+        )
+        org_id = result.scalar_one_or_none()
+    return [org_id] if org_id else []
+
+
+async def run_worker() -> None:
+    engine = build_engine(
+        settings.database_url, pool_size=settings.scraper_worker_pool_size, max_overflow=0
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    tasks = [
+        asyncio.create_task(job_loop(session_factory))
+        for _ in range(max(1, settings.scraper_worker_jobs))
+    ]
+    if settings.scraper_enabled:
+        org_ids = await scheduled_org_ids(session_factory)
+        if org_ids is None or org_ids:
+            tasks.append(
+                asyncio.create_task(
+                    run_as_leader(
+                        engine,
+                        SCRAPER_LEADER_LOCK_ID,
+                        lambda: scraper_loop(session_factory, org_ids),
+                        settings.scraper_leader_retry_seconds,
+                        name="scraper",
+                    )
+                )
+            )
+        else:
+            logger.warning("SCRAPER_ORG_API_KEY does not match an org; scheduled scrape disabled")
+    logger.info("Scraper worker started with %d job slots", settings.scraper_worker_jobs)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await close_scraper_client()
+        await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(run_worker())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
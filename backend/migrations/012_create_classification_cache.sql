@@ -0,0 +1,12 @@
+CREATE TABLE IF NOT EXISTS classification_cache (
+  cache_key VARCHAR(64) PRIMARY KEY,
+  doc_type VARCHAR(80) NOT NULL,
+  jurisdiction VARCHAR(40) NOT NULL,
+  reasoning TEXT NOT NULL,
+  provider VARCHAR(40) NOT NULL,
+  model VARCHAR(120) NOT NULL,
+  version VARCHAR(16) NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS classification_cache_created_at_idx ON classification_cache (created_at);
@@ -0,0 +1,11 @@
+CREATE TABLE IF NOT EXISTS scraper_source (
+  id SERIAL PRIMARY KEY,
+  url TEXT NOT NULL UNIQUE,
+  etag VARCHAR(400),
+  last_modified VARCHAR(100),
+  content_hash VARCHAR(64),
+  subscribers VARCHAR(64),
+  discovered_feeds JSONB NOT NULL DEFAULT '[]'::jsonb,
+  checked_at TIMESTAMPTZ,
+  changed_at TIMESTAMPTZ
+);
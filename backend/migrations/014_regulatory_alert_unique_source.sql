@@ -0,0 +1,8 @@
+DELETE FROM regulatory_alert a
+USING regulatory_alert b
+WHERE a.org_id = b.org_id
+  AND a.source_url = b.source_url
+  AND a.id > b.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS regulatory_alert_org_source_url_key
+  ON regulatory_alert (org_id, source_url);
@@ -0,0 +1,8 @@
+ALTER TABLE scraper_source
+ADD COLUMN IF NOT EXISTS interval_seconds INTEGER NOT NULL DEFAULT 3600,
+ADD COLUMN IF NOT EXISTS next_run_at TIMESTAMPTZ,
+ADD COLUMN IF NOT EXISTS consecutive_errors INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN IF NOT EXISTS last_error TEXT;
+
+CREATE INDEX IF NOT EXISTS scraper_source_next_run_at_idx
+  ON scraper_source (next_run_at);
@@ -0,0 +1,16 @@
+CREATE TABLE IF NOT EXISTS scraper_job (
+  id SERIAL PRIMARY KEY,
+  org_id INTEGER NOT NULL REFERENCES organization(id),
+  status VARCHAR(20) NOT NULL DEFAULT 'queued',
+  urls JSONB,
+  run_id INTEGER REFERENCES scraper_run(id),
+  error TEXT,
+  requested_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  started_at TIMESTAMPTZ,
+  finished_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS scraper_job_org_id_idx ON scraper_job (org_id);
+CREATE INDEX IF NOT EXISTS scraper_job_pending_idx
+  ON scraper_job (requested_at)
+  WHERE status IN ('queued', 'running');
@@ -0,0 +1,28 @@
+-- Per-org listings filter on org_id and read the newest rows first; these
+-- indexes let them stop after LIMIT rows instead of sorting the org's history.
+-- CONCURRENTLY keeps writes flowing on large tables (psql -f runs each
+-- statement outside a transaction).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS policy_audit_org_created_at_idx
+  ON policy_audit (org_id, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS regulatory_alert_org_created_at_idx
+  ON regulatory_alert (org_id, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS compliance_score_org_created_at_idx
+  ON compliance_score (org_id, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS audit_log_org_created_at_idx
+  ON audit_log (org_id, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS scraper_run_org_started_at_idx
+  ON scraper_run (org_id, started_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS usage_event_org_created_at_idx
+  ON usage_event (org_id, created_at DESC, id DESC);
+
+ANALYZE policy_audit;
+ANALYZE regulatory_alert;
+ANALYZE compliance_score;
+ANALYZE audit_log;
+ANALYZE scraper_run;
+ANALYZE usage_event;
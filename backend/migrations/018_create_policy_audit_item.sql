@@ -0,0 +1,51 @@
+-- One row per checklist outcome of an audit, so gap/match analytics can be
+-- answered with SQL aggregates instead of unpacking the JSON columns.
+CREATE TABLE IF NOT EXISTS policy_audit_item (
+  id SERIAL PRIMARY KEY,
+  org_id INTEGER NOT NULL REFERENCES organization(id),
+  audit_id INTEGER NOT NULL REFERENCES policy_audit(id) ON DELETE CASCADE,
+  checklist_item_id INTEGER REFERENCES compliance_checklist(id) ON DELETE SET NULL,
+  checklist_item TEXT NOT NULL,
+  matched BOOLEAN NOT NULL,
+  severity VARCHAR(20),
+  distance DOUBLE PRECISION,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS policy_audit_item_audit_id_idx
+  ON policy_audit_item (audit_id);
+CREATE INDEX IF NOT EXISTS policy_audit_item_org_created_at_idx
+  ON policy_audit_item (org_id, created_at);
+CREATE INDEX IF NOT EXISTS policy_audit_item_org_checklist_idx
+  ON policy_audit_item (org_id, checklist_item_id, matched);
+
+-- Backfill existing audits from their JSON. Distances were never stored, and
+-- checklist ids are recovered by text where the item still exists.
+INSERT INTO policy_audit_item (
+  org_id, audit_id, checklist_item_id, checklist_item, matched, severity, distance, created_at
+)
+SELECT outcome.org_id, outcome.audit_id, checklist.id, outcome.checklist_item,
+       outcome.matched, outcome.severity, NULL, outcome.created_at
+FROM (
+  SELECT a.org_id, a.id AS audit_id, gap.value->>'checklist_item' AS checklist_item,
+         FALSE AS matched, COALESCE(gap.value->>'severity', 'medium') AS severity, a.created_at
+  FROM policy_audit a
+  CROSS JOIN LATERAL jsonb_array_elements(a.gaps) AS gap(value)
+  UNION ALL
+  SELECT a.org_id, a.id, item.value, TRUE, NULL, a.created_at
+  FROM policy_audit a
+  CROSS JOIN LATERAL jsonb_array_elements_text(a.matched_items) AS item(value)
+) AS outcome
+LEFT JOIN LATERAL (
+  SELECT c.id
+  FROM compliance_checklist c
+  WHERE c.org_id = outcome.org_id AND c.text = outcome.checklist_item
+  ORDER BY c.id
+  LIMIT 1
+) AS checklist ON TRUE
+WHERE outcome.checklist_item IS NOT NULL
+  AND NOT EXISTS (
+    SELECT 1 FROM policy_audit_item existing WHERE existing.audit_id = outcome.audit_id
+  );
+
+ANALYZE policy_audit_item;
@@ -0,0 +1,100 @@
+-- One row per org with everything the dashboard and compliance scan read,
+-- maintained in the same transaction as the writes it summarises.
+CREATE TABLE IF NOT EXISTS org_summary (
+  org_id INTEGER PRIMARY KEY REFERENCES organization(id),
+  latest_score INTEGER,
+  latest_rating VARCHAR(40),
+  audit_count INTEGER NOT NULL DEFAULT 0,
+  rolling_score INTEGER,
+  recent_audits JSONB NOT NULL DEFAULT '[]'::jsonb,
+  alert_count INTEGER NOT NULL DEFAULT 0,
+  alerts_high INTEGER NOT NULL DEFAULT 0,
+  alerts_medium INTEGER NOT NULL DEFAULT 0,
+  alerts_low INTEGER NOT NULL DEFAULT 0,
+  recent_alerts JSONB NOT NULL DEFAULT '[]'::jsonb,
+  last_scraper_status VARCHAR(40),
+  last_scraper_run_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Backfill from existing data; later writes only apply deltas to these rows.
+INSERT INTO org_summary (
+  org_id, latest_score, latest_rating, audit_count, rolling_score, recent_audits,
+  alert_count, alerts_high, alerts_medium, alerts_low, recent_alerts,
+  last_scraper_status, last_scraper_run_at
+)
+SELECT
+  o.id,
+  score.score,
+  score.rating,
+  (SELECT COUNT(*) FROM policy_audit a WHERE a.org_id = o.id),
+  (
+    SELECT ROUND(AVG(recent.score))::INTEGER
+    FROM (
+      SELECT a.score FROM policy_audit a
+      WHERE a.org_id = o.id
+      ORDER BY a.created_at DESC, a.id DESC
+      LIMIT 3
+    ) AS recent
+  ),
+  COALESCE((
+    SELECT jsonb_agg(
+      jsonb_build_object('filename', recent.filename, 'score', recent.score, 'gaps', recent.gaps)
+      ORDER BY recent.created_at DESC, recent.id DESC
+    )
+    FROM (
+      SELECT a.id, a.filename, a.score, jsonb_array_length(a.gaps) AS gaps, a.created_at
+      FROM policy_audit a
+      WHERE a.org_id = o.id
+      ORDER BY a.created_at DESC, a.id DESC
+      LIMIT 3
+    ) AS recent
+  ), '[]'::jsonb),
+  alerts.total,
+  alerts.high,
+  alerts.medium,
+  alerts.low,
+  COALESCE((
+    SELECT jsonb_agg(
+      jsonb_build_object(
+        'id', recent.id,
+        'title', recent.title,
+        'summary', recent.summary,
+        'severity', recent.severity,
+        'source_url', recent.source_url,
+        'published_at', recent.published_at
+      )
+      ORDER BY recent.created_at DESC, recent.id DESC
+    )
+    FROM (
+      SELECT r.* FROM regulatory_alert r
+      WHERE r.org_id = o.id
+      ORDER BY r.created_at DESC, r.id DESC
+      LIMIT 10
+    ) AS recent
+  ), '[]'::jsonb),
+  run.status,
+  run.finished_at
+FROM organization o
+LEFT JOIN LATERAL (
+  SELECT s.score, s.rating FROM compliance_score s
+  WHERE s.org_id = o.id
+  ORDER BY s.created_at DESC, s.id DESC
+  LIMIT 1
+) AS score ON TRUE
+LEFT JOIN LATERAL (
+  SELECT
+    COUNT(*) AS total,
+    COUNT(*) FILTER (WHERE LOWER(r.severity) = 'high') AS high,
+    COUNT(*) FILTER (WHERE LOWER(r.severity) = 'medium') AS medium,
+    COUNT(*) FILTER (WHERE LOWER(r.severity) = 'low') AS low
+  FROM regulatory_alert r
+  WHERE r.org_id = o.id
+) AS alerts ON TRUE
+LEFT JOIN LATERAL (
+  SELECT sr.status, sr.finished_at FROM scraper_run sr
+  WHERE sr.org_id = o.id
+  ORDER BY sr.started_at DESC, sr.id DESC
+  LIMIT 1
+) AS run ON TRUE
+ON CONFLICT (org_id) DO NOTHING;
@@ -0,0 +1,24 @@
+-- Daily score rollups per org; week and month buckets are folded from these
+-- rows, so history queries stay bounded as compliance_score grows.
+CREATE TABLE IF NOT EXISTS compliance_score_daily (
+  org_id INTEGER NOT NULL REFERENCES organization(id),
+  day DATE NOT NULL,
+  score_count INTEGER NOT NULL DEFAULT 0,
+  score_sum INTEGER NOT NULL DEFAULT 0,
+  score_min INTEGER NOT NULL,
+  score_max INTEGER NOT NULL,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (org_id, day)
+);
+
+-- Backfill; re-run with `python -m app.tools.rollups scores`.
+INSERT INTO compliance_score_daily (org_id, day, score_count, score_sum, score_min, score_max)
+SELECT org_id, (created_at AT TIME ZONE 'UTC')::date, COUNT(*), SUM(score), MIN(score), MAX(score)
+FROM compliance_score
+GROUP BY org_id, (created_at AT TIME ZONE 'UTC')::date
+ON CONFLICT (org_id, day) DO UPDATE SET
+  score_count = EXCLUDED.score_count,
+  score_sum = EXCLUDED.score_sum,
+  score_min = EXCLUDED.score_min,
+  score_max = EXCLUDED.score_max,
+  updated_at = NOW();
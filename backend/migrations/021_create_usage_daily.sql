@@ -0,0 +1,23 @@
+-- Daily usage rollups per org and event type, so billing totals over any date
+-- range sum a few rows instead of scanning usage_event.
+CREATE TABLE IF NOT EXISTS usage_daily (
+  org_id INTEGER NOT NULL REFERENCES organization(id),
+  day DATE NOT NULL,
+  event_type VARCHAR(60) NOT NULL,
+  event_count INTEGER NOT NULL DEFAULT 0,
+  units INTEGER NOT NULL DEFAULT 0,
+  total_cost DOUBLE PRECISION NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  PRIMARY KEY (org_id, day, event_type)
+);
+
+-- Backfill; re-run with `python -m app.tools.rollups usage`.
+INSERT INTO usage_daily (org_id, day, event_type, event_count, units, total_cost)
+SELECT org_id, (created_at AT TIME ZONE 'UTC')::date, event_type, COUNT(*), SUM(units), SUM(total_cost)
+FROM usage_event
+GROUP BY org_id, (created_at AT TIME ZONE 'UTC')::date, event_type
+ON CONFLICT (org_id, day, event_type) DO UPDATE SET
+  event_count = EXCLUDED.event_count,
+  units = EXCLUDED.units,
+  total_cost = EXCLUDED.total_cost,
+  updated_at = NOW();
@@ -6,23 +6,26 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/com
 import { AuditDownloadButton } from "@/components/audit-download-button";
 import { AuditReportViewer } from "@/components/audit-report-viewer";
 import { DownloadFileButton } from "@/components/download-file-button";
-import type { PolicyAuditRecord } from "@shared/contracts/policy-audit";
+import type { PolicyAuditPage } from "@shared/contracts/policy-audit";
 import { apiHeadersServer, getServerAuthToken } from "@/lib/api-server";
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL ?? "http://localhost:8000";
 
-async function loadAudits(): Promise<PolicyAuditRecord[]> {
+const EMPTY_PAGE: PolicyAuditPage = { items: [], next_cursor: null };
+
+async function loadAudits(cursor?: string): Promise<PolicyAuditPage> {
+  const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
   try {
-    const response = await fetch(`${API_URL}/policy/audits`, {
+    const response = await fetch(`${API_URL}/policy/audits${query}`, {
       cache: "no-store",
       headers: await apiHeadersServer(),
     });
     if (!response.ok) {
-      return [];
+      return EMPTY_PAGE;
     }
-    return (await response.json()) as PolicyAuditRecord[];
+    return (await response.json()) as PolicyAuditPage;
   } catch {
-    return [];
+    return EMPTY_PAGE;
   }
 }
 
@@ -37,9 +40,15 @@ function ratingColor(rating: string): string {
   return "bg-rose-100 text-rose-700";
 }
 
-export default async function AuditsPage() {
+export default async function AuditsPage({
+  searchParams,
+}: {
+  searchParams: Promise<{ cursor?: string }>;
+}) {
+  const { cursor } = await searchParams;
   const hasAuth = Boolean(await getServerAuthToken());
-  const audits = await loadAudits();
+  const page = await loadAudits(cursor);
+  const audits = page.items;
 
   return (
     <div className="min-h-screen theme-page">
@@ -119,6 +128,22 @@ export default async function AuditsPage() {
               </Card>
             ))
           )}
+          {cursor || page.next_cursor ? (
+            <div className="flex flex-wrap gap-3">
+              {cursor ? (
+                <Button asChild variant="ghost">
+                  <Link href="/audits">Newest audits</Link>
+                </Button>
+              ) : null}
+              {page.next_cursor ? (
+                <Button asChild variant="secondary">
+                  <Link href={`/audits?cursor=${encodeURIComponent(page.next_cursor)}`}>
+                    Older audits
+                  </Link>
+                </Button>
+              ) : null}
+            </div>
+          ) : null}
         </section>
       </div>
     </div>
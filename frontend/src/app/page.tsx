@@ -7,7 +7,7 @@ import { AlertsHeaderActions } from "@/components/alerts-header-actions";
 import { HeaderActions } from "@/components/header-actions";
 import { PolicyAuditPanel } from "@/components/policy-audit-panel";
 import { DownloadFileButton } from "@/components/download-file-button";
-import type { AuditLogRead } from "@shared/contracts/audit";
+import type { AuditLogPage, AuditLogRead } from "@shared/contracts/audit";
 import type { UsageSummary } from "@shared/contracts/billing";
 import type { ComplianceDashboard } from "@shared/contracts/compliance";
 import type { PolicyAuditRecord } from "@shared/contracts/policy-audit";
@@ -40,7 +40,8 @@ async function loadAuditTrail(): Promise<AuditLogRead[]> {
     if (!response.ok) {
       return [];
     }
-    return (await response.json()) as AuditLogRead[];
+    const page = (await response.json()) as AuditLogPage;
+    return page.items;
   } catch {
     return [];
   }
@@ -154,7 +155,7 @@ export default async function Home() {
               <CardDescription>Updated 2 hours ago after last scan.</CardDescription>
             </CardHeader>
             <CardContent>
-              {dashboard ? (
+              {dashboard?.score ? (
                 <>
                   <div className="flex items-center justify-between gap-6">
                     <div>
@@ -4,9 +4,7 @@ import * as React from "react";
 import { useRouter } from "next/navigation";
 
 import { Button } from "@/components/ui/button";
-import { apiHeaders } from "@/lib/api";
-
-const API_URL = process.env.NEXT_PUBLIC_API_URL ?? "http://localhost:8000";
+import { runScraperJob, scraperJobMessage } from "@/lib/scraper";
 
 export function AlertsHeaderActions() {
   const router = useRouter();
@@ -17,16 +15,8 @@ export function AlertsHeaderActions() {
     setLoading(true);
     setMessage(null);
     try {
-      const response = await fetch(`${API_URL}/scraper/run`, {
-        method: "POST",
-        headers: { "Content-Type": "application/json", ...apiHeaders() },
-        body: "{}",
-      });
-      if (!response.ok) {
-        throw new Error("Scraper failed");
-      }
-      const data = (await response.json()) as { alerts_created: number };
-      setMessage(`Scraper finished: ${data.alerts_created} new alerts`);
+      const job = await runScraperJob();
+      setMessage(scraperJobMessage(job));
       setTimeout(() => router.refresh(), 800);
     } catch (error) {
       setMessage(error instanceof Error ? error.message : "Scraper failed");
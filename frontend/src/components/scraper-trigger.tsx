@@ -3,9 +3,7 @@
 import * as React from "react";
 
 import { Button } from "@/components/ui/button";
-import { apiHeaders } from "@/lib/api";
-
-const API_URL = process.env.NEXT_PUBLIC_API_URL ?? "http://localhost:8000";
+import { runScraperJob, scraperJobMessage } from "@/lib/scraper";
 
 export function ScraperTrigger() {
   const [message, setMessage] = React.useState<string | null>(null);
@@ -15,16 +13,8 @@ export function ScraperTrigger() {
     setLoading(true);
     setMessage(null);
     try {
-      const response = await fetch(`${API_URL}/scraper/run`, {
-        method: "POST",
-        headers: { "Content-Type": "application/json", ...apiHeaders() },
-        body: "{}",
-      });
-      if (!response.ok) {
-        throw new Error("Scraper failed");
-      }
-      const data = (await response.json()) as { alerts_created: number };
-      setMessage(`Scraper finished: ${data.alerts_created} new alerts`);
+      const job = await runScraperJob();
+      setMessage(scraperJobMessage(job));
     } catch (error) {
       setMessage(error instanceof Error ? error.message : "Scraper failed");
     } finally {
@@ -0,0 +1,42 @@
+import type { ScraperJobResponse } from "@shared/contracts/scraper";
+
+import { apiHeaders } from "@/lib/api";
+
+const API_URL = process.env.NEXT_PUBLIC_API_URL ?? "http://localhost:8000";
+const POLL_INTERVAL_MS = 1500;
+const POLL_ATTEMPTS = 120;
+
+// Queues a scraper run and waits for the worker to finish it.
+export async function runScraperJob(): Promise<ScraperJobResponse> {
+  const response = await fetch(`${API_URL}/scraper/run`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json", ...apiHeaders() },
+    body: "{}",
+  });
+  if (!response.ok) {
+    throw new Error("Scraper failed");
+  }
+  let job = (await response.json()) as ScraperJobResponse;
+  for (let attempt = 0; attempt < POLL_ATTEMPTS; attempt += 1) {
+    if (job.status === "done" || job.status === "failed") {
+      return job;
+    }
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+    const poll = await fetch(`${API_URL}/scraper/jobs/${job.id}`, { headers: apiHeaders() });
+    if (!poll.ok) {
+      throw new Error("Scraper failed");
+    }
+    job = (await poll.json()) as ScraperJobResponse;
+  }
+  return job;
+}
+
+export function scraperJobMessage(job: ScraperJobResponse): string {
+  if (job.status === "done") {
+    return `Scraper finished: ${job.alerts_created} new alerts`;
+  }
+  if (job.status === "failed") {
+    return job.error ? `Scraper failed: ${job.error}` : "Scraper failed";
+  }
+  return "Scraper queued; results will appear once the worker picks it up";
+}
@@ -20,6 +20,16 @@ MIGRATIONS=(
   "/migrations/009_add_classification.sql"
   "/migrations/010_create_users.sql"
   "/migrations/011_add_industry.sql"
+  "/migrations/012_create_classification_cache.sql"
+  "/migrations/013_create_scraper_source.sql"
+  "/migrations/014_regulatory_alert_unique_source.sql"
+  "/migrations/015_scraper_source_schedule.sql"
+  "/migrations/016_create_scraper_job.sql"
+  "/migrations/017_org_created_at_indexes.sql"
+  "/migrations/018_create_policy_audit_item.sql"
+  "/migrations/019_create_org_summary.sql"
+  "/migrations/020_create_compliance_score_daily.sql"
+  "/migrations/021_create_usage_daily.sql"
 )
 
 for migration in "${MIGRATIONS[@]}"; do
@@ -38,6 +48,10 @@ echo "Starting backend on http://localhost:8000"
 uvicorn app.main:app --reload &
 BACKEND_PID=$!
 
+echo "Starting scraper worker"
+python -m app.workers.scraper &
+WORKER_PID=$!
+
 echo "Starting frontend on http://localhost:3000"
 cd "$ROOT_DIR/frontend"
 if [ ! -d "node_modules" ]; then
@@ -45,4 +59,4 @@ if [ ! -d "node_modules" ]; then
 fi
 npm run dev
 
-kill "$BACKEND_PID"
+kill "$BACKEND_PID" "$WORKER_PID"
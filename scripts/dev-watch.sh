@@ -23,6 +23,16 @@ MIGRATIONS=(
   "/migrations/009_add_classification.sql"
   "/migrations/010_create_users.sql"
   "/migrations/011_add_industry.sql"
+  "/migrations/012_create_classification_cache.sql"
+  "/migrations/013_create_scraper_source.sql"
+  "/migrations/014_regulatory_alert_unique_source.sql"
+  "/migrations/015_scraper_source_schedule.sql"
+  "/migrations/016_create_scraper_job.sql"
+  "/migrations/017_org_created_at_indexes.sql"
+  "/migrations/018_create_policy_audit_item.sql"
+  "/migrations/019_create_org_summary.sql"
+  "/migrations/020_create_compliance_score_daily.sql"
+  "/migrations/021_create_usage_daily.sql"
 )
 
 for migration in "${MIGRATIONS[@]}"; do
@@ -32,16 +42,19 @@ done
 cleanup() {
   echo "\nShutting down dev services..."
   [[ -n "${BACKEND_PID:-}" ]] && kill "$BACKEND_PID" 2>/dev/null || true
+  [[ -n "${WORKER_PID:-}" ]] && kill "$WORKER_PID" 2>/dev/null || true
   [[ -n "${FRONTEND_PID:-}" ]] && kill "$FRONTEND_PID" 2>/dev/null || true
   [[ -n "${DB_LOG_PID:-}" ]] && kill "$DB_LOG_PID" 2>/dev/null || true
 }
 trap cleanup EXIT INT TERM
 
 BACKEND_LOG="$LOG_DIR/backend.log"
+WORKER_LOG="$LOG_DIR/worker.log"
 FRONTEND_LOG="$LOG_DIR/frontend.log"
 DB_LOG="$LOG_DIR/db.log"
 
 : > "$BACKEND_LOG"
+: > "$WORKER_LOG"
 : > "$FRONTEND_LOG"
 : > "$DB_LOG"
 
@@ -56,6 +69,10 @@ echo "Starting backend on http://localhost:8000"
 uvicorn app.main:app --reload >"$BACKEND_LOG" 2>&1 &
 BACKEND_PID=$!
 
+echo "Starting scraper worker"
+python -m app.workers.scraper >"$WORKER_LOG" 2>&1 &
+WORKER_PID=$!
+
 deactivate
 
 cd "$ROOT_DIR/frontend"
@@ -74,4 +91,4 @@ DB_LOG_PID=$!
 sleep 1
 
 echo "\nLogs are streaming. Press Ctrl+C to stop."
-exec tail -n 200 -f "$BACKEND_LOG" "$FRONTEND_LOG" "$DB_LOG"
+exec tail -n 200 -f "$BACKEND_LOG" "$WORKER_LOG" "$FRONTEND_LOG" "$DB_LOG"
@@ -17,3 +17,7 @@ export type OrgResetResponse = {
   checklists_cleared: number;
   checklist_seeded: number;
 };
+
+export type StorageGcResponse = {
+  files_removed: number;
+};
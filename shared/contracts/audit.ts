@@ -11,3 +11,8 @@ export type AuditLogRead = AuditLogCreate & {
   id: number;
   created_at: string;
 };
+
+export type AuditLogPage = {
+  items: AuditLogRead[];
+  next_cursor?: string | null;
+};
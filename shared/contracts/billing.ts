@@ -1,4 +1,6 @@
 export type UsageSummary = {
   total_cost: number;
   total_scans: number;
+  start?: string | null;
+  end?: string | null;
 };
@@ -12,7 +12,26 @@ export type RegulatoryAlert = {
   published_at: string;
 };
 
+export type RegulatoryAlertPage = {
+  items: RegulatoryAlert[];
+  next_cursor?: string | null;
+};
+
 export type ComplianceDashboard = {
-  score: ComplianceScore;
+  score: ComplianceScore | null;
   active_alerts: RegulatoryAlert[];
 };
+
+export type ScoreHistoryPoint = {
+  bucket_start: string;
+  min: number;
+  avg: number;
+  max: number;
+  count: number;
+};
+
+export type ScoreHistory = {
+  bucket: "day" | "week" | "month";
+  since: string;
+  points: ScoreHistoryPoint[];
+};
@@ -20,3 +20,44 @@ export type PolicyAuditRecord = PolicyAuditBase & {
   filename: string;
   created_at: string;
 };
+
+export type PolicyAuditPage = {
+  items: PolicyAuditRecord[];
+  next_cursor?: string | null;
+};
+
+export type PolicyAuditText = {
+  audit_id: number;
+  pages: string[];
+  chunks: string[];
+};
+
+export type GapFrequency = {
+  checklist_item_id?: number | null;
+  checklist_item: string;
+  gaps: number;
+  matches: number;
+  gap_rate: number;
+  avg_distance?: number | null;
+};
+
+export type GapSeverityCount = {
+  severity: string;
+  gaps: number;
+};
+
+export type GapTrendPoint = {
+  bucket_start: string;
+  audits: number;
+  gaps: number;
+};
+
+export type GapAnalytics = {
+  since: string;
+  bucket: "day" | "week" | "month";
+  audits: number;
+  gaps: number;
+  items: GapFrequency[];
+  severity: GapSeverityCount[];
+  trend: GapTrendPoint[];
+};
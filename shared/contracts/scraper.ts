@@ -2,12 +2,30 @@ export type ScraperRunRequest = {
   urls?: string[];
 };
 
-export type ScraperRunResponse = {
+export type ScraperJobStatus = "queued" | "running" | "done" | "failed";
+
+export type ScraperJobResponse = {
+  id: number;
+  status: ScraperJobStatus;
+  requested_at: string;
+  started_at?: string | null;
+  finished_at?: string | null;
+  error?: string | null;
   scanned: number;
   alerts_created: number;
   notes: string[];
 };
 
+export type ScraperSourceStatus = {
+  url: string;
+  interval_seconds: number;
+  next_run_at?: string | null;
+  checked_at?: string | null;
+  changed_at?: string | null;
+  consecutive_errors: number;
+  last_error?: string | null;
+};
+
 export type ScraperStatus = {
   enabled: boolean;
   last_run_at?: string | null;
@@ -16,4 +34,5 @@ export type ScraperStatus = {
   scanned: number;
   alerts_created: number;
   notes: string[];
+  sources: ScraperSourceStatus[];
 };